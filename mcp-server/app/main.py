@@ -69,6 +69,7 @@ async def list_tools():
             {"name": "query_gtex", "description": "GTEx tissue expression data", "status": "active"},
             {"name": "query_biogrid", "description": "BioGRID protein-protein interactions", "status": "active"},
             {"name": "query_kea3", "description": "KEA3 kinase enrichment analysis", "status": "active"},
+            {"name": "batch_execute", "description": "Run one tool over many inputs in a single request", "status": "active"},
         ]
     }
 
@@ -336,6 +337,69 @@ async def tool_kea3_enrich(req: KEA3Request):
     )
 
 
+# ---------------------------------------------------------------------------
+# Batch Execute — one request, many tool invocations
+# ---------------------------------------------------------------------------
+
+BATCH_TOOLS = {
+    "query_uniprot": query_uniprot,
+    "query_kegg": query_kegg,
+    "query_stringdb": query_stringdb,
+    "query_interpro": query_interpro,
+    "search_ptm_pubmed": search_ptm_pubmed,
+    "query_iptmnet": query_iptmnet,
+    "fetch_fulltext": fetch_fulltext_by_pmid,
+    "query_hpa": query_hpa,
+    "query_gtex": query_gtex,
+    "query_biogrid": query_biogrid,
+}
+
+
+class BatchExecuteRequest(BaseModel):
+    tool: str
+    inputs: list[dict]
+    max_concurrent: int = 8
+    timeout_ms: int = 30_000
+    stop_on_error: bool = False
+
+
+@app.post("/tools/batch_execute")
+async def tool_batch_execute(req: BatchExecuteRequest):
+    """Run ``tool`` once per input with bounded concurrency.
+
+    Results are returned in input order; failed or timed-out inputs yield
+    ``None`` in ``results`` and an entry in ``errors``.
+    """
+    import asyncio
+    from fastapi import HTTPException
+
+    fn = BATCH_TOOLS.get(req.tool)
+    if fn is None:
+        raise HTTPException(status_code=400, detail=f"Unknown tool '{req.tool}'")
+
+    sem = asyncio.Semaphore(max(1, req.max_concurrent))
+    timeout = req.timeout_ms / 1000
+    results: list = [None] * len(req.inputs)
+    errors: list[dict] = []
+
+    async def _run(i, params):
+        async with sem:
+            try:
+                results[i] = await asyncio.wait_for(fn(**params, redis=app.state.redis), timeout)
+            except Exception as e:
+                errors.append({"index": i, "error": f"{type(e).__name__}: {e}"})
+                if req.stop_on_error:
+                    raise
+
+    tasks = [asyncio.create_task(_run(i, p)) for i, p in enumerate(req.inputs)]
+    try:
+        await asyncio.gather(*tasks)
+    except Exception:
+        for t in tasks:
+            t.cancel()
+    return {"tool": req.tool, "results": results, "errors": errors}
+
+
 # ===========================================================================
 # Article Cache Management Endpoints
 # ===========================================================================
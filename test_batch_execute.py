@@ -0,0 +1,143 @@
+"""
+Test script to verify batch tool execution:
+1. MCP server /tools/batch_execute: input ordering, per-input errors,
+   per-input timeouts and stop_on_error
+2. MCPClient.batch_execute fallback against a server without the batch
+   endpoint: concurrent per-input calls, results in input order, and the
+   missing endpoint is not retried
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, "workers"))
+sys.path.insert(0, os.path.join(ROOT, "mcp-server"))
+
+from common.mcp_client import MCPClient
+
+# ============================================================
+# Test 1: /tools/batch_execute endpoint
+# ============================================================
+print("=" * 60)
+print("Test 1: MCP server /tools/batch_execute")
+print("=" * 60)
+
+try:
+    from fastapi.testclient import TestClient
+    from app import main as mcp_main
+except ImportError as e:
+    print(f"  [SKIP] MCP server dependencies not installed: {e}")
+else:
+    async def fake_tool(i: int, delay: float = 0.0, fail: bool = False, redis=None):
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError(f"input {i} failed")
+        return {"i": i}
+
+    mcp_main.BATCH_TOOLS["fake_tool"] = fake_tool
+    mcp_main.app.state.redis = None
+    client = TestClient(mcp_main.app)
+
+    def run_batch(inputs, **options):
+        r = client.post("/tools/batch_execute", json={"tool": "fake_tool", "inputs": inputs, **options})
+        assert r.status_code == 200, r.text
+        return r.json()
+
+    # Later inputs finish first; results still follow input order
+    data = run_batch([{"i": i, "delay": (5 - i) * 0.02} for i in range(5)], max_concurrent=5)
+    assert data["results"] == [{"i": i} for i in range(5)], data
+    assert data["errors"] == [], data
+    print("  [PASS] Results in input order")
+
+    data = run_batch([{"i": 0}, {"i": 1, "fail": True}, {"i": 2}])
+    assert data["results"] == [{"i": 0}, None, {"i": 2}], data
+    assert [e["index"] for e in data["errors"]] == [1] and "ValueError" in data["errors"][0]["error"], data
+    print("  [PASS] Failed input yields None and an error entry")
+
+    data = run_batch([{"i": 0}, {"i": 1, "delay": 1.0}], timeout_ms=50)
+    assert data["results"] == [{"i": 0}, None], data
+    assert [e["index"] for e in data["errors"]] == [1] and "Timeout" in data["errors"][0]["error"], data
+    print("  [PASS] Timed-out input yields None and an error entry")
+
+    data = run_batch(
+        [{"i": 0, "fail": True}, {"i": 1, "delay": 0.2}, {"i": 2, "delay": 0.2}],
+        max_concurrent=1, stop_on_error=True,
+    )
+    assert data["results"] == [None, None, None], data
+    assert [e["index"] for e in data["errors"]] == [0], data
+    print("  [PASS] stop_on_error cancels the remaining inputs")
+
+    r = client.post("/tools/batch_execute", json={"tool": "no_such_tool", "inputs": []})
+    assert r.status_code == 400, r.status_code
+    print("  [PASS] Unknown tool is rejected with 400")
+
+# ============================================================
+# Test 2: MCPClient.batch_execute fallback
+# ============================================================
+print("\n" + "=" * 60)
+print("Test 2: MCPClient.batch_execute fallback")
+print("=" * 60)
+
+
+class OldMCPServer(BaseHTTPRequestHandler):
+    """MCP server without /tools/batch_execute; InterPro answers slowly."""
+
+    batch_posts = 0
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with OldMCPServer.lock:
+            OldMCPServer.batch_posts += 1
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        with OldMCPServer.lock:
+            OldMCPServer.in_flight += 1
+            OldMCPServer.peak = max(OldMCPServer.peak, OldMCPServer.in_flight)
+        time.sleep(0.05)
+        with OldMCPServer.lock:
+            OldMCPServer.in_flight -= 1
+        protein_id = self.path.rsplit("/", 1)[-1]
+        body = json.dumps({"protein_id": protein_id, "domains": [{"name": f"{protein_id}-kinase"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), OldMCPServer)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+mcp = MCPClient(base_url=f"http://127.0.0.1:{server.server_port}", timeout=10, cache_dir=None)
+
+proteins = [f"P{i:05d}" for i in range(16)]
+results = mcp.batch_execute("query_interpro", [{"protein_id": p} for p in proteins], max_concurrent=8)
+assert [r["protein_id"] for r in results] == proteins, results
+print("  [PASS] Fallback results in input order")
+
+assert OldMCPServer.peak > 1, OldMCPServer.peak
+print(f"  [PASS] Fallback calls run concurrently (peak {OldMCPServer.peak} in flight)")
+
+mcp.batch_execute("query_interpro", [{"protein_id": p} for p in proteins[:4]])
+assert OldMCPServer.batch_posts == 1, OldMCPServer.batch_posts
+print("  [PASS] Missing batch endpoint is not retried")
+
+server.shutdown()
+
+print("\n" + "=" * 60)
+print("ALL TESTS COMPLETED")
+print("=" * 60)
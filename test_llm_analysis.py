@@ -0,0 +1,226 @@
+"""
+Test script to verify the RAG pipeline's LLM analysis steps:
+1. Abstract, kinase and functional-impact analyzers are called with their real
+   signatures (a fake LLM answers through the actual analyzer classes)
+2. Results are plain dicts, both fresh and from the LLM result cache
+3. Failed LLM calls yield {} and are not cached
+4. LLMClient(max_concurrent=N) caps requests in flight
+5. The report renders the analyzers' output
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "workers"))
+
+import orjson
+
+from common.disk_cache import open_cache
+from common.llm_client import LLMClient
+from rag_enrichment.core import ComprehensiveReportGenerator
+from rag_enrichment.core.abstract_analyzer import AbstractAnalyzer
+from rag_enrichment.core.enrichment_pipeline import RAGEnrichmentPipeline
+from rag_enrichment.core.llm_functional_impact import LLMFunctionalImpact
+from rag_enrichment.core.llm_kinase_predictor import LLMKinasePredictor
+
+ABSTRACT_REPLY = {
+    "signalingNetwork": {"upstreamRegulators": [{"name": "MAP2K1", "type": "kinase"}]},
+    "biologicalContext": {"diseaseRelevance": [
+        {"disease": "melanoma", "role": "driver", "therapeuticImplication": "MEK inhibition"},
+    ]},
+    "relevanceAssessment": {"relevanceScore": 80},
+    "keyFindings": ["MAP2K1 phosphorylates MAPK1 T185"],
+}
+KINASE_REPLY = {
+    "predictedKinases": [{"kinase": "MAP2K1", "confidence": "high", "score": 0.9,
+                          "mechanism": "Dual-specificity MEK phosphorylation", "evidenceSources": ["PMID:101"]}],
+    "signalingContext": "Growth factor RAS-RAF-MEK cascade",
+    "predictionRationale": "Canonical MEK site",
+}
+IMPACT_REPLY = {
+    "activityImpact": {"affected": True, "direction": "activation", "mechanism": "activation-loop phosphorylation"},
+    "signalingInterpretation": "T185 phosphorylation switches on ERK2 signaling",
+    "pathwayEffects": [{"pathway": "MAPK signaling", "effect": "activation", "biologicalOutcome": "proliferation"}],
+    "therapeuticImplications": [{"target": "MEK1/2", "approach": "trametinib", "rationale": "blocks T185 phosphorylation"}],
+    "overallConfidence": "high",
+    "keyFindings": ["T185 phosphorylation activates ERK2"],
+}
+
+
+class FakeLLM:
+    """Answers by system prompt, like a model following the analyzers' instructions."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+        with self._lock:
+            self.calls.append(system_prompt)
+        if self.fail:
+            return "[LLM Error: 503 - overloaded]"
+        if "kinase-substrate" in system_prompt:
+            return orjson.dumps(KINASE_REPLY).decode()
+        if "functional biology" in system_prompt:
+            return "```json\n" + orjson.dumps(IMPACT_REPLY).decode() + "\n```"
+        return orjson.dumps(ABSTRACT_REPLY).decode()
+
+
+class FakeMCP:
+    def search_pubmed(self, **kwargs):
+        return {"total_found": 3, "articles": [
+            {"pmid": "101", "title": "ERK2 activation", "abstract": "MEK1 phosphorylates ERK2 at T185 and Y187, " * 3},
+            {"pmid": "102", "title": "ERK2 review", "abstract": "ERK signaling controls proliferation in many cell types. " * 2},
+            {"pmid": "103", "title": "No abstract", "abstract": ""},
+        ]}
+
+
+def make_pipeline(llm, cache_dir):
+    pipeline = RAGEnrichmentPipeline(
+        FakeMCP(), enable_llm_analysis=False, enable_fulltext=False, enable_ptm_validation=False,
+    )
+    pipeline.enable_llm = True
+    pipeline._llm_id = "fake/model"
+    pipeline._llm_cache = open_cache(cache_dir)
+    pipeline.abstract_analyzer = AbstractAnalyzer(llm_client=llm)
+    pipeline.kinase_predictor = LLMKinasePredictor(llm_client=llm)
+    pipeline.functional_impact = LLMFunctionalImpact(llm_client=llm)
+    return pipeline
+
+
+def enrich(pipeline):
+    ptm = {"gene": "MAPK1", "position": "T185", "ptm_type": "Phosphorylation",
+           "ptm_relative_log2fc": 2.5, "protein_log2fc": 0.1}
+    return pipeline._enrich_single_ptm(ptm, ["proliferation"], {"cell_type": "HeLa"})["rag_enrichment"]
+
+
+cache_dir = tempfile.mkdtemp(prefix="ptm_llm_cache_")
+
+# ============================================================
+# Test 1: analyzers run through their real signatures
+# ============================================================
+print("=" * 60)
+print("Test 1: LLM analyses with a fake LLM")
+print("=" * 60)
+
+llm = FakeLLM()
+enr = enrich(make_pipeline(llm, cache_dir))
+
+analyses = enr["abstract_analysis"]["analyses"]
+assert [a["pmid"] for a in analyses] == ["101", "102"], analyses
+assert analyses[0]["relevance_score"] == 80
+assert analyses[0]["upstream_regulators"][0]["name"] == "MAP2K1"
+print(f"  [PASS] {len(analyses)} abstracts analyzed (article without abstract skipped)")
+
+kp = enr["kinase_prediction"]
+assert isinstance(kp, dict) and kp["predicted_kinases"][0]["kinase"] == "MAP2K1", kp
+print("  [PASS] Kinase prediction returned as dict")
+
+fi = enr["functional_impact"]
+assert isinstance(fi, dict) and fi["activity_impact"]["direction"] == "activation", fi
+print("  [PASS] Functional impact returned as dict")
+
+assert len(llm.calls) == 4, llm.calls
+print("  [PASS] 4 LLM calls (2 abstracts + kinase + functional impact)")
+
+# ============================================================
+# Test 2: a second run is served from the LLM result cache
+# ============================================================
+print("\n" + "=" * 60)
+print("Test 2: LLM result cache")
+print("=" * 60)
+
+llm2 = FakeLLM()
+enr2 = enrich(make_pipeline(llm2, cache_dir))
+assert llm2.calls == [], llm2.calls
+for key in ("abstract_analysis", "kinase_prediction", "functional_impact"):
+    assert enr2[key] == enr[key], key
+print("  [PASS] No LLM calls; cached results equal fresh results")
+
+# ============================================================
+# Test 3: failed LLM calls are empty and not cached
+# ============================================================
+print("\n" + "=" * 60)
+print("Test 3: failed LLM calls")
+print("=" * 60)
+
+fresh_dir = tempfile.mkdtemp(prefix="ptm_llm_cache_")
+failing = FakeLLM(fail=True)
+enr3 = enrich(make_pipeline(failing, fresh_dir))
+for key in ("abstract_analysis", "kinase_prediction", "functional_impact"):
+    assert enr3[key] == {}, (key, enr3[key])
+print("  [PASS] Failed analyses are {}")
+
+retry = FakeLLM()
+enrich(make_pipeline(retry, fresh_dir))
+assert len(retry.calls) == 4, retry.calls
+print("  [PASS] Failed analyses were not cached")
+
+# ============================================================
+# Test 4: LLMClient(max_concurrent=N) caps requests in flight
+# ============================================================
+print("\n" + "=" * 60)
+print("Test 4: LLMClient concurrency cap")
+print("=" * 60)
+
+client = LLMClient(provider="ollama", max_concurrent=2)
+in_flight = peak = 0
+lock = threading.Lock()
+
+
+def fake_ollama(prompt, system_prompt, temp, max_tokens):
+    global in_flight, peak
+    with lock:
+        in_flight += 1
+        peak = max(peak, in_flight)
+    time.sleep(0.05)
+    with lock:
+        in_flight -= 1
+    return "{}"
+
+
+client._generate_ollama = fake_ollama
+threads = [threading.Thread(target=client.generate, args=("p",)) for _ in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+assert peak == 2, peak
+print(f"  [PASS] Peak in-flight requests: {peak}")
+
+# ============================================================
+# Test 5: the report renders the analyzers' output
+# ============================================================
+print("\n" + "=" * 60)
+print("Test 5: report from LLM analysis output")
+print("=" * 60)
+
+report_ptm = {"gene": "MAPK1", "position": "T185", "ptm_type": "Phosphorylation",
+              "ptm_relative_log2fc": 2.5, "protein_log2fc": 0.1, "rag_enrichment": enr}
+report = ComprehensiveReportGenerator({"cell_type": "HeLa"}).generate_full_report([report_ptm])
+expected = [
+    "MAP2K1 phosphorylates MAPK1 T185 (PMID: 101)",                 # abstract key findings
+    "melanoma: driver (PMID: 101)",                                 # abstract disease relevance
+    "MEK inhibition (PMID: 101)",                                   # abstract therapeutic implication
+    "**MAP2K1** (confidence: high, score: 0.9)",                    # kinase prediction
+    "Mechanism: Dual-specificity MEK phosphorylation",
+    "**Signaling Context**: Growth factor RAS-RAF-MEK cascade",
+    "**Reasoning**: Canonical MEK site",
+    "**Signaling Interpretation**: T185 phosphorylation switches on ERK2 signaling",  # functional impact
+    "**Activity**: activation — activation-loop phosphorylation",
+    "- MAPK signaling: activation — proliferation",
+    "- **MEK1/2**: trametinib",
+    "**Analysis Confidence**: high",
+]
+for text in expected:
+    assert text in report, text
+assert "**?**" not in report
+print(f"  [PASS] {len(expected)} LLM-derived lines rendered")
+
+print("\n" + "=" * 60)
+print("ALL TESTS COMPLETED")
+print("=" * 60)
@@ -0,0 +1,81 @@
+"""
+Test script to verify the TSV helpers in common/tsv_io.py:
+1. write_tsv output is byte-identical to DataFrame.to_csv(sep="\\t", index=False)
+2. read_tsv reads it back to the same frame
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "workers"))
+
+import numpy as np
+import pandas as pd
+
+from common.tsv_io import read_tsv, write_tsv
+
+rng = np.random.default_rng(0)
+n = 2000
+floats = rng.normal(0, 3, n) * 10.0 ** rng.integers(-12, 12, n)
+floats[::7] = np.round(floats[::7])           # whole numbers ("3.0", not "3")
+floats[::11] = np.nan
+floats[:6] = [3.0, 1e-07, 0.1, 1e16, -0.0, 2.5e-300]
+
+df = pd.DataFrame({
+    "Protein.Group": [f"P{i:05d}" for i in range(n)],
+    "Log2FC": floats,
+    "PValue": np.abs(floats) * 1e-30,
+    "Intensity": rng.lognormal(10, 2, n).astype(np.float32),
+    "Count": rng.integers(0, 100, n),
+    "Has_PTM": rng.random(n) > 0.5,
+    "Gene.Name": [None if i % 13 == 0 else f"GENE{i}" for i in range(n)],
+    "Mixed": [1.5 if i % 2 else 2.0 for i in range(n)],  # object column of Python floats
+})
+df["Mixed"] = df["Mixed"].astype(object)
+
+tmp = tempfile.mkdtemp(prefix="ptm_tsv_")
+
+# ============================================================
+# Test 1: write_tsv matches to_csv byte for byte
+# ============================================================
+print("=" * 60)
+print("Test 1: write_tsv vs DataFrame.to_csv")
+print("=" * 60)
+
+for name, frame in [("numeric + text", df.drop(columns=["Mixed"])), ("object floats", df)]:
+    expected_path = os.path.join(tmp, "expected.tsv")
+    actual_path = os.path.join(tmp, "actual.tsv")
+    frame.to_csv(expected_path, sep="\t", index=False)
+    write_tsv(frame, actual_path)
+    with open(expected_path, "rb") as f:
+        expected = f.read()
+    with open(actual_path, "rb") as f:
+        actual = f.read()
+    if actual != expected:
+        for line_no, (a, e) in enumerate(zip(actual.splitlines(), expected.splitlines())):
+            if a != e:
+                print(f"  first difference at line {line_no}:\n    got      {a!r}\n    expected {e!r}")
+                break
+    assert actual == expected, name
+    print(f"  [PASS] {name}: identical output")
+
+# ============================================================
+# Test 2: round trip through read_tsv
+# ============================================================
+print("\n" + "=" * 60)
+print("Test 2: read_tsv round trip")
+print("=" * 60)
+
+path = os.path.join(tmp, "roundtrip.tsv")
+frame = df.drop(columns=["Mixed"])
+write_tsv(frame, path)
+back = read_tsv(path)
+expected = pd.read_csv(os.path.join(tmp, "expected.tsv"), sep="\t", low_memory=False).drop(columns=["Mixed"])
+pd.testing.assert_frame_equal(back, expected, check_dtype=False)
+assert np.array_equal(back["Log2FC"].to_numpy(), frame["Log2FC"].to_numpy(), equal_nan=True)
+print("  [PASS] Values read back unchanged (float64 exact)")
+
+print("\n" + "=" * 60)
+print("ALL TESTS COMPLETED")
+print("=" * 60)
@@ -18,6 +18,9 @@ app.conf.update(
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
+    # Stage tasks run for minutes to hours: reserve one task per process and
+    # ack only after it finishes, so queued orders go to idle workers and a
+    # killed worker's task is redelivered.
     task_acks_late=True,
     worker_prefetch_multiplier=1,
     result_expires=86400,
@@ -0,0 +1,44 @@
+"""
+Disk-backed key/value caches for worker pipelines.
+
+Thin layer over ``diskcache`` (SQLite) that serializes keys and values with
+orjson instead of pickle or the stdlib ``json`` module: compact, fast, and
+stable across Python versions.
+"""
+
+from pathlib import Path
+from typing import Union
+
+import diskcache
+import orjson
+from diskcache.core import UNKNOWN
+
+
+class OrjsonDisk(diskcache.Disk):
+    """diskcache Disk that stores keys and values as orjson bytes."""
+
+    def put(self, key):
+        return super().put(orjson.dumps(key))
+
+    def get(self, key, raw):
+        return orjson.loads(super().get(key, raw))
+
+    def store(self, value, read, key=UNKNOWN):
+        if not read:
+            value = orjson.dumps(value)
+        return super().store(value, read, key=key)
+
+    def fetch(self, mode, filename, value, read):
+        data = super().fetch(mode, filename, value, read)
+        return data if read else orjson.loads(data)
+
+
+def open_cache(directory: Union[str, Path], size_limit: int = 2 ** 30) -> diskcache.Cache:
+    """Open (or create) a size-bounded orjson-backed Cache; entries may carry an expiry."""
+    return diskcache.Cache(str(directory), disk=OrjsonDisk, size_limit=size_limit)
+
+
+def open_index(directory: Union[str, Path]) -> diskcache.Index:
+    """Open (or create) a persistent, non-evicting orjson-backed Index."""
+    cache = diskcache.Cache(str(directory), disk=OrjsonDisk, eviction_policy="none")
+    return diskcache.Index.fromcache(cache)
@@ -0,0 +1,40 @@
+"""
+Read helpers for the ``rag_enrichment`` block attached to each PTM by the
+RAG enrichment pipeline, shared by the enrichment report and the report
+generation nodes.
+"""
+
+from typing import List
+
+
+def recent_findings(enr: dict) -> List[dict]:
+    """
+    recent_findings with their abstract filled in. The pipeline
+    stores abstracts only in enr["articles"], of which recent_findings are
+    the first entries; older enrichment files still carry them inline.
+    """
+    articles = enr.get("articles", [])
+    findings = []
+    for i, f in enumerate(enr.get("recent_findings", [])):
+        if "abstract" not in f and i < len(articles) and articles[i].get("pmid", "") == f.get("pmid", ""):
+            abstract = articles[i].get("abstract", "")
+            f = {**f, "abstract": abstract}
+        findings.append(f)
+    return findings
+
+
+def abstract_analyses(enr: dict) -> List[dict]:
+    """
+    Per-article LLM abstract analyses, most relevant first. The pipeline
+    stores them as enr["abstract_analysis"]["analyses"]; enrichments without
+    LLM analysis have an empty abstract_analysis.
+    """
+    analyses = (enr.get("abstract_analysis") or {}).get("analyses") or []
+
+    def relevance(analysis: dict) -> float:
+        try:
+            return float(analysis.get("relevance_score") or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    return sorted(analyses, key=relevance, reverse=True)
@@ -0,0 +1,31 @@
+"""
+Page-cache prefetch for large pipeline inputs.
+
+Asks the kernel to start reading files in the background
+(``posix_fadvise(POSIX_FADV_WILLNEED)``) so their pages are already cached
+when the pandas / FASTA parsers open them. The hint returns immediately; on
+platforms without ``posix_fadvise`` it is a no-op.
+"""
+
+import logging
+import os
+from typing import Iterable
+
+logger = logging.getLogger("ptm-workers.prefetch")
+
+
+def prefetch_files(paths: Iterable[str]) -> None:
+    """Start kernel readahead for each existing file in ``paths``."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError as e:
+            logger.debug(f"Readahead hint failed for {path}: {e}")
+        finally:
+            os.close(fd)
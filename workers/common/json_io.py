@@ -0,0 +1,36 @@
+"""
+JSON I/O helpers for large pipeline documents (e.g. enriched PTM data).
+
+Encoding and decoding go through orjson, which is several times faster than
+the stdlib ``json`` module on these payloads. NaN/Infinity are written as
+null; files from older runs that contain bare NaN tokens (which orjson
+rejects) are still read through the stdlib parser.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Union
+
+import orjson
+
+logger = logging.getLogger("ptm-workers.json-io")
+
+PathLike = Union[str, Path]
+
+_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def read_json(path: PathLike) -> Any:
+    """Read a JSON file, preferring orjson."""
+    data = Path(path).read_bytes()
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"orjson could not parse {Path(path).name} ({e}); using stdlib json")
+        return json.loads(data)
+
+
+def write_json(data: Any, path: PathLike) -> None:
+    """Write ``data`` as indented UTF-8 JSON; non-JSON values fall back to str()."""
+    Path(path).write_bytes(orjson.dumps(data, default=str, option=_WRITE_OPTIONS))
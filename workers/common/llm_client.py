@@ -18,12 +18,15 @@ Environment variables:
   LLM_PROVIDER     — Force provider: "ollama", "openai", "gemini", or "auto" (default: auto)
 """
 
+import contextlib
 import json
 import logging
 import os
+import threading
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,10 @@ GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai"
 # Global provider preference
 DEFAULT_PROVIDER = os.getenv("LLM_PROVIDER", "auto")
 
+# Keep-alive connections held per LLM host, so concurrent analyses reuse
+# sockets (and TLS sessions for cloud providers) instead of reconnecting
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "16"))
+
 
 def _check_ollama_available(base_url: str, model: str) -> bool:
     """Check if Ollama is reachable and has the requested model."""
@@ -87,10 +94,19 @@ class LLMClient:
         api_key: Optional[str] = None,
         temperature: float = 0.6,
         max_tokens: int = 4096,
+        max_concurrent: Optional[int] = None,
     ):
         self.temperature = temperature
         self.max_tokens = max_tokens
         self._fallback_enabled = False
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=LLM_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Optional cap on requests in flight from all threads sharing this client
+        self._slots = (
+            threading.BoundedSemaphore(max(1, max_concurrent)) if max_concurrent else contextlib.nullcontext()
+        )
 
         # Resolve provider
         requested_provider = provider or DEFAULT_PROVIDER
@@ -165,22 +181,27 @@ class LLMClient:
         """Generate text using the configured LLM provider.
 
         If in auto mode with Ollama as primary, falls back to cloud on failure.
+
+        Keep instructions and response schemas that do not vary between calls
+        in ``system_prompt``: requests then share a leading prefix, which
+        providers with prompt caching (and Ollama's KV cache) reuse.
         """
         temp = temperature if temperature is not None else self.temperature
         tokens = max_tokens if max_tokens is not None else self.max_tokens
 
-        if self.provider == "ollama":
-            result = self._generate_ollama(prompt, system_prompt, temp, tokens)
+        with self._slots:
+            if self.provider == "ollama":
+                result = self._generate_ollama(prompt, system_prompt, temp, tokens)
 
-            # Auto-fallback to cloud if Ollama fails
-            if result.startswith("[LLM Error") and self._fallback_enabled:
-                fallback_result = self._try_cloud_fallback(prompt, system_prompt, temp, tokens)
-                if fallback_result is not None:
-                    return fallback_result
+                # Auto-fallback to cloud if Ollama fails
+                if result.startswith("[LLM Error") and self._fallback_enabled:
+                    fallback_result = self._try_cloud_fallback(prompt, system_prompt, temp, tokens)
+                    if fallback_result is not None:
+                        return fallback_result
 
-            return result
-        else:
-            return self._generate_openai_compatible(prompt, system_prompt, temp, tokens)
+                return result
+            else:
+                return self._generate_openai_compatible(prompt, system_prompt, temp, tokens)
 
     def is_available(self) -> bool:
         """Check if any LLM provider is available."""
@@ -247,7 +268,7 @@ class LLMClient:
             payload["system"] = system_prompt
 
         try:
-            r = requests.post(f"{self.base_url}/api/generate", json=payload, timeout=600)
+            r = self.session.post(f"{self.base_url}/api/generate", json=payload, timeout=600)
             if r.status_code != 200:
                 body = r.text[:500]
                 logger.error(f"Ollama returned {r.status_code} for model '{self.model}': {body}")
@@ -295,7 +316,7 @@ class LLMClient:
         }
 
         try:
-            r = requests.post(
+            r = self.session.post(
                 f"{base_url}/chat/completions",
                 json=payload, headers=headers, timeout=300,
             )
@@ -304,3 +325,6 @@ class LLMClient:
         except Exception as e:
             logger.error(f"OpenAI-compatible generation failed ({model}@{base_url}): {e}")
             return f"[LLM Error: {e}]"
+
+    def close(self):
+        self.session.close()
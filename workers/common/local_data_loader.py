@@ -17,8 +17,9 @@ import gzip
 import json
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 
@@ -115,22 +116,25 @@ class HPALocalLoader:
         if cls._tissue_df is None:
             return None
 
-        gene_upper = gene_name.upper()
-        # HPA TSV columns: Gene (Ensembl ID), Gene name (symbol), Tissue, TPM, etc.
-        # Prefer "Gene name" (symbols like FARP1) over "Gene" (Ensembl IDs like ENSG...)
-        gene_col = None
-        for col in ("Gene name", "gene_name", "Gene", "gene"):
-            if col in cls._tissue_df.columns:
-                gene_col = col
-                break
-
+        gene_col = cls._gene_column(cls._tissue_df, "tissue")
         if gene_col is None:
-            logger.warning(f"Cannot find gene column in HPA tissue data. Columns: {list(cls._tissue_df.columns)[:10]}")
             return None
 
-        mask = cls._tissue_df[gene_col].str.upper() == gene_upper
-        gene_rows = cls._tissue_df[mask]
+        mask = cls._tissue_df[gene_col].str.upper() == gene_name.upper()
+        return cls._tissue_result(gene_name, cls._tissue_df[mask])
+
+    @staticmethod
+    def _gene_column(df: pd.DataFrame, label: str) -> Optional[str]:
+        # HPA TSV columns: Gene (Ensembl ID), Gene name (symbol), Tissue, TPM, etc.
+        # Prefer "Gene name" (symbols like FARP1) over "Gene" (Ensembl IDs like ENSG...)
+        for col in ("Gene name", "gene_name", "Gene", "gene"):
+            if col in df.columns:
+                return col
+        logger.warning(f"Cannot find gene column in HPA {label} data. Columns: {list(df.columns)[:10]}")
+        return None
 
+    @staticmethod
+    def _tissue_result(gene_name: str, gene_rows: pd.DataFrame) -> Optional[dict]:
         if gene_rows.empty:
             return None
 
@@ -177,20 +181,15 @@ class HPALocalLoader:
         if cls._subcellular_df is None:
             return None
 
-        gene_upper = gene_name.upper()
-        gene_col = None
-        for col in ("Gene name", "gene_name", "Gene", "gene"):
-            if col in cls._subcellular_df.columns:
-                gene_col = col
-                break
-
+        gene_col = cls._gene_column(cls._subcellular_df, "subcellular")
         if gene_col is None:
-            logger.warning(f"Cannot find gene column in HPA subcellular data. Columns: {list(cls._subcellular_df.columns)[:10]}")
             return None
 
-        mask = cls._subcellular_df[gene_col].str.upper() == gene_upper
-        gene_rows = cls._subcellular_df[mask]
+        mask = cls._subcellular_df[gene_col].str.upper() == gene_name.upper()
+        return cls._subcellular_result(gene_name, cls._subcellular_df[mask])
 
+    @staticmethod
+    def _subcellular_result(gene_name: str, gene_rows: pd.DataFrame) -> Optional[dict]:
         if gene_rows.empty:
             return None
 
@@ -248,7 +247,48 @@ class HPALocalLoader:
 
         subcellular = cls.query_subcellular_location(gene_name) or {}
         tissue = cls.query_tissue_expression(gene_name) or {}
+        return cls._combined_result(gene_name, subcellular, tissue)
 
+    @classmethod
+    def query_many(cls, gene_names: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        query() for many genes at once: each table is upper-cased and
+        filtered once instead of once per gene. Returns {gene_name: result}.
+        """
+        gene_names = list(gene_names)
+        cls._ensure_loaded()
+        if not cls.is_available():
+            return {g: None for g in gene_names}
+
+        wanted = {g.upper() for g in gene_names}
+        subcellular_rows = cls._rows_by_gene(cls._subcellular_df, "subcellular", wanted)
+        tissue_rows = cls._rows_by_gene(cls._tissue_df, "tissue", wanted)
+
+        results = {}
+        for gene_name in gene_names:
+            gene_upper = gene_name.upper()
+            subcellular = tissue = None
+            if gene_upper in subcellular_rows:
+                subcellular = cls._subcellular_result(gene_name, subcellular_rows[gene_upper])
+            if gene_upper in tissue_rows:
+                tissue = cls._tissue_result(gene_name, tissue_rows[gene_upper])
+            results[gene_name] = cls._combined_result(gene_name, subcellular or {}, tissue or {})
+        return results
+
+    @classmethod
+    def _rows_by_gene(cls, df: Optional[pd.DataFrame], label: str, wanted: set) -> Dict[str, pd.DataFrame]:
+        """Rows of df for the wanted (upper-case) gene names, grouped by gene."""
+        if df is None:
+            return {}
+        gene_col = cls._gene_column(df, label)
+        if gene_col is None:
+            return {}
+        upper = df[gene_col].str.upper()
+        mask = upper.isin(wanted)
+        return {gene: rows for gene, rows in df[mask].groupby(upper[mask], sort=False)}
+
+    @staticmethod
+    def _combined_result(gene_name: str, subcellular: dict, tissue: dict) -> Optional[dict]:
         if not subcellular and not tissue:
             return None
 
@@ -287,6 +327,7 @@ class GTExLocalLoader:
     _gct_gene_index: Optional[Dict[str, int]] = None  # gene -> line offset
     _loaded: bool = False
     _index_built: bool = False
+    _index_lock = threading.Lock()
 
     @classmethod
     def _ensure_loaded(cls):
@@ -340,8 +381,14 @@ class GTExLocalLoader:
         """
         if cls._index_built or cls._gct_path is None:
             return
-        cls._index_built = True
+        with cls._index_lock:
+            if not cls._index_built:
+                cls._load_or_scan_gene_index()
+                cls._index_built = True
 
+    @classmethod
+    def _load_or_scan_gene_index(cls):
+        """Load the saved gene index, or scan the GCT file and save one."""
         index_path = LOCAL_DATA_DIR / ".gtex_gene_index.json"
 
         # Try to load pre-built index
@@ -397,53 +444,72 @@ class GTExLocalLoader:
         For the large GCT file, uses the gene index for efficient lookup.
         Returns dict compatible with MCP GTEx response format.
         """
+        return cls.query_many([gene_name]).get(gene_name)
+
+    @classmethod
+    def query_many(cls, gene_names: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        query_expression() for many genes in a single pass over the GCT file.
+        Returns {gene_name: result}, or {} if the file could not be read.
+        """
+        gene_names = list(gene_names)
         cls._ensure_loaded()
 
         if cls._gct_path is None:
-            return None
+            return {g: None for g in gene_names}
 
         # Build index if needed
         cls._build_gene_index()
 
         if cls._gct_gene_index is None:
-            return None
+            return {g: None for g in gene_names}
 
-        gene_upper = gene_name.upper()
-        if gene_upper not in cls._gct_gene_index:
-            return {"gene": gene_name, "expressions": [], "top_tissues": [], "source": "local_gtex", "error": None}
+        wanted = {g.upper() for g in gene_names} & cls._gct_gene_index.keys()
+        expressions_by_gene: Dict[str, Dict[str, List[float]]] = {g: {} for g in wanted}
 
-        # Read the specific line(s) for this gene
-        try:
-            expressions_by_tissue: Dict[str, List[float]] = {}
+        # Read the specific line(s) for these genes
+        if wanted:
+            try:
+                with gzip.open(cls._gct_path, "rt") as f:
+                    # Read header to get sample IDs
+                    f.readline()  # #1.2
+                    f.readline()  # dimensions
+                    header = f.readline().strip().split("\t")
+                    sample_ids = header[2:]  # Skip Name, Description
+
+                    # Read through to find gene lines
+                    for line in f:
+                        parts = line.strip().split("\t")
+                        if len(parts) < 3:
+                            continue
+                        expressions_by_tissue = expressions_by_gene.get(parts[1].upper())
+                        if expressions_by_tissue is not None:
+                            values = parts[2:]
+                            # Map sample values to tissues
+                            for sid, val in zip(sample_ids, values):
+                                tissue = (cls._tissue_map or {}).get(sid, "Unknown")
+                                try:
+                                    tpm = float(val)
+                                except (ValueError, TypeError):
+                                    continue
+                                if tissue not in expressions_by_tissue:
+                                    expressions_by_tissue[tissue] = []
+                                expressions_by_tissue[tissue].append(tpm)
+            except Exception as e:
+                target = gene_names[0] if len(gene_names) == 1 else f"{len(gene_names)} genes"
+                logger.warning(f"Failed to query GTEx local data for {target}: {e}")
+                return {}
 
-            with gzip.open(cls._gct_path, "rt") as f:
-                # Read header to get sample IDs
-                f.readline()  # #1.2
-                f.readline()  # dimensions
-                header = f.readline().strip().split("\t")
-                sample_ids = header[2:]  # Skip Name, Description
-
-                # Read through to find gene lines
-                for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) < 3:
-                        continue
-                    if parts[1].upper() == gene_upper:
-                        values = parts[2:]
-                        # Map sample values to tissues
-                        for sid, val in zip(sample_ids, values):
-                            tissue = (cls._tissue_map or {}).get(sid, "Unknown")
-                            try:
-                                tpm = float(val)
-                            except (ValueError, TypeError):
-                                continue
-                            if tissue not in expressions_by_tissue:
-                                expressions_by_tissue[tissue] = []
-                            expressions_by_tissue[tissue].append(tpm)
+        results = {}
+        for gene_name in gene_names:
+            gene_upper = gene_name.upper()
+            if gene_upper not in cls._gct_gene_index:
+                results[gene_name] = {"gene": gene_name, "expressions": [], "top_tissues": [], "source": "local_gtex", "error": None}
+                continue
 
             # Compute median TPM per tissue
             expressions = []
-            for tissue, tpms in expressions_by_tissue.items():
+            for tissue, tpms in expressions_by_gene[gene_upper].items():
                 if tpms:
                     sorted_tpms = sorted(tpms)
                     n = len(sorted_tpms)
@@ -456,17 +522,14 @@ class GTExLocalLoader:
 
             expressions.sort(key=lambda x: x["median_tpm"], reverse=True)
 
-            return {
+            results[gene_name] = {
                 "gene": gene_name,
                 "expressions": expressions,
                 "top_tissues": expressions[:5],
                 "source": "local_gtex",
                 "error": None,
             }
-
-        except Exception as e:
-            logger.warning(f"Failed to query GTEx local data for {gene_name}: {e}")
-            return None
+        return results
 
     @classmethod
     def get_tissue_summary(cls) -> Optional[dict]:
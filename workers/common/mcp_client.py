@@ -7,13 +7,33 @@ caching (Redis), rate limiting, and response normalization.
 
 import logging
 import os
-from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from common.disk_cache import open_cache
 
 logger = logging.getLogger(__name__)
 
 MCP_BASE_URL = os.getenv("MCP_SERVER_URL", "http://mcp-server:8001")
+# Keep-alive connections held per host; sized for the RAG pipeline's
+# concurrent PTMs x per-PTM lookups so sockets are reused, not reopened
+MCP_POOL_SIZE = int(os.getenv("MCP_POOL_SIZE", "64"))
+# Persistent response cache shared across runs; set MCP_CACHE_DIR="" to disable
+MCP_CACHE_DIR = os.getenv("MCP_CACHE_DIR", str(Path.home() / ".cache" / "ptm_mcp"))
+# Seconds a cached response stays valid, per tool
+MCP_CACHE_TTL = {
+    "pubmed": 86400,
+    "uniprot": 30 * 86400,
+    "kegg": 7 * 86400,
+    "stringdb": 7 * 86400,
+    "hpa": 30 * 86400,
+    "gtex": 30 * 86400,
+    "biogrid": 7 * 86400,
+}
 
 ProgressCallback = Optional[Callable[[int, int, str], None]]
 
@@ -21,11 +41,56 @@ ProgressCallback = Optional[Callable[[int, int, str], None]]
 class MCPClient:
     """Synchronous MCP Client for Celery workers."""
 
-    def __init__(self, base_url: str = None, timeout: float = 120.0):
+    def __init__(self, base_url: str = None, timeout: float = 120.0, cache_dir: Optional[str] = MCP_CACHE_DIR):
         self.base_url = (base_url or MCP_BASE_URL).rstrip("/")
         self.timeout = timeout
+        self._cache = None
+        if cache_dir:
+            try:
+                self._cache = open_cache(os.path.expanduser(cache_dir))
+            except Exception as e:
+                logger.warning(f"MCP response cache unavailable at {cache_dir}: {e}")
         self.session = requests.Session()
+        # requests already sends Accept-Encoding: gzip, deflate
         self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MCP_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Cleared when the server has no /tools/batch_execute (older MCP servers)
+        self._batch_execute_supported = True
+
+    # ------------------------------------------------------------------
+    # Persistent response cache
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, tool: str, *key) -> Optional[dict]:
+        if self._cache is None:
+            return None
+        try:
+            return self._cache.get([tool, self.base_url, *key])
+        except Exception as e:
+            logger.debug(f"MCP cache read failed for {tool} {key}: {e}")
+            return None
+
+    def _cache_set(self, tool: str, value: dict, *key) -> dict:
+        """Store a successful response and return it; error responses are not cached."""
+        if self._cache is not None and isinstance(value, dict) and not value.get("error"):
+            try:
+                self._cache.set([tool, self.base_url, *key], value, expire=MCP_CACHE_TTL[tool])
+            except Exception as e:
+                logger.debug(f"MCP cache write failed for {tool} {key}: {e}")
+        return value
+
+    def _cache_split(self, tool: str, names: List[str], *key) -> Tuple[List[dict], List[str]]:
+        """Split a batch into cached responses and the names still to fetch."""
+        cached, missing = [], []
+        for name in names:
+            hit = self._cache_get(tool, name, *key)
+            if hit is not None:
+                cached.append(hit)
+            else:
+                missing.append(name)
+        return cached, missing
 
     def health_check(self) -> bool:
         try:
@@ -82,18 +147,68 @@ class MCPClient:
             logger.warning(f"MCP call_tool({tool_name}) failed: {e}")
             return {}
 
+    def batch_execute(
+        self,
+        tool: str,
+        inputs: List[dict],
+        max_concurrent: int = 8,
+        timeout_ms: int = 30_000,
+        stop_on_error: bool = False,
+    ) -> List[Optional[dict]]:
+        """
+        Run one MCP tool over many inputs in a single request.
+
+        Returns results in input order (``None`` for inputs that failed on
+        the server). If the batch request fails, the inputs are sent as
+        concurrent per-input call_tool() requests instead; a server without
+        the batch endpoint is remembered and not asked again.
+        """
+        if not inputs:
+            return []
+        if not self._batch_execute_supported:
+            return self._call_tool_concurrent(tool, inputs, max_concurrent)
+        # Worst case: every wave of max_concurrent inputs hits the per-input timeout
+        waves = -(-len(inputs) // max(1, max_concurrent))
+        try:
+            r = self.session.post(
+                f"{self.base_url}/tools/batch_execute",
+                json={
+                    "tool": tool, "inputs": inputs, "max_concurrent": max_concurrent,
+                    "timeout_ms": timeout_ms, "stop_on_error": stop_on_error,
+                },
+                timeout=max(self.timeout, waves * timeout_ms / 1000),
+            )
+            if r.status_code == 404:
+                self._batch_execute_supported = False
+            r.raise_for_status()
+            data = r.json()
+            if data.get("errors"):
+                logger.warning(f"MCP batch_execute({tool}): {len(data['errors'])}/{len(inputs)} inputs failed")
+            return data.get("results", [])
+        except Exception as e:
+            logger.warning(f"MCP batch_execute({tool}) failed, falling back to per-input calls: {e}")
+            return self._call_tool_concurrent(tool, inputs, max_concurrent)
+
+    def _call_tool_concurrent(self, tool: str, inputs: List[dict], max_concurrent: int) -> List[dict]:
+        """call_tool() per input, max_concurrent at a time; results in input order."""
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(inputs)))) as executor:
+            return list(executor.map(lambda p: self.call_tool(tool, p), inputs))
+
     # ------------------------------------------------------------------
     # UniProt
     # ------------------------------------------------------------------
 
     def query_uniprot(self, protein_id: str) -> dict:
+        cached = self._cache_get("uniprot", protein_id)
+        if cached is not None:
+            return cached
         try:
             r = self.session.get(
                 f"{self.base_url}/tools/uniprot/{protein_id}",
                 timeout=self.timeout,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("uniprot", r.json(), protein_id)
         except Exception as e:
             logger.warning(f"MCP UniProt failed for {protein_id}: {e}")
             return {"protein_id": protein_id, "subcellular_location": [],
@@ -102,6 +217,9 @@ class MCPClient:
     def query_uniprot_batch(self, protein_ids: List[str]) -> List[dict]:
         # 90s per batch to avoid long hangs; fallback to individual queries on timeout
         batch_timeout = min(self.timeout * 2, 90)
+        results, protein_ids = self._cache_split("uniprot", protein_ids)
+        if not protein_ids:
+            return results
         try:
             r = self.session.post(
                 f"{self.base_url}/tools/uniprot/batch",
@@ -109,16 +227,21 @@ class MCPClient:
                 timeout=batch_timeout,
             )
             r.raise_for_status()
-            return r.json()["results"]
+            return results + [
+                self._cache_set("uniprot", res, res.get("protein_id", "")) for res in r.json()["results"]
+            ]
         except Exception as e:
             logger.warning(f"MCP UniProt batch failed: {e}")
-            return [self.query_uniprot(pid) for pid in protein_ids]
+            return results + [self.query_uniprot(pid) for pid in protein_ids]
 
     # ------------------------------------------------------------------
     # KEGG
     # ------------------------------------------------------------------
 
     def query_kegg(self, gene_name: str, organism: str = "mmu") -> dict:
+        cached = self._cache_get("kegg", gene_name, organism)
+        if cached is not None:
+            return cached
         try:
             r = self.session.get(
                 f"{self.base_url}/tools/kegg/{gene_name}",
@@ -126,12 +249,15 @@ class MCPClient:
                 timeout=self.timeout,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("kegg", r.json(), gene_name, organism)
         except Exception as e:
             logger.warning(f"MCP KEGG failed for {gene_name}: {e}")
             return {"gene_name": gene_name, "organism": organism, "pathways": []}
 
     def query_kegg_batch(self, gene_names: List[str], organism: str = "mmu") -> List[dict]:
+        results, gene_names = self._cache_split("kegg", gene_names, organism)
+        if not gene_names:
+            return results
         try:
             r = self.session.post(
                 f"{self.base_url}/tools/kegg/batch",
@@ -139,16 +265,21 @@ class MCPClient:
                 timeout=self.timeout * 3,
             )
             r.raise_for_status()
-            return r.json()["results"]
+            return results + [
+                self._cache_set("kegg", res, res.get("gene_name", ""), organism) for res in r.json()["results"]
+            ]
         except Exception as e:
             logger.warning(f"MCP KEGG batch failed: {e}")
-            return [self.query_kegg(g, organism) for g in gene_names]
+            return results + [self.query_kegg(g, organism) for g in gene_names]
 
     # ------------------------------------------------------------------
     # STRING-DB
     # ------------------------------------------------------------------
 
     def query_stringdb(self, gene_name: str, species: str = "10090") -> dict:
+        cached = self._cache_get("stringdb", gene_name, species)
+        if cached is not None:
+            return cached
         try:
             r = self.session.get(
                 f"{self.base_url}/tools/stringdb/{gene_name}",
@@ -156,13 +287,16 @@ class MCPClient:
                 timeout=self.timeout,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("stringdb", r.json(), gene_name, species)
         except Exception as e:
             logger.warning(f"MCP STRING-DB failed for {gene_name}: {e}")
             return {"gene_name": gene_name, "species": species,
                     "interactions": [], "interaction_count": 0, "avg_score": 0.0}
 
     def query_stringdb_batch(self, gene_names: List[str], species: str = "10090") -> List[dict]:
+        results, gene_names = self._cache_split("stringdb", gene_names, species)
+        if not gene_names:
+            return results
         try:
             r = self.session.post(
                 f"{self.base_url}/tools/stringdb/batch",
@@ -170,10 +304,12 @@ class MCPClient:
                 timeout=self.timeout * 2,
             )
             r.raise_for_status()
-            return r.json()["results"]
+            return results + [
+                self._cache_set("stringdb", res, res.get("gene_name", ""), species) for res in r.json()["results"]
+            ]
         except Exception as e:
             logger.warning(f"MCP STRING-DB batch failed: {e}")
-            return [self.query_stringdb(g, species) for g in gene_names]
+            return results + [self.query_stringdb(g, species) for g in gene_names]
 
     # ------------------------------------------------------------------
     # InterPro
@@ -264,13 +400,16 @@ class MCPClient:
 
     def query_hpa(self, gene_name: str) -> dict:
         """Query Human Protein Atlas for subcellular localization."""
+        cached = self._cache_get("hpa", gene_name)
+        if cached is not None:
+            return cached
         try:
             r = self.session.get(
                 f"{self.base_url}/tools/hpa/{gene_name}",
                 timeout=self.timeout,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("hpa", r.json(), gene_name)
         except Exception as e:
             logger.warning(f"MCP HPA failed for {gene_name}: {e}")
             return {"gene_name": gene_name, "subcellular_location": [], "error": str(e)}
@@ -281,13 +420,16 @@ class MCPClient:
 
     def query_gtex(self, gene_name: str) -> dict:
         """Query GTEx for tissue expression data."""
+        cached = self._cache_get("gtex", gene_name)
+        if cached is not None:
+            return cached
         try:
             r = self.session.get(
                 f"{self.base_url}/tools/gtex/{gene_name}",
                 timeout=self.timeout,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("gtex", r.json(), gene_name)
         except Exception as e:
             logger.warning(f"MCP GTEx failed for {gene_name}: {e}")
             return {"gene_name": gene_name, "tissues": [], "error": str(e)}
@@ -298,6 +440,9 @@ class MCPClient:
 
     def query_biogrid(self, gene_name: str, organism: int = 10090) -> dict:
         """Query BioGRID for protein-protein interactions."""
+        cached = self._cache_get("biogrid", gene_name, organism)
+        if cached is not None:
+            return cached
         try:
             r = self.session.get(
                 f"{self.base_url}/tools/biogrid/{gene_name}",
@@ -305,11 +450,24 @@ class MCPClient:
                 timeout=self.timeout,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("biogrid", r.json(), gene_name, organism)
         except Exception as e:
             logger.warning(f"MCP BioGRID failed for {gene_name}: {e}")
             return {"gene_name": gene_name, "interactions": [], "error": str(e)}
 
+    def query_biogrid_batch(self, gene_names: List[str], organism: int = 10090) -> List[dict]:
+        """BioGRID for many genes via one batch_execute request; failed genes are omitted."""
+        results, gene_names = self._cache_split("biogrid", gene_names, organism)
+        if not gene_names:
+            return results
+        responses = self.batch_execute(
+            "query_biogrid", [{"gene_name": g, "organism": organism} for g in gene_names],
+        )
+        return results + [
+            self._cache_set("biogrid", res, g, organism)
+            for g, res in zip(gene_names, responses) if res
+        ]
+
     # ------------------------------------------------------------------
     # KEA3 — Kinase Enrichment Analysis
     # ------------------------------------------------------------------
@@ -423,6 +581,18 @@ class MCPClient:
             progress_cb=progress_cb, label="STRING-DB",
         )
 
+    def fetch_biogrid_parallel(
+        self, gene_names: List[str], organism: int = 10090, batch_size: int = 50,
+        max_workers: int = 4, progress_cb: ProgressCallback = None,
+    ) -> Dict[str, dict]:
+        def batch_fn(batch):
+            return self.query_biogrid_batch(batch, organism)
+        return self._run_batches_parallel(
+            gene_names, batch_fn, "gene",
+            batch_size=batch_size, max_workers=max_workers,
+            progress_cb=progress_cb, label="BioGRID",
+        )
+
     # ------------------------------------------------------------------
     # PubMed
     # ------------------------------------------------------------------
@@ -431,6 +601,10 @@ class MCPClient:
         self, gene: str, position: str, ptm_type: str = "Phosphorylation",
         context_keywords: list | None = None, max_results: int = 15,
     ) -> dict:
+        key = (gene, position, ptm_type, context_keywords or [], max_results)
+        cached = self._cache_get("pubmed", *key)
+        if cached is not None:
+            return cached
         try:
             r = self.session.post(
                 f"{self.base_url}/tools/pubmed/search",
@@ -441,7 +615,7 @@ class MCPClient:
                 timeout=self.timeout * 2,
             )
             r.raise_for_status()
-            return r.json()
+            return self._cache_set("pubmed", r.json(), *key)
         except Exception as e:
             logger.warning(f"MCP PubMed search failed for {gene}/{position}: {e}")
             return {"gene": gene, "position": position, "articles": [], "total_found": 0}
@@ -486,3 +660,5 @@ class MCPClient:
 
     def close(self):
         self.session.close()
+        if self._cache is not None:
+            self._cache.close()
@@ -0,0 +1,116 @@
+"""
+TSV I/O helpers for large pipeline tables.
+
+Reads and writes go through pyarrow's multithreaded CSV engine, falling back
+to pandas' C engine when Arrow cannot handle the data. Written files keep the
+layout produced by ``DataFrame.to_csv(sep="\\t", index=False)``.
+
+A TSV handed from one stage to the next can also get a Feather sidecar
+(``<name>.feather``), which the next stage loads instead of re-parsing text.
+The TSV stays the canonical output.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+logger = logging.getLogger("ptm-workers.tsv-io")
+
+PathLike = Union[str, Path]
+
+_BOOL_TEXT = {True: "True", False: "False"}
+
+# Strings pandas' CSV readers turn into NaN by default
+_DEFAULT_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def read_tsv(path: PathLike, **kwargs) -> pd.DataFrame:
+    """Read a tab-separated file, preferring the pyarrow engine."""
+    try:
+        return pd.read_csv(path, sep="\t", engine="pyarrow", **kwargs)
+    except Exception as e:
+        logger.warning(f"pyarrow TSV reader failed for {Path(path).name} ({e}); using C engine")
+        return pd.read_csv(path, sep="\t", low_memory=False, **kwargs)
+
+
+def write_tsv(df: pd.DataFrame, path: PathLike) -> None:
+    """Write ``df`` as TSV with pyarrow's CSV writer.
+
+    The header is written by hand (Arrow always quotes it) and values are
+    unquoted, matching pandas' output. Floats are formatted by NumPy, which
+    uses the same shortest round-trip repr as ``to_csv`` ("3.0", "1e-07");
+    Arrow's own float formatting differs. Values Arrow cannot write unquoted
+    (embedded tabs/newlines) or columns it cannot convert fall back to
+    ``DataFrame.to_csv``.
+    """
+    try:
+        # Arrow writes lowercase true/false; keep pandas' spelling (and NA as empty)
+        text_cols = {c: df[c].map(_BOOL_TEXT) for c in df.columns if pd.api.types.is_bool_dtype(df[c])}
+        for c in df.columns:
+            if df[c].dtype.kind == "f":
+                values = df[c].to_numpy()
+                text = values.astype(str)
+                text[np.isnan(values)] = ""
+                text_cols[c] = text
+        out = df.assign(**text_cols) if text_cols else df
+        table = pa.Table.from_pandas(out, preserve_index=False)
+        if any(pa.types.is_floating(t) for t in table.schema.types):
+            # e.g. object columns of Python floats; only to_csv formats those like pandas
+            raise TypeError("float values outside float columns")
+        with open(path, "wb") as f:
+            f.write(("\t".join(map(str, df.columns)) + "\n").encode("utf-8"))
+            pacsv.write_csv(
+                table, f,
+                pacsv.WriteOptions(delimiter="\t", include_header=False, quoting_style="none"),
+            )
+    except Exception as e:
+        logger.info(f"pyarrow TSV writer unavailable for {Path(path).name} ({e}); using to_csv")
+        df.to_csv(path, sep="\t", index=False)
+
+
+def feather_sidecar(path: PathLike) -> Path:
+    """Path of the Feather sidecar for the TSV at ``path``."""
+    return Path(path).with_suffix(".feather")
+
+
+def write_feather_sidecar(df: pd.DataFrame, path: PathLike) -> None:
+    """Store ``df`` as a Feather sidecar next to the TSV just written at ``path``."""
+    sidecar = feather_sidecar(path)
+    try:
+        df.reset_index(drop=True).to_feather(sidecar)
+    except Exception as e:
+        logger.info(f"Feather sidecar not written for {Path(path).name} ({e})")
+        sidecar.unlink(missing_ok=True)  # never leave a stale sidecar behind
+
+
+def read_tsv_or_sidecar(path: PathLike, dtype: Optional[dict] = None) -> pd.DataFrame:
+    """Read the TSV at ``path``, preferring an up-to-date Feather sidecar.
+
+    Sidecar frames are normalized to what read_tsv() would return: categorical
+    columns are decoded and the default NA strings (including "") become NaN.
+    """
+    sidecar = feather_sidecar(path)
+    try:
+        if sidecar.exists() and sidecar.stat().st_mtime >= Path(path).stat().st_mtime:
+            df = pd.read_feather(sidecar)
+            for col in df.columns:
+                values = df[col]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.astype(values.cat.categories.dtype)
+                if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+                    values = values.mask(values.isin(_DEFAULT_NA_STRINGS))
+                df[col] = values
+            if dtype:
+                df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+            return df
+    except Exception as e:
+        logger.warning(f"Feather sidecar unreadable for {Path(path).name} ({e}); reading TSV")
+    return read_tsv(path, dtype=dtype)
@@ -6,20 +6,22 @@ pasted_content.txt의 간단하고 효과적인 접근법을 기존 구조에 
 import pandas as pd
 import re
 import logging
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Mapping, Tuple, Optional
 import json
 from pathlib import Path
 
 class EnhancedMotifAnalyzerV2:
     """개선된 PTM Motif 분석기 V2 - 간단하고 효과적인 접근법"""
     
-    def __init__(self, cache_dir: str = "cache", fasta_path: str = None):
+    def __init__(self, cache_dir: str = "cache", fasta_path: str = None,
+                 fasta_dict: Optional[Mapping[str, str]] = None):
         """
         초기화
         
         Args:
             cache_dir: 캐시 디렉토리 경로
             fasta_path: FASTA 파일 경로 (서열 윈도우 추출용)
+            fasta_dict: 이미 로드된 UniProt ID → 서열 매핑 (있으면 FASTA 재파싱 생략)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
@@ -28,9 +30,9 @@ class EnhancedMotifAnalyzerV2:
         self.logger = self._setup_logging()
         
         # FASTA 서열 정보
-        self.fasta_sequences = {}
+        self.fasta_sequences = fasta_dict if fasta_dict is not None else {}
         self.fasta_path = fasta_path
-        if fasta_path:
+        if fasta_path and fasta_dict is None:
             self._load_fasta_sequences()
         
         # pasted_content.txt 스타일의 간단한 motif 데이터베이스
@@ -0,0 +1,85 @@
+"""
+Compact FASTA sequence store.
+
+All sequences live in one contiguous ASCII buffer with a ``uid → (offset, length)``
+index, instead of one Python ``str`` per protein. Reads behave like a
+read-only ``Dict[str, str]``; ``window()`` slices a sub-sequence without
+materializing the full protein string.
+
+``iter_fasta()`` parses a FASTA file through ``mmap`` so sequence bytes can
+be fed into the store without building ``SeqRecord``/``str`` objects.
+"""
+
+import mmap
+import os
+from collections.abc import Mapping
+from typing import Dict, Iterator, Tuple, Union
+
+_SEQ_WHITESPACE = b" \t\r\n"
+
+
+def iter_fasta(path: str) -> Iterator[Tuple[str, bytes]]:
+    """Yield ``(header, sequence_bytes)`` for each record, header without ``>``."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0 if mm[:1] == b">" else mm.find(b"\n>")
+            if pos > 0:
+                pos += 1
+            while pos != -1:
+                eol = mm.find(b"\n", pos)
+                if eol == -1:
+                    eol = size
+                header = mm[pos + 1:eol].decode("utf-8", errors="replace").strip()
+                nxt = mm.find(b"\n>", eol)
+                end = size if nxt == -1 else nxt
+                yield header, mm[eol + 1:end].translate(None, _SEQ_WHITESPACE)
+                pos = -1 if nxt == -1 else nxt + 1
+
+
+class FastaSequenceStore(Mapping):
+    """Read-only UniProt ID → sequence mapping backed by a single byte buffer."""
+
+    def __init__(self):
+        self._seq_blob = bytearray()
+        self._seq_offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, uid: str, sequence: Union[str, bytes]):
+        data = sequence.encode("ascii") if isinstance(sequence, str) else sequence
+        self._seq_offsets[uid] = (len(self._seq_blob), len(data))
+        self._seq_blob += data
+
+    def get_sequence(self, uid: str) -> str:
+        offset, length = self._seq_offsets[uid]
+        return self._seq_blob[offset:offset + length].decode("ascii")
+
+    def length(self, uid: str) -> int:
+        """Sequence length, or 0 when the protein is unknown."""
+        entry = self._seq_offsets.get(uid)
+        return entry[1] if entry else 0
+
+    def window(self, uid: str, start: int, end: int) -> str:
+        """Sub-sequence ``[start, end)`` clamped to the protein bounds."""
+        entry = self._seq_offsets.get(uid)
+        if not entry:
+            return ""
+        offset, length = entry
+        start = max(0, start)
+        end = min(length, end)
+        if start >= end:
+            return ""
+        return self._seq_blob[offset + start:offset + end].decode("ascii")
+
+    def __getitem__(self, uid: str) -> str:
+        return self.get_sequence(uid)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._seq_offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._seq_offsets)
+
+    def __len__(self) -> int:
+        return len(self._seq_offsets)
@@ -15,18 +15,23 @@ Schema matches ptm-preprocessing_v2_260131 output:
   Detailed_Regulator_Predictions
 """
 
-import json
+import functools
 import logging
 import os
 import re
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, MutableMapping, Optional, Tuple
 
+import diskcache
 import numpy as np
+import orjson
 import pandas as pd
-from Bio import SeqIO
+
+from common.disk_cache import open_index
+from common.tsv_io import read_tsv, write_feather_sidecar, write_tsv
 
 from .enhanced_motif_analyzer_v2 import EnhancedMotifAnalyzerV2
+from .fasta_store import FastaSequenceStore, iter_fasta
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,19 @@ MOTIF_PATTERNS = {
     "N-terminal_acetylation": {"pattern": r"^[ASGM]", "residues": ["A", "S", "G", "M"]},
 }
 
+_COMPILED_MOTIFS = [
+    (name, re.compile(info["pattern"]), frozenset(info["residues"]))
+    for name, info in MOTIF_PATTERNS.items()
+]
+
+_SKIP_POSITIONS = ("N-term", "Unknown", "N/A", "")
+
+DOMAIN_BATCH_SIZE = 200
+
+# Statistics kept in float64 by _load_tsv: p-/q-values, FDR, PEP and adjusted
+# p-values fall below float32's ~1e-38 range and are ranked on small differences
+_FULL_PRECISION_COLUMNS = re.compile(r"p[._ -]?val|q[._ -]?val|fdr|(?<![a-z])pep(?![a-z])|adj", re.IGNORECASE)
+
 
 class UnifiedProteinEnricher:
     """Domain and motif enrichment for PTM vector data using MCP Server."""
@@ -79,11 +97,11 @@ class UnifiedProteinEnricher:
         self.mcp = mcp_client
         self._progress = progress_callback or (lambda p, m: None)
 
-        self.fasta_dict: Dict[str, str] = {}
+        self.fasta_dict = FastaSequenceStore()
         self.protein_names: Dict[str, str] = {}
         self.gene_names: Dict[str, str] = {}
-        self.domain_cache: Dict[str, List[str]] = {}
-        self.motif_cache: Dict[str, dict] = {}
+        self.domain_cache: MutableMapping[str, List[str]] = {}
+        self.motif_cache: MutableMapping[Tuple[str, str, str], dict] = {}
 
         self.enhanced_motif_analyzer: Optional[EnhancedMotifAnalyzerV2] = None
 
@@ -93,11 +111,11 @@ class UnifiedProteinEnricher:
 
     def load_fasta(self) -> bool:
         try:
-            for record in SeqIO.parse(self.fasta_path, "fasta"):
-                uid = self._extract_uniprot_id(record.id)
+            for header, seq in iter_fasta(self.fasta_path):
+                uid = self._extract_uniprot_id(header.split(None, 1)[0] if header else "")
                 if uid:
-                    self.fasta_dict[uid] = str(record.seq)
-                    pname, gname = self._parse_fasta_header(record.description)
+                    self.fasta_dict.add(uid, seq)
+                    pname, gname = self._parse_fasta_header(header)
                     self.protein_names[uid] = pname
                     self.gene_names[uid] = gname
             logger.info(f"FASTA loaded: {len(self.fasta_dict):,} proteins")
@@ -132,6 +150,7 @@ class UnifiedProteinEnricher:
         return (protein_name.strip() or "Unknown protein"), (gene_name.strip() or "Unknown")
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def clean_protein_id(protein_id: str) -> str:
         if not protein_id or not isinstance(protein_id, str):
             return ""
@@ -148,45 +167,61 @@ class UnifiedProteinEnricher:
     # ------------------------------------------------------------------
 
     def load_cache(self):
-        domain_file = self.cache_dir / "domain_cache.json"
-        if domain_file.exists():
-            try:
-                with open(domain_file, "r", encoding="utf-8") as f:
-                    self.domain_cache = json.load(f)
-                logger.info(f"Domain cache loaded: {len(self.domain_cache)} entries")
-            except Exception as e:
-                logger.warning(f"Domain cache load failed: {e}")
+        """Open the on-disk domain/motif indexes (SQLite + orjson, item-level I/O).
+
+        A legacy ``domain_cache.json`` from earlier runs is imported once; the
+        old motif cache used string keys and is simply recomputed.
+        """
+        try:
+            self.domain_cache = self._open_index("domain_index", "domain_cache.json")
+            logger.info(f"Domain cache opened: {len(self.domain_cache)} entries")
+            self.motif_cache = self._open_index("motif_index")
+            logger.info(f"Motif cache opened: {len(self.motif_cache)} entries")
+        except Exception as e:
+            logger.warning(f"Cache open failed: {e}")
 
-        motif_file = self.cache_dir / "motif_cache.json"
-        if motif_file.exists():
+    def _open_index(self, name: str, legacy_file: Optional[str] = None) -> diskcache.Index:
+        index = open_index(self.cache_dir / name)
+        legacy = self.cache_dir / legacy_file if legacy_file else None
+        if legacy and legacy.exists() and len(index) == 0:
             try:
-                with open(motif_file, "r", encoding="utf-8") as f:
-                    self.motif_cache = json.load(f)
-                logger.info(f"Motif cache loaded: {len(self.motif_cache)} entries")
+                self._store_many(index, orjson.loads(legacy.read_bytes()).items())
+                logger.info(f"Imported {len(index)} entries from {legacy_file}")
             except Exception as e:
-                logger.warning(f"Motif cache load failed: {e}")
+                logger.warning(f"Legacy cache import failed ({legacy_file}): {e}")
+        return index
+
+    @staticmethod
+    def _store_many(cache: MutableMapping, items: Iterable[Tuple[str, object]]):
+        """Write many entries, in a single transaction when disk-backed."""
+        if isinstance(cache, diskcache.Index):
+            with cache.transact():
+                cache.update(items)
+        else:
+            cache.update(items)
 
     def save_cache(self):
-        try:
-            with open(self.cache_dir / "domain_cache.json", "w", encoding="utf-8") as f:
-                json.dump(self.domain_cache, f, ensure_ascii=False, indent=2)
-            with open(self.cache_dir / "motif_cache.json", "w", encoding="utf-8") as f:
-                json.dump(self.motif_cache, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.warning(f"Cache save failed: {e}")
+        """Flush disk-backed caches. Entries are persisted as they are written."""
+        for cache in (self.domain_cache, self.motif_cache):
+            if isinstance(cache, diskcache.Index):
+                try:
+                    cache.cache.close()
+                except Exception as e:
+                    logger.warning(f"Cache close failed: {e}")
 
     # ------------------------------------------------------------------
     # Domain fetching (via MCP)
     # ------------------------------------------------------------------
 
-    def fetch_domains_via_mcp(self, protein_ids: List[str]) -> Dict[str, List[str]]:
+    def fetch_domains_via_mcp(self, protein_ids: List[str]) -> MutableMapping[str, List[str]]:
         """Fetch domain annotations through MCP Server (InterPro batch)."""
         if not self.mcp:
             logger.warning("No MCP client available — skipping domain enrichment")
             return {}
 
-        unique_ids = list({self.clean_protein_id(pid) for pid in protein_ids if pid})
-        to_fetch = [pid for pid in unique_ids if pid and pid not in self.domain_cache]
+        cleaned = pd.Series(protein_ids, dtype=object).dropna().map(self.clean_protein_id)
+        unique_ids = [pid for pid in cleaned.unique().tolist() if pid]
+        to_fetch = [pid for pid in unique_ids if pid not in self.domain_cache]
 
         if not to_fetch:
             logger.info(f"All domain annotations cached ({len(self.domain_cache)} entries)")
@@ -194,17 +229,20 @@ class UnifiedProteinEnricher:
 
         logger.info(f"Fetching domains for {len(to_fetch)} proteins via MCP (cached: {len(unique_ids) - len(to_fetch)})...")
 
-        def domain_progress(done: int, total: int, msg: str):
-            frac = done / total if total > 0 else 1.0
-            self._progress(0.30 + frac * 0.20, f"InterPro domains: {done:,}/{total:,}")
-
-        results = self.mcp.fetch_interpro_parallel(
-            to_fetch, max_workers=4, progress_cb=domain_progress,
-        )
-
-        for pid, data in results.items():
-            domains = [d["name"] for d in data.get("domains", [])]
-            self.domain_cache[pid] = domains
+        # One batch_execute RPC per chunk; chunks only exist to report progress
+        total = len(to_fetch)
+        for start in range(0, total, DOMAIN_BATCH_SIZE):
+            chunk = to_fetch[start:start + DOMAIN_BATCH_SIZE]
+            results = self.mcp.batch_execute(
+                "query_interpro", [{"protein_id": pid} for pid in chunk],
+                max_concurrent=8, timeout_ms=30_000,
+            )
+            self._store_many(self.domain_cache, (
+                (pid, [d["name"] for d in data.get("domains", [])])
+                for pid, data in zip(chunk, results) if data
+            ))
+            done = min(start + DOMAIN_BATCH_SIZE, total)
+            self._progress(0.30 + done / total * 0.20, f"InterPro domains: {done:,}/{total:,}")
 
         logger.info(f"Domain cache now has {len(self.domain_cache)} entries")
         return self.domain_cache
@@ -215,7 +253,7 @@ class UnifiedProteinEnricher:
 
     def analyze_motif_patterns(self, protein_id: str, modified_sequence: str, ptm_position: str) -> Dict:
         """Analyze motif patterns for a PTM site using local FASTA sequences."""
-        cache_key = f"{protein_id}_{modified_sequence}_{ptm_position}"
+        cache_key = (protein_id, modified_sequence, ptm_position)
         if cache_key in self.motif_cache:
             return self.motif_cache[cache_key]
 
@@ -229,7 +267,7 @@ class UnifiedProteinEnricher:
                 return result
 
             pos_str = str(ptm_position)
-            if pos_str in ("N-term", "Unknown", "N/A", ""):
+            if pos_str in _SKIP_POSITIONS:
                 self.motif_cache[cache_key] = result
                 return result
 
@@ -254,15 +292,11 @@ class UnifiedProteinEnricher:
 
             ptm_site_in_window = pos - window_start
 
-            for motif_name, motif_info in MOTIF_PATTERNS.items():
-                pattern = motif_info["pattern"]
-                target_residues = motif_info["residues"]
+            for motif_name, regex, target_residues in _COMPILED_MOTIFS:
                 if aa not in target_residues:
                     continue
-                for m in re.finditer(pattern, sequence_window):
-                    if m.start() <= ptm_site_in_window < m.end():
-                        result["motifs"].append(motif_name)
-                        break
+                if self._motif_covers_site(regex, sequence_window, ptm_site_in_window):
+                    result["motifs"].append(motif_name)
 
         except Exception as e:
             result["error"] = str(e)
@@ -270,6 +304,108 @@ class UnifiedProteinEnricher:
         self.motif_cache[cache_key] = result
         return result
 
+    @staticmethod
+    def _motif_covers_site(regex: "re.Pattern", window: str, site: int) -> bool:
+        for m in regex.finditer(window):
+            if m.start() <= site < m.end():
+                return True
+        return False
+
+    def analyze_motif_patterns_bulk(self, ptm_data: pd.DataFrame) -> pd.Series:
+        """Vectorized Step 1: motif analysis for every PTM site at once.
+
+        Returns the analyze_motif_patterns() result dict for each row of
+        ``ptm_data`` that has a sequence and position (indexed like
+        ``ptm_data``). Each distinct site is read from or written to
+        motif_cache once; positions are parsed and each motif pre-screened
+        with one pandas string pass over all sequence windows.
+        """
+        ms = ptm_data["Modified.Sequence"] if "Modified.Sequence" in ptm_data.columns else pd.Series(index=ptm_data.index, dtype=object)
+        pp = ptm_data["PTM_Position"] if "PTM_Position" in ptm_data.columns else pd.Series(index=ptm_data.index, dtype=object)
+        valid = ms.notna() & pp.notna()
+        if not valid.any():
+            return pd.Series(dtype=object)
+
+        if "_clean_pg" in ptm_data.columns:
+            pids = ptm_data.loc[valid, "_clean_pg"]
+        else:
+            pids = ptm_data.loc[valid, "Protein.Group"].map(self.clean_protein_id)
+        rows = pd.DataFrame({
+            "pid": pids,
+            "ms": ms[valid].astype(str),
+            "pp": pp[valid].astype(str),
+        })
+        row_keys = list(zip(rows["pid"], rows["ms"], rows["pp"]))
+
+        results_by_key: Dict[Tuple[str, str, str], dict] = {}
+        for key in dict.fromkeys(row_keys):
+            cached = self.motif_cache.get(key)
+            if cached is not None:
+                results_by_key[key] = cached
+
+        # First occurrence of each site that is not cached yet
+        todo = ~pd.Series(row_keys).duplicated().to_numpy()
+        todo &= np.array([k not in results_by_key for k in row_keys], dtype=bool)
+        sites = rows[todo].reset_index(drop=True)
+        keys = [k for k, t in zip(row_keys, todo) if t]
+        if not sites.empty:
+            results = self._scan_motif_sites(sites)
+            results_by_key.update(zip(keys, results))
+            self._store_many(self.motif_cache, zip(keys, results))
+
+        return pd.Series([results_by_key[k] for k in row_keys], index=rows.index, dtype=object)
+
+    def _scan_motif_sites(self, sites: pd.DataFrame) -> List[dict]:
+        """Motif results for distinct sites (columns pid, ms, pp), in row order."""
+        clean_ids = sites["pid"].map(self.clean_protein_id).to_numpy()
+        pos_strs = sites["pp"].to_numpy()
+        seq_len = np.fromiter((self.fasta_dict.length(u) for u in clean_ids), dtype=np.int64, count=len(clean_ids))
+        parsed = sites["pp"].str.extract(r"^([A-Z])(\d+)")
+        aas = parsed[0]
+        pos0 = (pd.to_numeric(parsed[1], errors="coerce") - 1).to_numpy(dtype=float, na_value=np.nan)
+
+        # Row outcome masks, evaluated in the same precedence as analyze_motif_patterns()
+        not_found = seq_len == 0
+        skipped = ~not_found & sites["pp"].isin(_SKIP_POSITIONS).to_numpy()
+        unparsed = ~not_found & ~skipped & aas.isna().to_numpy()
+        pending = ~(not_found | skipped | unparsed)
+        out_of_range = pending & ((pos0 < 0) | (pos0 >= seq_len))
+        ok = pending & ~out_of_range
+
+        results = [
+            {"motifs": [], "motif_descriptions": [], "sequence_window": "", "error": None}
+            for _ in range(len(sites))
+        ]
+        for i in np.flatnonzero(not_found):
+            results[i]["error"] = f"Protein sequence not found: {clean_ids[i]}"
+        for i in np.flatnonzero(unparsed):
+            results[i]["error"] = f"PTM position parse failed: {pos_strs[i]}"
+        for i in np.flatnonzero(out_of_range):
+            results[i]["error"] = f"PTM position out of range: {int(pos0[i]) + 1}/{seq_len[i]}"
+
+        ok_idx = np.flatnonzero(ok)
+        ok_pos = pos0[ok_idx].astype(np.int64)
+        ok_start = np.maximum(0, ok_pos - 7)
+        windows = [""] * len(sites)
+        sites_in_window = np.zeros(len(sites), dtype=np.int64)
+        sites_in_window[ok_idx] = ok_pos - ok_start
+        for i, s0, p in zip(ok_idx.tolist(), ok_start.tolist(), ok_pos.tolist()):
+            windows[i] = self.fasta_dict.window(clean_ids[i], s0, p + 8)
+            results[i]["sequence_window"] = windows[i]
+
+        window_ser = pd.Series(windows, dtype=object)
+        has_window = window_ser.str.len() > 0
+        for motif_name, regex, target_residues in _COMPILED_MOTIFS:
+            candidates = has_window & aas.isin(target_residues)
+            if not candidates.any():
+                continue
+            hits = window_ser[candidates].str.contains(regex, regex=True)
+            for i in hits.index[hits.to_numpy()]:
+                if self._motif_covers_site(regex, windows[i], sites_in_window[i]):
+                    results[i]["motifs"].append(motif_name)
+
+        return results
+
     # ------------------------------------------------------------------
     # Main enrichment
     # ------------------------------------------------------------------
@@ -313,7 +449,13 @@ class UnifiedProteinEnricher:
     @staticmethod
     def _load_tsv(path: str, label: str) -> pd.DataFrame:
         try:
-            df = pd.read_csv(path, sep="\t", low_memory=False)
+            df = read_tsv(path)
+            # Abundances/fold-changes don't need double precision; statistics do
+            float_cols = [
+                c for c in df.select_dtypes("float64").columns if not _FULL_PRECISION_COLUMNS.search(str(c))
+            ]
+            if float_cols:
+                df = df.astype({c: "float32" for c in float_cols})
             logger.info(f"{label}: {len(df):,} rows")
             return df
         except Exception as e:
@@ -322,29 +464,33 @@ class UnifiedProteinEnricher:
 
     def create_unified_dataset(self, ptm_df: pd.DataFrame, all_protein_df: pd.DataFrame) -> pd.DataFrame:
         """Merge PTM and non-PTM protein data into unified dataset (v2 compatible)."""
-        ptm_df = ptm_df.copy()
-        ptm_df["Has_PTM"] = True
-        ptm_df["Data_Type"] = self.data_type_name
+        ptm_df = ptm_df.assign(Has_PTM=True, Data_Type=self.data_type_name)
 
         ptm_proteins = set(ptm_df["Protein.Group"].unique())
-        non_ptm = all_protein_df[~all_protein_df["Protein.Group"].isin(ptm_proteins)].copy()
-        non_ptm["Has_PTM"] = False
-        non_ptm["Data_Type"] = "Protein_Only"
-        non_ptm["Modified.Sequence"] = ""
-        non_ptm["PTM_Type"] = ""
-        non_ptm["PTM_Position"] = ""
-        non_ptm["PTM_Relative_Log2FC"] = np.nan
-        non_ptm["Control_Mean_Protein"] = non_ptm.get("Control_Mean")
-        non_ptm["Treatment_Mean_Protein"] = non_ptm.get("Treatment_Mean")
-        non_ptm["Protein_Log2FC"] = non_ptm.get("Log2FC")
-        non_ptm["Protein_Fold_Change"] = non_ptm.get("Fold_Change")
-        non_ptm["Control_Mean_PTM_Relative"] = np.nan
-
+        non_ptm = all_protein_df[~all_protein_df["Protein.Group"].isin(ptm_proteins)]
         unique_conditions = non_ptm["Condition"].unique() if "Condition" in non_ptm.columns else []
-        for cond in unique_conditions:
-            non_ptm[f"{cond}_Mean_PTM_Relative"] = np.nan
+
+        # Single assign() instead of one block allocation per new column
+        new_cols = {
+            "Has_PTM": False,
+            "Data_Type": "Protein_Only",
+            "Modified.Sequence": "",
+            "PTM_Type": "",
+            "PTM_Position": "",
+            "PTM_Relative_Log2FC": np.float32(np.nan),
+            "Control_Mean_Protein": non_ptm.get("Control_Mean"),
+            "Treatment_Mean_Protein": non_ptm.get("Treatment_Mean"),
+            "Protein_Log2FC": non_ptm.get("Log2FC"),
+            "Protein_Fold_Change": non_ptm.get("Fold_Change"),
+            "Control_Mean_PTM_Relative": np.float32(np.nan),
+        }
+        new_cols.update({f"{cond}_Mean_PTM_Relative": np.float32(np.nan) for cond in unique_conditions})
+        non_ptm = non_ptm.assign(**new_cols)
 
         unified = pd.concat([ptm_df, non_ptm], ignore_index=True, sort=False)
+        for col in ("Data_Type", "PTM_Type", "Condition"):
+            if col in unified.columns:
+                unified[col] = unified[col].astype("category")
         logger.info(f"Unified dataset: {len(unified):,} rows (PTM: {len(ptm_df):,}, non-PTM: {len(non_ptm):,})")
         return unified
 
@@ -353,28 +499,31 @@ class UnifiedProteinEnricher:
         unique_proteins = unified_df["Protein.Group"].dropna().unique().tolist()
         logger.info(f"Enriching {len(unique_proteins)} unique proteins")
 
+        # Clean each distinct Protein.Group once; reused by every pass below
+        clean_map = {pg: self.clean_protein_id(pg) for pg in unique_proteins}
+        unified_df["_clean_pg"] = unified_df["Protein.Group"].map(clean_map).fillna("")
+
         # --- Domain enrichment via MCP ---
         self._progress(0.30, "Fetching domain annotations")
         self.fetch_domains_via_mcp(unique_proteins)
 
         # --- Step 1: Local motif analysis (v2 analyze_motif_patterns) ---
         self._progress(0.50, "Running local motif analysis")
-        ptm_data = unified_df[unified_df["Has_PTM"] == True]
+        has_ptm_mask = unified_df["Has_PTM"].to_numpy(dtype=bool, copy=False)
+        ptm_data = unified_df.iloc[has_ptm_mask]
+        motif_by_row: Dict[object, dict] = {}
         if not ptm_data.empty:
-            for _, row in ptm_data.iterrows():
-                pid = self.clean_protein_id(row["Protein.Group"])
-                ms = row.get("Modified.Sequence", "")
-                pp = row.get("PTM_Position", "")
-                if pd.notna(ms) and pd.notna(pp):
-                    self.analyze_motif_patterns(pid, str(ms), str(pp))
+            motif_by_row = self.analyze_motif_patterns_bulk(ptm_data).to_dict()
             self.save_cache()
 
         # --- Step 2: Enhanced motif analysis (EnhancedMotifAnalyzerV2) ---
         self._progress(0.60, "Running enhanced motif analysis")
         try:
-            self.enhanced_motif_analyzer = EnhancedMotifAnalyzerV2(
-                cache_dir=str(self.cache_dir), fasta_path=str(self.fasta_path)
-            )
+            if self.enhanced_motif_analyzer is None:
+                self.enhanced_motif_analyzer = EnhancedMotifAnalyzerV2(
+                    cache_dir=str(self.cache_dir), fasta_path=str(self.fasta_path),
+                    fasta_dict=self.fasta_dict,
+                )
             unified_df = self.enhanced_motif_analyzer.analyze_motifs_simple(unified_df)
         except Exception as e:
             logger.warning(f"Enhanced motif analysis failed: {e}")
@@ -402,11 +551,13 @@ class UnifiedProteinEnricher:
         seq_windows = []
         motif_errors = []
 
-        for _, row in unified_df.iterrows():
-            pid = self.clean_protein_id(row["Protein.Group"])
+        # One cache read per protein rather than per row
+        domain_lookup = {pid: self.domain_cache.get(pid, []) for pid in set(clean_map.values())}
 
+        # Plain NumPy columns: no per-row Series construction or label lookups
+        for idx, pid in zip(unified_df.index.to_numpy(), unified_df["_clean_pg"].to_numpy()):
             # Domain info
-            domains = self.domain_cache.get(pid, [])
+            domains = domain_lookup.get(pid, [])
             domains_list.append("; ".join(domains) if domains else "")
             domain_counts.append(len(domains))
 
@@ -414,13 +565,11 @@ class UnifiedProteinEnricher:
             motifs = []
             seq_window = ""
             motif_error = ""
-            if row.get("Has_PTM", False) and pd.notna(row.get("Modified.Sequence", "")):
-                cache_key = f"{pid}_{row.get('Modified.Sequence', '')}_{row.get('PTM_Position', '')}"
-                if cache_key in self.motif_cache:
-                    mr = self.motif_cache[cache_key]
-                    motifs = mr.get("motifs", [])
-                    seq_window = mr.get("sequence_window", "")
-                    motif_error = mr.get("error", "") or ""
+            mr = motif_by_row.get(idx)
+            if mr is not None:
+                motifs = mr.get("motifs", [])
+                seq_window = mr.get("sequence_window", "")
+                motif_error = mr.get("error", "") or ""
 
             motifs_list.append("; ".join(motifs) if motifs else "")
             motif_counts.append(len(motifs))
@@ -428,36 +577,38 @@ class UnifiedProteinEnricher:
             motif_errors.append(motif_error)
 
         unified_df["Domains"] = domains_list
-        unified_df["Domain_Count"] = domain_counts
+        unified_df["Domain_Count"] = np.array(domain_counts, dtype=np.int32)
         unified_df["Motifs"] = motifs_list
-        unified_df["Motif_Count"] = motif_counts
+        unified_df["Motif_Count"] = np.array(motif_counts, dtype=np.int32)
         unified_df["Sequence_Window"] = seq_windows
         unified_df["Motif_Analysis_Error"] = motif_errors
 
         # Remove redundant columns from non-PTM merge
-        for col in ["Control_Mean", "Treatment_Mean", "Log2FC", "Fold_Change"]:
-            if col in unified_df.columns:
-                unified_df.drop(columns=[col], inplace=True, errors="ignore")
+        redundant = ("_clean_pg", "Control_Mean", "Treatment_Mean", "Log2FC", "Fold_Change")
+        unified_df = unified_df.drop(columns=[c for c in redundant if c in unified_df.columns])
 
         logger.info("Enrichment complete")
         return unified_df
 
     def save_unified_results(self, enriched_df: pd.DataFrame):
         out = self.output_dir / f"unified_protein_data_enriched{self.file_suffix}.tsv"
-        enriched_df.to_csv(out, sep="\t", index=False)
+        write_tsv(enriched_df, out)
+        # Binary copy so Step 3 can skip re-parsing the TSV
+        write_feather_sidecar(enriched_df, out)
         logger.info(f"Saved: {out.name}")
         self._print_summary(enriched_df)
 
     def _print_summary(self, df: pd.DataFrame):
         total = len(df)
-        ptm_count = df["Has_PTM"].sum() if "Has_PTM" in df.columns else 0
+        has_ptm_mask = df["Has_PTM"].to_numpy(dtype=bool, copy=False) if "Has_PTM" in df.columns else None
+        ptm_count = int(has_ptm_mask.sum()) if has_ptm_mask is not None else 0
         logger.info(f"Total rows: {total:,} (PTM: {ptm_count:,}, non-PTM: {total - ptm_count:,})")
 
         if "Domain_Count" in df.columns:
             has_domain = (df["Domain_Count"] > 0).sum()
             logger.info(f"With domain annotations: {has_domain:,}")
 
-        ptm_data = df[df["Has_PTM"] == True] if "Has_PTM" in df.columns else pd.DataFrame()
+        ptm_data = df.iloc[has_ptm_mask] if has_ptm_mask is not None else pd.DataFrame()
         if not ptm_data.empty and "Motif_Count" in ptm_data.columns:
             has_motif = (ptm_data["Motif_Count"] > 0).sum()
             logger.info(f"With motif matches (PTM only): {has_motif:,}/{len(ptm_data):,}")
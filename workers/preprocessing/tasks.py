@@ -13,20 +13,32 @@ MCP API results are cached in Redis (TTL 7 days) by the MCP server.
 
 import logging
 import os
+import re
 import time
 import traceback
 from pathlib import Path
 
 from celery_app import app
 from common.db_update import get_order_status, update_order_status
+from common.file_prefetch import prefetch_files
 from common.mcp_client import MCPClient
 from common.progress import publish_progress
+from common.tsv_io import read_tsv_or_sidecar, write_tsv
 
 logger = logging.getLogger("ptm-workers.preprocessing")
 
 INPUT_DIR = os.getenv("INPUT_DIR", "/data/inputs")
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "/data/outputs")
 
+_PTM_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+# Protein lists up to this size are matched with one regex alternation;
+# larger ones use the hashed substring scan in _contains_any()
+_REGEX_MAX_IDS = 1000
+
+# Compact dtypes for the columns _apply_downsampling filters on
+_DOWNSAMPLING_DTYPES = {"Has_PTM": "boolean", "Protein_Log2FC": "float32"}
+
 
 def _make_progress_callback(order_id: int, stage: str, step: str, base_pct: float, range_pct: float):
     """Create a progress callback that maps [0,1] to [base_pct, base_pct+range_pct]."""
@@ -36,89 +48,154 @@ def _make_progress_callback(order_id: int, stage: str, step: str, base_pct: floa
     return cb
 
 
-def _has_output(output_dir: Path, *filenames: str) -> bool:
-    """Check if all expected output files exist and are non-empty."""
+def _has_output(output_dir: Path, *filenames: str, entries: dict | None = None) -> bool:
+    """Check if all expected output files exist and are non-empty.
+
+    With ``entries`` (from _scan_output_dir) the check is answered from that
+    listing instead of probing each path.
+    """
     for fn in filenames:
+        if entries is not None:
+            entry = entries.get(fn)
+            if entry is None or entry.stat().st_size == 0:
+                return False
+            continue
         f = output_dir / fn
         if not f.exists() or f.stat().st_size == 0:
             return False
     return True
 
 
-def _apply_downsampling(df, analysis_options: dict | None, order_id: int) -> "pd.DataFrame":
+def _scan_output_dir(output_dir: Path) -> dict:
+    """List the regular files in output_dir with a single scandir pass (name → DirEntry)."""
+    with os.scandir(output_dir) as it:
+        return {entry.name: entry for entry in it if entry.is_file()}
+
+
+def _contains_any(texts, patterns) -> list:
+    """For each text, whether it contains any of ``patterns`` as a substring.
+
+    Multi-pattern search by hashing: every window of each distinct pattern
+    length is looked up in a set. Cost grows with text length times the
+    number of distinct pattern lengths (a handful for UniProt accessions),
+    not with the number of patterns as a regex alternation does.
+    """
+    by_len: dict = {}
+    for p in patterns:
+        by_len.setdefault(len(p), set()).add(p)
+    buckets = sorted(by_len.items())
+
+    def hit(text: str) -> bool:
+        for width, ids in buckets:
+            if width > len(text):
+                break
+            if any(text[i:i + width] in ids for i in range(len(text) - width + 1)):
+                return True
+        return False
+
+    return [hit(t) for t in texts]
+
+
+def _apply_downsampling(df, analysis_options: dict | None, order_id: int) -> tuple["pd.DataFrame", dict | None]:
     """Apply downsampling to reduce the number of proteins for biological enrichment.
 
-    Returns a filtered DataFrame. PTM sites (Has_PTM=True) are always kept.
+    Returns the filtered DataFrame and its stats ({"rows", "unique_proteins"}),
+    or None for stats when no downsampling is configured.
+    PTM sites (Has_PTM=True) are always kept.
     """
+    import numpy as np
     import pandas as pd
 
     if not analysis_options:
-        return df
+        return df, None
 
     mode = analysis_options.get("mode", "full")
     if mode == "full":
-        return df
+        return df, None
 
     total_before = len(df)
     ptm_col = "Has_PTM" if "Has_PTM" in df.columns else ("Is_PTM_Site" if "Is_PTM_Site" in df.columns else None)
     has_log2fc = "Protein_Log2FC" in df.columns
 
-    ptm_mask = df[ptm_col].astype(str).str.lower().isin(["true", "1", "yes"]) if ptm_col else pd.Series(False, index=df.index)
-    ptm_df = df[ptm_mask]
-    non_ptm_df = df[~ptm_mask]
-
-    if mode == "ptm_topn":
-        top_n = int(analysis_options.get("topN", 500))
+    if ptm_col is None:
+        ptm_mask = np.zeros(len(df), dtype=bool)
+    elif df[ptm_col].dtype == bool:
+        ptm_mask = df[ptm_col].to_numpy()
+    elif pd.api.types.is_bool_dtype(df[ptm_col]):
+        ptm_mask = df[ptm_col].fillna(False).to_numpy(dtype=bool)  # nullable "boolean"
+    else:
+        ptm_mask = df[ptm_col].astype(str).str.lower().isin(_PTM_TRUE_VALUES).to_numpy()
+    non_ptm = ~ptm_mask
+    # |log2FC| once, as a plain array shared by the ranking/threshold modes
+    abs_fc = np.abs(df["Protein_Log2FC"].to_numpy(dtype=float, na_value=np.nan)) if has_log2fc else None
+
+    # Each mode selects non-PTM rows as a mask over the full frame; one final
+    # slice keeps PTM rows plus the selection, in their original order.
+    keep_non_ptm = None
+
+    if mode in ("ptm_topn", "custom_count"):
+        if mode == "ptm_topn":
+            top_n = int(analysis_options.get("topN", 500))
+        else:
+            top_n = int(analysis_options.get("proteinCount", 1000))
         if has_log2fc:
-            non_ptm_sorted = non_ptm_df.copy()
-            non_ptm_sorted["_abs_log2fc"] = non_ptm_sorted["Protein_Log2FC"].abs()
-            top_proteins = non_ptm_sorted.nlargest(top_n, "_abs_log2fc")["Protein.Group"].unique()
-            filtered_non_ptm = non_ptm_df[non_ptm_df["Protein.Group"].isin(top_proteins)]
+            # Linear-time top-N via partition; boundary ties go to the earliest
+            # rows, matching Series.nlargest(keep="first")
+            candidates = np.flatnonzero(non_ptm & ~np.isnan(abs_fc))
+            if top_n <= 0:
+                top_pos = candidates[:0]
+            elif top_n >= len(candidates):
+                # nlargest pads a short ranking with NaN rows, earliest first
+                nan_pos = np.flatnonzero(non_ptm & np.isnan(abs_fc))
+                top_pos = np.concatenate([candidates, nan_pos[: top_n - len(candidates)]])
+            else:
+                values = abs_fc[candidates]
+                kth = np.partition(values, len(values) - top_n)[len(values) - top_n]
+                above = candidates[values > kth]
+                ties = candidates[values == kth][: top_n - len(above)]
+                top_pos = np.concatenate([above, ties])
+            top_proteins = df["Protein.Group"].iloc[top_pos].unique()
+            keep_non_ptm = df["Protein.Group"].isin(top_proteins).to_numpy()
         else:
-            filtered_non_ptm = non_ptm_df.head(top_n)
-        df = pd.concat([ptm_df, filtered_non_ptm], ignore_index=True)
+            keep_non_ptm = np.cumsum(non_ptm) <= top_n
 
     elif mode == "log2fc_threshold":
         threshold = float(analysis_options.get("log2fcThreshold", 0.5))
         if has_log2fc:
-            filtered_non_ptm = non_ptm_df[non_ptm_df["Protein_Log2FC"].abs() >= threshold]
+            keep_non_ptm = abs_fc >= threshold
         else:
-            filtered_non_ptm = non_ptm_df
-        df = pd.concat([ptm_df, filtered_non_ptm], ignore_index=True)
-
-    elif mode == "custom_count":
-        count = int(analysis_options.get("proteinCount", 1000))
-        if has_log2fc:
-            non_ptm_sorted = non_ptm_df.copy()
-            non_ptm_sorted["_abs_log2fc"] = non_ptm_sorted["Protein_Log2FC"].abs()
-            top_proteins = non_ptm_sorted.nlargest(count, "_abs_log2fc")["Protein.Group"].unique()
-            filtered_non_ptm = non_ptm_df[non_ptm_df["Protein.Group"].isin(top_proteins)]
-        else:
-            filtered_non_ptm = non_ptm_df.head(count)
-        df = pd.concat([ptm_df, filtered_non_ptm], ignore_index=True)
+            keep_non_ptm = np.ones(len(df), dtype=bool)
 
     elif mode == "protein_list":
         list_path = analysis_options.get("protein_list_path")
         if list_path and os.path.exists(list_path):
             with open(list_path, "r") as f:
-                target_ids = {line.strip() for line in f if line.strip()}
+                ids = pd.Series(f.read().split("\n"), dtype="string").str.strip()
+            target_ids = ids[ids != ""].unique()
             logger.info(f"[Order {order_id}] Protein list loaded: {len(target_ids)} IDs")
-            protein_col = "Protein.Group" if "Protein.Group" in non_ptm_df.columns else None
+            protein_col = "Protein.Group" if "Protein.Group" in df.columns else None
             if protein_col:
-                filtered_non_ptm = non_ptm_df[
-                    non_ptm_df[protein_col].apply(
-                        lambda x: any(tid in str(x) for tid in target_ids) if pd.notna(x) else False
-                    )
-                ]
+                proteins = df[protein_col]
+                # Exact IDs resolve by hash lookup; only the remaining (composite)
+                # groups such as "P12345;Q9Y6K9" go through one compiled regex.
+                keep_non_ptm = proteins.isin(target_ids).to_numpy(copy=True)
+                rest = non_ptm & ~keep_non_ptm & proteins.notna().to_numpy()
+                if len(target_ids) and rest.any():
+                    rest_values = proteins[rest].astype(str)
+                    if len(target_ids) <= _REGEX_MAX_IDS:
+                        pattern = re.compile("|".join(map(re.escape, target_ids)))
+                        keep_non_ptm[rest] = rest_values.str.contains(pattern).to_numpy()
+                    else:
+                        # Large catalogs: hashed window scan, once per distinct group
+                        codes, uniques = pd.factorize(rest_values)
+                        keep_non_ptm[rest] = np.array(_contains_any(uniques, target_ids), dtype=bool)[codes]
             else:
-                filtered_non_ptm = non_ptm_df
-            df = pd.concat([ptm_df, filtered_non_ptm], ignore_index=True)
+                keep_non_ptm = np.ones(len(df), dtype=bool)
         else:
             logger.warning(f"[Order {order_id}] Protein list file not found: {list_path}")
 
-    # Clean up temp column if created
-    if "_abs_log2fc" in df.columns:
-        df = df.drop(columns=["_abs_log2fc"])
+    if keep_non_ptm is not None:
+        df = df[ptm_mask | (non_ptm & keep_non_ptm)].reset_index(drop=True)
 
     total_after = len(df)
     unique_proteins = df["Protein.Group"].nunique() if "Protein.Group" in df.columns else total_after
@@ -126,7 +203,7 @@ def _apply_downsampling(df, analysis_options: dict | None, order_id: int) -> "pd
         f"[Order {order_id}] Downsampling ({mode}): {total_before:,} → {total_after:,} rows, "
         f"{unique_proteins:,} unique proteins"
     )
-    return df
+    return df, {"rows": total_after, "unique_proteins": unique_proteins}
 
 
 @app.task(bind=True, name="preprocessing.tasks.run_preprocessing", max_retries=1)
@@ -148,6 +225,10 @@ def run_preprocessing(self, order_id: int, config: dict):
     order_code = config.get("order_code", f"order-{order_id}")
     order_output = Path(OUTPUT_DIR) / order_code
     order_output.mkdir(parents=True, exist_ok=True)
+    mcp = None
+    # Steps only add their own outputs, so one listing taken up front answers
+    # every skip check below (one directory read instead of one per step).
+    existing_outputs = _scan_output_dir(order_output)
 
     update_order_status(order_id, "preprocessing", current_stage="preprocessing", progress_pct=0)
     logger.info(f"[Order {order_id}] Preprocessing started — mode={config.get('ptm_mode', 'phospho')}")
@@ -169,9 +250,7 @@ def run_preprocessing(self, order_id: int, config: dict):
                 logger.info(f"[Order {order_id}] Loading condition_map from config.xlsx: {config_xlsx}")
                 df = pd.read_excel(config_xlsx)
                 if "File_Name" in df.columns and "Group" in df.columns:
-                    condition_map = {}
-                    for _, row in df.iterrows():
-                        condition_map[str(row["File_Name"])] = str(row["Group"])
+                    condition_map = dict(zip(map(str, df["File_Name"]), map(str, df["Group"])))
                     logger.info(f"[Order {order_id}] Loaded {len(condition_map)} sample mappings from config.xlsx")
                 else:
                     logger.warning(f"[Order {order_id}] config.xlsx missing File_Name/Group columns")
@@ -188,11 +267,13 @@ def run_preprocessing(self, order_id: int, config: dict):
         quant_output = f"ptm_vector_data_normalized{file_suffix}.tsv"
         all_protein_output = f"all_protein_level_changes_normalized{file_suffix}.tsv"
 
-        if _has_output(order_output, quant_output, all_protein_output):
+        if _has_output(order_output, quant_output, all_protein_output, entries=existing_outputs):
             logger.info(f"[Order {order_id}] Step 1 skipped — quantification outputs already exist")
             publish_progress(order_id, "preprocessing", "ptm_quantification", "completed", 50, "PTM quantification skipped (cached)")
         else:
             publish_progress(order_id, "preprocessing", "ptm_quantification", "started", 2, "Loading input files")
+            # Kernel readahead of the inputs overlaps disk reads with the imports below
+            prefetch_files([pr_path, pg_path, fasta_path])
 
             from preprocessing.core.ptm_quantification import PTMQuantificationAnalyzer
 
@@ -216,8 +297,8 @@ def run_preprocessing(self, order_id: int, config: dict):
         # Step 1b: PTM Vector Report (2D scatter plots) — right after Step 1
         # ================================================================
         has_vector_reports = any(
-            f.name.startswith("ptm_vector_report_") or f.name.startswith("ptm_vector_summary_report")
-            for f in order_output.glob("*.png")
+            name.endswith(".png") and name.startswith(("ptm_vector_report_", "ptm_vector_summary_report"))
+            for name in existing_outputs
         )
         if not has_vector_reports:
             vector_file = order_output / quant_output
@@ -236,7 +317,7 @@ def run_preprocessing(self, order_id: int, config: dict):
         # ================================================================
         enriched_output = f"unified_protein_data_enriched{file_suffix}.tsv"
 
-        if _has_output(order_output, enriched_output):
+        if _has_output(order_output, enriched_output, entries=existing_outputs):
             logger.info(f"[Order {order_id}] Step 2 skipped — unified enrichment output already exists")
             publish_progress(order_id, "preprocessing", "unified_enrichment", "completed", 70, "Domain/motif enrichment skipped (cached)")
         else:
@@ -271,7 +352,7 @@ def run_preprocessing(self, order_id: int, config: dict):
         # ================================================================
         bio_output = f"unified_protein_data_enriched_bio_enriched{file_suffix}.tsv"
 
-        if _has_output(order_output, bio_output):
+        if _has_output(order_output, bio_output, entries=existing_outputs):
             logger.info(f"[Order {order_id}] Step 3 skipped — biological enrichment output already exists")
             publish_progress(order_id, "preprocessing", "biological_enrichment", "completed", 90, "Biological enrichment skipped (cached)")
         else:
@@ -279,7 +360,7 @@ def run_preprocessing(self, order_id: int, config: dict):
 
             from preprocessing.core.biological_enricher import BiologicalEnricher
 
-            if "mcp" not in dir():
+            if mcp is None:
                 mcp = MCPClient()
 
             bio_cb = _make_progress_callback(order_id, "preprocessing", "biological_enrichment", 70, 20)
@@ -287,17 +368,20 @@ def run_preprocessing(self, order_id: int, config: dict):
 
             if enriched_file.exists():
                 import pandas as pd
-                df = pd.read_csv(enriched_file, sep="\t", low_memory=False)
+                # Every column is carried into the bio-enriched output, so the read
+                # cannot be projected; only the downsampling keys get explicit dtypes.
+                header = pd.read_csv(enriched_file, sep="\t", nrows=0).columns
+                dtypes = {c: t for c, t in _DOWNSAMPLING_DTYPES.items() if c in header}
+                df = read_tsv_or_sidecar(enriched_file, dtype=dtypes)
 
                 # Apply downsampling if configured
                 analysis_opts = config.get("analysis_options")
-                df = _apply_downsampling(df, analysis_opts, order_id)
-                ds_mode = (analysis_opts or {}).get("mode", "full")
-                if ds_mode != "full":
-                    unique_count = df["Protein.Group"].nunique() if "Protein.Group" in df.columns else len(df)
+                df, ds_stats = _apply_downsampling(df, analysis_opts, order_id)
+                if ds_stats is not None:
+                    ds_mode = analysis_opts.get("mode", "full")
                     publish_progress(
                         order_id, "preprocessing", "biological_enrichment", "running", 71,
-                        f"Downsampled to {unique_count:,} proteins ({ds_mode})",
+                        f"Downsampled to {ds_stats['unique_proteins']:,} proteins ({ds_mode})",
                     )
 
                 bio_enricher = BiologicalEnricher(
@@ -308,7 +392,7 @@ def run_preprocessing(self, order_id: int, config: dict):
                 enriched_df = bio_enricher.enrich_dataframe(df, species_tax_id=species, kegg_organism=kegg_org)
 
                 bio_out = order_output / bio_output
-                enriched_df.to_csv(bio_out, sep="\t", index=False)
+                write_tsv(enriched_df, bio_out)
                 logger.info(f"[Order {order_id}] Biological enrichment saved: {bio_out.name}")
             else:
                 logger.warning(f"[Order {order_id}] Skipping biological enrichment — {enriched_file.name} not found")
@@ -320,7 +404,10 @@ def run_preprocessing(self, order_id: int, config: dict):
         # ================================================================
         publish_progress(order_id, "preprocessing", "finalization", "started", 90, "Finalizing results")
 
-        output_files = [f.name for f in order_output.iterdir() if f.is_file() and f.suffix in (".tsv", ".txt", ".png")]
+        output_files = [
+            name for name in _scan_output_dir(order_output)
+            if Path(name).suffix in (".tsv", ".txt", ".png")
+        ]
         elapsed = round(time.time() - start_time, 1)
 
         publish_progress(
@@ -331,9 +418,6 @@ def run_preprocessing(self, order_id: int, config: dict):
 
         logger.info(f"[Order {order_id}] Preprocessing completed in {elapsed}s — {len(output_files)} output files")
 
-        if "mcp" in dir():
-            mcp.close()
-
         if not config.get("chain_to_next", True) or get_order_status(order_id) == "cancelled":
             logger.info(f"[Order {order_id}] Preprocessing complete (no chain — re-run only or cancelled)")
             if get_order_status(order_id) != "cancelled":
@@ -385,3 +469,6 @@ def run_preprocessing(self, order_id: int, config: dict):
             metadata={"traceback": traceback.format_exc(), "elapsed_seconds": elapsed},
         )
         raise
+    finally:
+        if mcp is not None:
+            mcp.close()
@@ -12,23 +12,63 @@ Uses LLM to extract:
   - Relevance assessment with context alignment
 """
 
+import functools
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 from common.llm_client import LLMClient
 from .fulltext_analyzer import FullTextAnalysis, PatternMatch
 
 logger = logging.getLogger(__name__)
 
+# LLM response parsing: markdown code fences, greedy outermost-object fallback,
+# and the structural characters walked by _extract_json()
+CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*")
+JSON_OBJECT_PATTERN = re.compile(r"\{[\s\S]*\}")
+JSON_TOKEN_PATTERN = re.compile(r'[{}"\\]')
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` object in ``text``, skipping braces inside strings."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    skip_to = start
+    # Visit only structural characters; everything in between is skipped in C
+    for m in JSON_TOKEN_PATTERN.finditer(text, start):
+        i = m.start()
+        if i < skip_to:
+            continue
+        ch = m.group()
+        if in_string:
+            if ch == "\\":
+                skip_to = i + 2  # escaped character
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AbstractAnalysis:
     pmid: str = ""
     gene: str = ""
@@ -66,6 +106,86 @@ class AbstractAnalysis:
 # Prompt builder
 # ---------------------------------------------------------------------------
 
+_EXTRACTION_TASK = """EXTRACTION TASK:
+Extract comprehensive PTM signaling information. If information is not available, use null or empty arrays.
+Be precise and extract ONLY information explicitly stated in the abstract.
+
+Return a JSON object with these keys:
+{
+  "signalingNetwork": {
+    "upstreamRegulators": [
+      {"name": "...", "type": "kinase|phosphatase|...", "evidence": "direct|indirect|predicted",
+        "mechanism": "...", "conditions": "...", "quantitativeData": "..."}
+    ],
+    "downstreamEffects": [
+      {"target": "...", "effect": "activation|inhibition|...", "mechanism": "...",
+        "magnitude": "...", "biologicalOutcome": "..."}
+    ],
+    "coRegulators": [
+      {"name": "...", "relationship": "cooperative|antagonistic|sequential", "site": "..."}
+    ]
+  },
+  "functionalConsequences": {
+    "enzymaticActivity": {"affected": true/false, "direction": "...", "magnitude": "...", "mechanism": "..."},
+    "proteinInteractions": [{"partner": "...", "effect": "...", "functionalImpact": "..."}],
+    "subcellularLocalization": {"changed": true/false, "from": "...", "to": "...", "mechanism": "..."},
+    "proteinStability": {"affected": true/false, "direction": "...", "mechanism": "..."}
+  },
+  "biologicalContext": {
+    "signalingPathways": [{"pathway": "...", "role": "...", "regulation": "..."}],
+    "cellularProcesses": [{"process": "...", "role": "...", "impact": "..."}],
+    "diseaseRelevance": [{"disease": "...", "role": "...", "therapeuticImplication": "..."}]
+  },
+  "experimentalEvidence": {
+    "methods": [{"technique": "...", "purpose": "...", "finding": "..."}],
+    "mutations": [{"mutation": "...", "effect": "...", "phenotype": "..."}],
+    "quantitativeData": {
+      "foldChanges": ["..."], "pValues": ["..."], "kinetics": ["..."]
+    }
+  },
+  "relevanceAssessment": {
+    "relevanceScore": 0-100,
+    "relevanceReasons": ["..."],
+    "contextAlignment": {
+      "cellTypeMatch": true/false,
+      "treatmentMatch": true/false,
+      "biologicalQuestionMatch": true/false
+    },
+    "evidenceQuality": "direct experimental evidence|indirect evidence|...",
+    "novelty": "novel finding|confirmation of known|..."
+  },
+  "keyFindings": ["3-5 most important findings"]
+}
+
+Output JSON only, no markdown code blocks."""
+
+# System prompt: role plus the fixed extraction schema; the user prompt holds the abstract
+_ANALYSIS_SYSTEM_PROMPT = (
+    "You are an expert in cellular signaling and PTM biology. Output valid JSON only.\n\n"
+    + _EXTRACTION_TASK
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_context_info(context_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Experimental-context block of the prompt; constant across one order's abstracts."""
+    if not context_items:
+        return "No experimental context provided."
+    parts = [f"- {key.replace('_', ' ').title()}: {val}" for key, val in context_items]
+    return "Experimental Context:\n" + "\n".join(parts)
+
+
+def _context_items(experimental_context: Optional[dict]) -> Tuple[Tuple[str, str], ...]:
+    """Hashable form of the experimental-context fields used in the prompt."""
+    if not experimental_context:
+        return ()
+    return tuple(
+        (key, str(val))
+        for key in ("cell_type", "treatment", "time_points", "biological_question")
+        if (val := experimental_context.get(key))
+    )
+
+
 def _build_analysis_prompt(
     abstract: str,
     gene: str,
@@ -75,16 +195,8 @@ def _build_analysis_prompt(
 ) -> str:
     """Build the LLM prompt for abstract analysis."""
 
-    # Context info
-    context_info = "No experimental context provided."
-    if experimental_context:
-        parts = []
-        for key in ("cell_type", "treatment", "time_points", "biological_question"):
-            val = experimental_context.get(key)
-            if val:
-                parts.append(f"- {key.replace('_', ' ').title()}: {val}")
-        if parts:
-            context_info = "Experimental Context:\n" + "\n".join(parts)
+    # Context info (cached per distinct context)
+    context_info = _build_context_info(_context_items(experimental_context))
 
     # Pattern match summary
     pattern_summary = "No pattern matches found."
@@ -114,59 +226,7 @@ PATTERN MATCHES (from regex analysis):
 ABSTRACT:
 \"\"\"{abstract}\"\"\"
 
-EXTRACTION TASK:
-Extract comprehensive PTM signaling information. If information is not available, use null or empty arrays.
-Be precise and extract ONLY information explicitly stated in the abstract.
-
-Return a JSON object with these keys:
-{{
-  "signalingNetwork": {{
-    "upstreamRegulators": [
-      {{"name": "...", "type": "kinase|phosphatase|...", "evidence": "direct|indirect|predicted",
-        "mechanism": "...", "conditions": "...", "quantitativeData": "..."}}
-    ],
-    "downstreamEffects": [
-      {{"target": "...", "effect": "activation|inhibition|...", "mechanism": "...",
-        "magnitude": "...", "biologicalOutcome": "..."}}
-    ],
-    "coRegulators": [
-      {{"name": "...", "relationship": "cooperative|antagonistic|sequential", "site": "..."}}
-    ]
-  }},
-  "functionalConsequences": {{
-    "enzymaticActivity": {{"affected": true/false, "direction": "...", "magnitude": "...", "mechanism": "..."}},
-    "proteinInteractions": [{{"partner": "...", "effect": "...", "functionalImpact": "..."}}],
-    "subcellularLocalization": {{"changed": true/false, "from": "...", "to": "...", "mechanism": "..."}},
-    "proteinStability": {{"affected": true/false, "direction": "...", "mechanism": "..."}}
-  }},
-  "biologicalContext": {{
-    "signalingPathways": [{{"pathway": "...", "role": "...", "regulation": "..."}}],
-    "cellularProcesses": [{{"process": "...", "role": "...", "impact": "..."}}],
-    "diseaseRelevance": [{{"disease": "...", "role": "...", "therapeuticImplication": "..."}}]
-  }},
-  "experimentalEvidence": {{
-    "methods": [{{"technique": "...", "purpose": "...", "finding": "..."}}],
-    "mutations": [{{"mutation": "...", "effect": "...", "phenotype": "..."}}],
-    "quantitativeData": {{
-      "foldChanges": ["..."], "pValues": ["..."], "kinetics": ["..."]
-    }}
-  }},
-  "relevanceAssessment": {{
-    "relevanceScore": 0-100,
-    "relevanceReasons": ["..."],
-    "contextAlignment": {{
-      "cellTypeMatch": true/false,
-      "treatmentMatch": true/false,
-      "biologicalQuestionMatch": true/false
-    }},
-    "evidenceQuality": "direct experimental evidence|indirect evidence|...",
-    "novelty": "novel finding|confirmation of known|..."
-  }},
-  "keyFindings": ["3-5 most important findings"]
-}}
-
-Output JSON only, no markdown code blocks."""
-
+Complete the EXTRACTION TASK from the system prompt for this abstract."""
     return prompt
 
 
@@ -221,7 +281,7 @@ class AbstractAnalyzer:
             try:
                 response = self.llm.generate(
                     prompt=prompt,
-                    system_prompt="You are an expert in cellular signaling and PTM biology. Output valid JSON only.",
+                    system_prompt=_ANALYSIS_SYSTEM_PROMPT,
                     temperature=0.3,
                     max_tokens=3000,
                 )
@@ -237,15 +297,55 @@ class AbstractAnalyzer:
 
         return result
 
+    def analyze_batch(
+        self,
+        items: List[dict],
+        max_concurrency: int = 8,
+    ) -> List[AbstractAnalysis]:
+        """
+        Analyze several abstracts with concurrent LLM calls.
+
+        Args:
+            items: analyze() keyword arguments per abstract (pmid, abstract,
+                gene, position, optional pattern_analysis / experimental_context)
+            max_concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            One AbstractAnalysis per item, in input order.
+        """
+        if not items:
+            return []
+
+        def run(item: dict) -> AbstractAnalysis:
+            try:
+                return self.analyze(**item)
+            except Exception as e:
+                pmid = item.get("pmid", "")
+                logger.warning(f"[AbstractAnalyzer] Analysis failed for {pmid}: {e}")
+                return AbstractAnalysis(
+                    pmid=pmid, gene=item.get("gene", ""), position=item.get("position", ""),
+                )
+
+        # LLM round-trips are I/O-bound; threads overlap the waits
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(items)))) as executor:
+            return list(executor.map(run, items))
+
     def _parse_response(self, response: str) -> Optional[dict]:
         """Parse JSON from LLM response."""
         text = response.strip()
         # Remove markdown code blocks
-        text = re.sub(r"```json\s*", "", text)
-        text = re.sub(r"```\s*", "", text)
+        text = CODE_FENCE_PATTERN.sub("", text)
+
+        # First balanced JSON object; trailing commentary is ignored
+        candidate = _extract_json(text)
+        if candidate is not None:
+            try:
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError:
+                pass
 
-        # Find JSON object
-        match = re.search(r"\{[\s\S]*\}", text)
+        # Fallback: greedy outermost-brace match with the lenient stdlib parser
+        match = JSON_OBJECT_PATTERN.search(text)
         if not match:
             logger.error("[AbstractAnalyzer] No JSON found in response")
             return None
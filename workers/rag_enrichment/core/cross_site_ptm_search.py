@@ -12,20 +12,57 @@ Features:
   - Antibody validation information extraction
 """
 
+import asyncio
+import functools
+import heapq
 import logging
 import os
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 MCP_URL = os.getenv("MCP_SERVER_URL", "http://mcp-server:8100")
 
+# Novelty weight per evidence source (unknown sources weigh 0.1)
+_SOURCE_WEIGHTS = {
+    "iptmnet": 0.3,
+    "pubmed": 0.2,
+    "pmc": 0.15,
+    "uniprot": 0.3,
+}
 
-@dataclass
+# In-memory per-searcher cache of MCP lookups
+_LOOKUP_CACHE_TTL = 600.0  # seconds
+_LOOKUP_CACHE_MAXSIZE = 4096
+
+# Process-wide cache of complete search() results, shared by all searchers
+_RESULT_CACHE_TTL = 86400.0  # seconds
+_RESULT_CACHE_MAXSIZE = 10000
+_RESULT_CACHE: Dict[tuple, Tuple[float, "CrossSiteResult"]] = {}
+
+
+def _make_room(cache: Dict[tuple, tuple], now: float, maxsize: int) -> None:
+    """Drop expired entries, then the oldest ones, until ``cache`` has a free slot."""
+    if len(cache) < maxsize:
+        return
+    for key in [k for k, v in cache.items() if v[0] <= now]:
+        del cache[key]
+    while len(cache) >= maxsize:
+        del cache[next(iter(cache))]
+
+
+def clear_result_cache() -> None:
+    """Drop the cached search() results of every searcher in this process."""
+    _RESULT_CACHE.clear()
+
+
+@dataclass(slots=True)
 class PTMEvidence:
     """Evidence for a PTM from a single source."""
     source: str  # "pubmed", "pmc", "iptmnet", "uniprot"
@@ -40,7 +77,7 @@ class PTMEvidence:
     year: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossSiteResult:
     """Aggregated cross-site search result for a PTM."""
     protein: str
@@ -59,43 +96,73 @@ class CrossSiteResult:
 # Antibody Info Extraction Patterns
 # ---------------------------------------------------------------------------
 
-ANTIBODY_PATTERNS = [
-    re.compile(
-        r"(?:anti-?)?(?:phospho-?)?" + gene + r".*?(?:antibod(?:y|ies)).*?(?:\(([^)]+)\))",
-        re.IGNORECASE,
-    )
-    for gene in [r"[A-Z][A-Z0-9]{1,6}"]
-]
-
 WESTERN_BLOT_PATTERN = re.compile(
     r"(?:western\s*blot|immunoblot).*?(?:anti-?)?(?:phospho-?)?\s*([A-Z][A-Z0-9]{1,6})",
     re.IGNORECASE,
 )
 
+# Literal every WESTERN_BLOT_PATTERN match contains; a plain substring test
+# on the lowercased text skips the regex scan for texts without it.
+WESTERN_BLOT_LITERAL = "blot"
+
+# The leading lookahead rejects positions that cannot start a vendor name
+# with one character-class test before any alternative is tried.
 ANTIBODY_VENDOR_PATTERN = re.compile(
+    r"(?=[CASMBTIRP])"
     r"(?:Cell\s*Signaling|Abcam|Santa\s*Cruz|Sigma|Millipore|BD\s*Biosciences|"
     r"Thermo\s*Fisher|Invitrogen|R&D\s*Systems|Proteintech)\s*(?:#?\s*\d+)?",
     re.IGNORECASE,
 )
 
 
-def extract_antibody_info(text: str, protein: str) -> Optional[str]:
-    """Extract antibody validation information from text."""
-    protein_upper = protein.upper()
+@functools.lru_cache(maxsize=1024)
+def _protein_context_pattern(protein: str) -> re.Pattern:
+    """Line-context pattern around a protein name (compiled once per protein)."""
+    return re.compile(
+        rf"(?:anti-?)?(?:phospho-?)?\s*{re.escape(protein)}.*?(?:\n|$)",
+        re.IGNORECASE,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _protein_site_pattern(protein: str, site: str) -> re.Pattern:
+    """Protein-then-site mention pattern for full-text matching (compiled once per pair)."""
+    return re.compile(
+        rf"\b{re.escape(protein)}.*?{re.escape(site)}\b",
+        re.IGNORECASE,
+    )
+
+
+def extract_antibody_info(
+    text: str, protein: str, text_lower: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Extract antibody validation information from text.
+
+    ``text_lower`` may carry an already lowercased copy of ``text`` so match
+    spans are checked against it instead of re-casing each match.
+    """
     info_parts = []
+    if text_lower is None:
+        text_lower = text.lower()
 
     # Search for western blot mentions
-    for match in WESTERN_BLOT_PATTERN.finditer(text):
-        if protein_upper in match.group(0).upper():
-            info_parts.append(f"Western blot confirmed: {match.group(0).strip()[:100]}")
+    if WESTERN_BLOT_LITERAL in text_lower:
+        # Lowercase containment matches the upper-case check only for ASCII
+        if text.isascii() and protein.isascii():
+            protein_lower = protein.lower()
+            for match in WESTERN_BLOT_PATTERN.finditer(text):
+                if protein_lower in text_lower[match.start():match.end()]:
+                    info_parts.append(f"Western blot confirmed: {match.group(0).strip()[:100]}")
+        else:
+            protein_upper = protein.upper()
+            for match in WESTERN_BLOT_PATTERN.finditer(text):
+                if protein_upper in match.group(0).upper():
+                    info_parts.append(f"Western blot confirmed: {match.group(0).strip()[:100]}")
 
     # Search for antibody vendor info
     # Look in context around protein name
-    protein_pattern = re.compile(
-        rf"(?:anti-?)?(?:phospho-?)?\s*{re.escape(protein)}.*?(?:\n|$)",
-        re.IGNORECASE,
-    )
-    for match in protein_pattern.finditer(text):
+    for match in _protein_context_pattern(protein).finditer(text):
         context = match.group(0)
         vendor_match = ANTIBODY_VENDOR_PATTERN.search(context)
         if vendor_match:
@@ -104,15 +171,139 @@ def extract_antibody_info(text: str, protein: str) -> Optional[str]:
     return "; ".join(info_parts) if info_parts else None
 
 
+# ---------------------------------------------------------------------------
+# Site Matching
+# ---------------------------------------------------------------------------
+
+_SITE_RE = re.compile(r"(?:p(?:hospho)?-?)?\s*([STY](?:er|hr|yr)?)\s*(\d+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_site(s: str):
+    """Parse a site string into ``(aa, pos)``, or ``(None, None)`` if unrecognised."""
+    m = _SITE_RE.match(s)
+    if m:
+        return m.group(1)[0].upper(), int(m.group(2))
+    return None, None
+
+
+@functools.lru_cache(maxsize=4096)
+def _sites_match(query_site: str, db_site: str) -> bool:
+    """
+    Check if two PTM sites match.
+    Handles formats: S473, Ser473, pS473, phospho-Ser473
+    Also allows nearby positions (within +/-2 residues) for fuzzy matching.
+    """
+    # Identical spellings (the usual iPTMnet case) match without parsing
+    if query_site == db_site or query_site.lower() == db_site.lower():
+        return True
+
+    q_aa, q_pos = _parse_site(query_site)
+    d_aa, d_pos = _parse_site(db_site)
+
+    if q_aa is None or d_aa is None:
+        return query_site.lower() == db_site.lower()
+
+    # Exact match
+    if q_aa == d_aa and q_pos == d_pos:
+        return True
+
+    # Fuzzy match: same amino acid, position within +/-2
+    if q_aa == d_aa and abs(q_pos - d_pos) <= 2:
+        return True
+
+    return False
+
+
+def _copy_result(result: CrossSiteResult) -> CrossSiteResult:
+    """Copy of ``result`` with its own evidence and database lists."""
+    return replace(
+        result,
+        evidence=list(result.evidence),
+        databases_found=list(result.databases_found),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Cross-Site PTM Searcher
 # ---------------------------------------------------------------------------
 
 class CrossSitePTMSearcher:
-    """Searches for PTM evidence across multiple databases via MCP."""
+    """
+    Searches for PTM evidence across multiple databases via MCP.
+
+    All requests go through one keep-alive HTTP client; use the searcher as
+    ``async with CrossSitePTMSearcher() as searcher:`` or call ``aclose()``.
+    """
 
     def __init__(self, mcp_base_url: str = MCP_URL):
         self.mcp_url = mcp_base_url.rstrip("/")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock: Optional[asyncio.Lock] = None
+        # (source, protein, site, ptm_type) -> (expires_at, in-flight or finished lookup)
+        self._cache: Dict[tuple, Tuple[float, asyncio.Future]] = {}
+
+    async def __aenter__(self) -> "CrossSitePTMSearcher":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created on first use."""
+        if self._client is None:
+            if self._client_lock is None:
+                self._client_lock = asyncio.Lock()
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        timeout=30,
+                        limits=httpx.Limits(max_keepalive_connections=32),
+                    )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def clear_cache(self) -> None:
+        """
+        Drop this searcher's memoized MCP lookups. Cached search() results are
+        process-wide; use ``clear_result_cache()`` to drop those.
+        """
+        self._cache.clear()
+
+    async def _cached(
+        self,
+        fetch: Callable[..., Awaitable[List["PTMEvidence"]]],
+        protein: str,
+        site: str,
+        ptm_type: str,
+        client: httpx.AsyncClient,
+    ) -> Sequence[PTMEvidence]:
+        """
+        Run ``fetch`` once per (source, protein, site, ptm_type) within the TTL.
+
+        Concurrent callers with the same key await the same in-flight lookup
+        and receive the same evidence sequence; callers must not mutate it.
+        Failed lookups are not kept.
+        """
+        key = (fetch.__name__, protein, site, ptm_type)
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= now:
+            _make_room(self._cache, now, _LOOKUP_CACHE_MAXSIZE)
+            task = asyncio.ensure_future(fetch(protein, site, ptm_type, client))
+            entry = self._cache[key] = (now + _LOOKUP_CACHE_TTL, task)
+        try:
+            return await asyncio.shield(entry[1])
+        except BaseException:
+            if entry[1].done() and self._cache.get(key) is entry:
+                del self._cache[key]
+            raise
 
     async def search(
         self,
@@ -133,30 +324,38 @@ class CrossSitePTMSearcher:
         Returns:
             CrossSiteResult with aggregated evidence
         """
+        cache_key = (self.mcp_url, protein, site, ptm_type, include_fulltext)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return _copy_result(cached[1])
+
+        client = await self._get_client()
+
         result = CrossSiteResult(
             protein=protein,
             site=site,
             ptm_type=ptm_type,
         )
 
-        # 1. PubMed search
-        pubmed_evidence = await self._search_pubmed(protein, site, ptm_type)
-        result.evidence.extend(pubmed_evidence)
-        if pubmed_evidence:
-            result.databases_found.append("pubmed")
-
-        # 2. PMC full-text search (if enabled)
+        # 1-3. PubMed, PMC full-text (if enabled) and iPTMnet, queried concurrently
+        fetchers = [("pubmed", "PubMed", self._search_pubmed)]
         if include_fulltext:
-            pmc_evidence = await self._search_pmc(protein, site, ptm_type)
-            result.evidence.extend(pmc_evidence)
-            if pmc_evidence:
-                result.databases_found.append("pmc")
+            fetchers.append(("pmc", "PMC", self._search_pmc))
+        fetchers.append(("iptmnet", "iPTMnet", self._search_iptmnet))
 
-        # 3. iPTMnet lookup
-        iptmnet_evidence = await self._search_iptmnet(protein, site, ptm_type)
-        result.evidence.extend(iptmnet_evidence)
-        if iptmnet_evidence:
-            result.databases_found.append("iptmnet")
+        per_source = await asyncio.gather(
+            *(self._cached(fetch, protein, site, ptm_type, client) for _, _, fetch in fetchers),
+            return_exceptions=True,
+        )
+        complete = True
+        for (source, label, _), evidence in zip(fetchers, per_source):
+            if isinstance(evidence, BaseException):
+                logger.warning(f"{label} search failed for {protein} {site}: {evidence}")
+                complete = False
+                continue
+            result.evidence.extend(evidence)
+            if evidence:
+                result.databases_found.append(source)
 
         # 4. Aggregate results
         result.evidence_count = len(result.evidence)
@@ -172,12 +371,19 @@ class CrossSitePTMSearcher:
         # 6. Generate summary
         result.summary = self._generate_summary(result)
 
+        # A source that errored would make the result look more novel than it is
+        if complete:
+            now = time.monotonic()
+            _make_room(_RESULT_CACHE, now, _RESULT_CACHE_MAXSIZE)
+            _RESULT_CACHE[cache_key] = (now + _RESULT_CACHE_TTL, _copy_result(result))
+
         return result
 
     async def search_batch(
         self,
         ptm_list: List[Dict[str, str]],
         include_fulltext: bool = True,
+        max_concurrency: int = 16,
     ) -> List[CrossSiteResult]:
         """
         Search for multiple PTMs.
@@ -185,23 +391,25 @@ class CrossSitePTMSearcher:
         Args:
             ptm_list: List of dicts with keys: protein, site, ptm_type
             include_fulltext: Whether to search PMC full-text
+            max_concurrency: Maximum number of PTMs searched at once
 
         Returns:
             List of CrossSiteResult
         """
-        import asyncio
-
-        tasks = [
-            self.search(
-                protein=ptm.get("protein", ""),
-                site=ptm.get("site", ""),
-                ptm_type=ptm.get("ptm_type", "phosphorylation"),
-                include_fulltext=include_fulltext,
-            )
-            for ptm in ptm_list
-        ]
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _run(ptm: Dict[str, str]) -> CrossSiteResult:
+            async with sem:
+                return await self.search(
+                    protein=ptm.get("protein", ""),
+                    site=ptm.get("site", ""),
+                    ptm_type=ptm.get("ptm_type", "phosphorylation"),
+                    include_fulltext=include_fulltext,
+                )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(_run(ptm) for ptm in ptm_list), return_exceptions=True,
+        )
 
         valid_results = []
         for r in results:
@@ -217,210 +425,159 @@ class CrossSitePTMSearcher:
     # -----------------------------------------------------------------------
 
     async def _search_pubmed(
-        self, protein: str, site: str, ptm_type: str,
+        self, protein: str, site: str, ptm_type: str, client: httpx.AsyncClient,
     ) -> List[PTMEvidence]:
         """Search PubMed for PTM evidence via MCP /tools/pubmed/search."""
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(
-                    f"{self.mcp_url}/tools/pubmed/search",
-                    json={
-                        "gene": protein,
-                        "position": site,
-                        "ptm_type": ptm_type,
-                        "context_keywords": [],
-                        "max_results": 10,
-                    },
+        resp = await client.post(
+            f"{self.mcp_url}/tools/pubmed/search",
+            json={
+                "gene": protein,
+                "position": site,
+                "ptm_type": ptm_type,
+                "context_keywords": [],
+                "max_results": 10,
+            },
+        )
+        # Raise on MCP errors so search() does not cache the gap as novelty
+        resp.raise_for_status()
+
+        data = orjson.loads(resp.content)
+        articles = data.get("articles", [])
+
+        site_lower = site.lower()
+        protein_lower = protein.lower()
+        evidence = []
+        for art in articles:
+            abstract = art.get("abstract", "")
+            abstract_lower = abstract.lower()
+            # Check if the specific site is mentioned. Plain substring tests on
+            # the lowered abstract are far cheaper than an IGNORECASE regex.
+            site_in_abstract = site_lower in abstract_lower
+            site_mentioned = site_in_abstract or protein_lower in abstract_lower
+
+            if site_mentioned:
+                ab_info = extract_antibody_info(abstract, protein, abstract_lower)
+                ev = PTMEvidence(
+                    source="pubmed",
+                    protein=protein,
+                    site=site,
+                    ptm_type=ptm_type,
+                    pmid=art.get("pmid", ""),
+                    title=art.get("title", ""),
+                    snippet=abstract[:300],
+                    confidence=0.7 if site_in_abstract else 0.4,
+                    antibody_info=ab_info,
+                    year=art.get("year", ""),
                 )
-                if resp.status_code != 200:
-                    return []
-
-                data = resp.json()
-                articles = data.get("articles", [])
-
-                evidence = []
-                for art in articles:
-                    abstract = art.get("abstract", "")
-                    # Check if the specific site is mentioned
-                    site_mentioned = (
-                        site.lower() in abstract.lower()
-                        or protein.lower() in abstract.lower()
-                    )
+                evidence.append(ev)
 
-                    if site_mentioned:
-                        ab_info = extract_antibody_info(abstract, protein)
-                        ev = PTMEvidence(
-                            source="pubmed",
-                            protein=protein,
-                            site=site,
-                            ptm_type=ptm_type,
-                            pmid=art.get("pmid", ""),
-                            title=art.get("title", ""),
-                            snippet=abstract[:300],
-                            confidence=0.7 if site.lower() in abstract.lower() else 0.4,
-                            antibody_info=ab_info,
-                            year=art.get("year", ""),
-                        )
-                        evidence.append(ev)
-
-                return evidence
-
-        except Exception as e:
-            logger.warning(f"PubMed search failed for {protein} {site}: {e}")
-            return []
+        return evidence
 
     async def _search_pmc(
-        self, protein: str, site: str, ptm_type: str,
+        self, protein: str, site: str, ptm_type: str, client: httpx.AsyncClient,
     ) -> List[PTMEvidence]:
         """Search PMC full-text for detailed PTM evidence via MCP /tools/pmc/fulltext."""
-        try:
-            # First, search PubMed to get PMIDs, then fetch full-text
-            async with httpx.AsyncClient(timeout=30) as client:
-                # Step 1: Get PMIDs from PubMed
-                resp = await client.post(
-                    f"{self.mcp_url}/tools/pubmed/search",
-                    json={
-                        "gene": protein,
-                        "position": site,
-                        "ptm_type": ptm_type,
-                        "context_keywords": [],
-                        "max_results": 5,
-                    },
-                )
-                if resp.status_code != 200:
-                    return []
-
-                data = resp.json()
-                articles = data.get("articles", [])
-                pmids = [art.get("pmid", "") for art in articles if art.get("pmid")]
+        # First, search PubMed to get PMIDs, then fetch full-text
+        # Step 1: Get PMIDs from PubMed
+        resp = await client.post(
+            f"{self.mcp_url}/tools/pubmed/search",
+            json={
+                "gene": protein,
+                "position": site,
+                "ptm_type": ptm_type,
+                "context_keywords": [],
+                "max_results": 5,
+            },
+        )
+        resp.raise_for_status()
 
-                if not pmids:
-                    return []
+        data = orjson.loads(resp.content)
+        articles = data.get("articles", [])
+        pmids = [art.get("pmid", "") for art in articles if art.get("pmid")]
 
-                # Step 2: Fetch full-text for each PMID
-                evidence = []
-                for pmid in pmids[:3]:  # Limit to 3 for performance
-                    ft_resp = await client.get(
-                        f"{self.mcp_url}/tools/pmc/fulltext/{pmid}",
-                        timeout=30,
-                    )
-                    if ft_resp.status_code != 200:
-                        continue
-
-                    ft_data = ft_resp.json()
-                    fulltext = ft_data.get("fulltext", "")
-                    if not fulltext:
-                        continue
-
-                    # More precise matching in full text
-                    site_pattern = re.compile(
-                        rf"\b{re.escape(protein)}.*?{re.escape(site)}\b",
-                        re.IGNORECASE,
-                    )
-                    matches = site_pattern.findall(fulltext)
-
-                    if matches:
-                        ab_info = extract_antibody_info(fulltext, protein)
-                        snippet = matches[0][:200] if matches else ""
-
-                        ev = PTMEvidence(
-                            source="pmc",
-                            protein=protein,
-                            site=site,
-                            ptm_type=ptm_type,
-                            pmid=pmid,
-                            title=ft_data.get("title", ""),
-                            snippet=snippet,
-                            confidence=0.9,  # Full-text match is high confidence
-                            antibody_info=ab_info,
-                            year="",
-                        )
-                        evidence.append(ev)
-
-                return evidence
-
-        except Exception as e:
-            logger.warning(f"PMC search failed for {protein} {site}: {e}")
+        if not pmids:
             return []
 
+        # Step 2: Fetch full-text for each PMID
+        site_pattern = _protein_site_pattern(protein, site)
+        evidence = []
+        for pmid in pmids[:3]:  # Limit to 3 for performance
+            ft_resp = await client.get(
+                f"{self.mcp_url}/tools/pmc/fulltext/{pmid}",
+                timeout=30,
+            )
+            ft_resp.raise_for_status()
+
+            ft_data = orjson.loads(ft_resp.content)
+            fulltext = ft_data.get("fulltext", "")
+            if not fulltext:
+                continue
+
+            # More precise matching in full text
+            match = site_pattern.search(fulltext)
+
+            if match:
+                ab_info = extract_antibody_info(fulltext, protein)
+                snippet = match.group(0)[:200]
+
+                ev = PTMEvidence(
+                    source="pmc",
+                    protein=protein,
+                    site=site,
+                    ptm_type=ptm_type,
+                    pmid=pmid,
+                    title=ft_data.get("title", ""),
+                    snippet=snippet,
+                    confidence=0.9,  # Full-text match is high confidence
+                    antibody_info=ab_info,
+                    year="",
+                )
+                evidence.append(ev)
+
+        return evidence
+
     async def _search_iptmnet(
-        self, protein: str, site: str, ptm_type: str,
+        self, protein: str, site: str, ptm_type: str, client: httpx.AsyncClient,
     ) -> List[PTMEvidence]:
         """Search iPTMnet for known PTM annotations via MCP /tools/iptmnet."""
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(
-                    f"{self.mcp_url}/tools/iptmnet/{protein}",
-                    params={"position": site, "organism": "Mouse"},
-                )
-                if resp.status_code != 200:
-                    return []
-
-                data = resp.json()
-                sites_found = data.get("sites_found", 0)
-                novelty_info = data.get("novelty") or {}
-
-                evidence = []
-                if sites_found > 0:
-                    status = novelty_info.get("status", "NOVEL")
-                    pmids = novelty_info.get("pmids", [])
-
-                    ev = PTMEvidence(
-                        source="iptmnet",
-                        protein=protein,
-                        site=site,
-                        ptm_type=ptm_type,
-                        pmid=pmids[0] if pmids else "",
-                        title=f"iPTMnet: {protein} {site} — {status}",
-                        snippet=(
-                            f"Status: {status}, "
-                            f"Sources: {novelty_info.get('source_count', 0)}, "
-                            f"PMIDs: {len(pmids)}"
-                        ),
-                        confidence=0.95 if status != "NOVEL" else 0.1,
-                    )
-                    evidence.append(ev)
-
-                return evidence
+        resp = await client.get(
+            f"{self.mcp_url}/tools/iptmnet/{protein}",
+            params={"position": site, "organism": "Mouse"},
+        )
+        resp.raise_for_status()
+
+        data = orjson.loads(resp.content)
+        sites_found = data.get("sites_found", 0)
+        novelty_info = data.get("novelty") or {}
+
+        evidence = []
+        if sites_found > 0:
+            status = novelty_info.get("status", "NOVEL")
+            pmids = novelty_info.get("pmids", [])
+
+            ev = PTMEvidence(
+                source="iptmnet",
+                protein=protein,
+                site=site,
+                ptm_type=ptm_type,
+                pmid=pmids[0] if pmids else "",
+                title=f"iPTMnet: {protein} {site} — {status}",
+                snippet=(
+                    f"Status: {status}, "
+                    f"Sources: {novelty_info.get('source_count', 0)}, "
+                    f"PMIDs: {len(pmids)}"
+                ),
+                confidence=0.95 if status != "NOVEL" else 0.1,
+            )
+            evidence.append(ev)
 
-        except Exception as e:
-            logger.warning(f"iPTMnet search failed for {protein} {site}: {e}")
-            return []
+        return evidence
 
     # -----------------------------------------------------------------------
     # Helper methods
     # -----------------------------------------------------------------------
 
-    @staticmethod
-    def _sites_match(query_site: str, db_site: str) -> bool:
-        """
-        Check if two PTM sites match.
-        Handles formats: S473, Ser473, pS473, phospho-Ser473
-        Also allows nearby positions (within +/-2 residues) for fuzzy matching.
-        """
-        def _parse_site(s: str):
-            m = re.match(r"(?:p(?:hospho)?-?)?\s*([STY](?:er|hr|yr)?)\s*(\d+)", s, re.IGNORECASE)
-            if m:
-                aa = m.group(1)[0].upper()
-                pos = int(m.group(2))
-                return aa, pos
-            return None, None
-
-        q_aa, q_pos = _parse_site(query_site)
-        d_aa, d_pos = _parse_site(db_site)
-
-        if q_aa is None or d_aa is None:
-            return query_site.lower() == db_site.lower()
-
-        # Exact match
-        if q_aa == d_aa and q_pos == d_pos:
-            return True
-
-        # Fuzzy match: same amino acid, position within +/-2
-        if q_aa == d_aa and abs(q_pos - d_pos) <= 2:
-            return True
-
-        return False
+    _sites_match = staticmethod(_sites_match)
 
     @staticmethod
     def _calculate_novelty(result: CrossSiteResult) -> float:
@@ -435,21 +592,12 @@ class CrossSitePTMSearcher:
         if not result.evidence:
             return 1.0  # No evidence = novel
 
-        # Weight by source reliability
-        source_weights = {
-            "iptmnet": 0.3,
-            "pubmed": 0.2,
-            "pmc": 0.15,
-            "uniprot": 0.3,
-        }
-
-        known_score = 0.0
-        for ev in result.evidence:
-            weight = source_weights.get(ev.source, 0.1)
-            known_score += weight * ev.confidence
-
-        # Cap at 1.0
-        known_score = min(known_score, 1.0)
+        # Weight by source reliability, capped at 1.0
+        weight = _SOURCE_WEIGHTS.get
+        known_score = min(
+            sum(weight(ev.source, 0.1) * ev.confidence for ev in result.evidence),
+            1.0,
+        )
 
         return round(1.0 - known_score, 3)
 
@@ -463,19 +611,19 @@ class CrossSitePTMSearcher:
             )
 
         sources = ", ".join(result.databases_found)
-        summary = (
+        parts = [
             f"**Known PTM**: {result.protein} {result.site} ({result.ptm_type}) — "
             f"Found in {result.evidence_count} source(s) ({sources}). "
             f"Novelty score: {result.novelty_score:.2f}."
-        )
+        ]
 
         if result.antibody_validated:
-            summary += " Antibody validation evidence available."
+            parts.append(" Antibody validation evidence available.")
 
         # Top evidence
-        top = sorted(result.evidence, key=lambda e: e.confidence, reverse=True)[:3]
+        top = heapq.nlargest(3, result.evidence, key=lambda e: e.confidence)
         for ev in top:
             if ev.title:
-                summary += f"\n  - [{ev.source}] {ev.title[:80]}"
+                parts.append(f"\n  - [{ev.source}] {ev.title[:80]}")
 
-        return summary
+        return "".join(parts)
@@ -14,13 +14,22 @@ Changes from original:
   - TypeScript → Python
 """
 
+import dataclasses
+import hashlib
 import logging
 import math
+import os
 import re
-from typing import Callable, Dict, List, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+import orjson
 import pandas as pd
 
+from common.disk_cache import open_cache
 from common.llm_client import LLMClient
 from common.mcp_client import MCPClient
 from common.local_data_loader import HPALocalLoader, GTExLocalLoader
@@ -40,6 +49,55 @@ PTM_HIGH = 2.0       # Strong PTM change threshold (|Log2FC| > 2.0 = 4x fold cha
 PTM_LOW = 0.5        # Minimal PTM change threshold (|Log2FC| <= 0.5 = <1.4x fold change)
 PROTEIN_CHANGE = 0.5  # Protein change threshold (|Log2FC| > 0.5 = >1.4x fold change)
 
+# (level, short_label, significance) in rule order; the last entry is the default
+_PTM_CATEGORIES = [
+    ("PTM-driven hyperactivation", "PTM-driven ↑↑", "High"),
+    ("PTM-driven inactivation", "PTM-driven ↓↓", "High"),
+    ("Compensatory PTM hyperactivation", "Compensatory ↑↑", "High"),
+    ("Coupled activation", "Coupled ↑", "Moderate"),
+    ("Coupled shutdown", "Coupled ↓", "Moderate"),
+    ("Desensitization-like pattern", "Desensitization", "Moderate"),
+    ("Expression-driven change", "Expression-driven", "Low"),
+    ("Baseline / low-change state", "Baseline", "Low"),
+]
+
+# Number of PTMs enriched concurrently
+RAG_CONCURRENCY = int(os.getenv("RAG_CONCURRENCY", "8"))
+# LLM calls in flight across all PTMs; providers rate-limit tighter than MCP,
+# so RAG_CONCURRENCY can be raised for lookups without flooding the LLM
+RAG_LLM_CONCURRENCY = int(os.getenv("RAG_LLM_CONCURRENCY", "4"))
+# Persistent cache of LLM analyses keyed by their inputs; set RAG_LLM_CACHE_DIR="" to disable
+RAG_LLM_CACHE_DIR = os.getenv("RAG_LLM_CACHE_DIR", str(Path.home() / ".cache" / "ptm_rag_llm"))
+RAG_LLM_CACHE_TTL = 30 * 86400
+# Threads per PTM: enough for all 13 lookup/analysis tasks minus PubMed, so
+# article-dependent analyses never queue behind slow database lookups
+_PER_PTM_WORKERS = 12
+
+# Top-ranked abstracts per PTM sent to the LLM for per-article analysis
+_LLM_ABSTRACTS_PER_PTM = 5
+# Analyzer result fields copied from the request rather than produced by the LLM
+_LLM_IDENTITY_FIELDS = frozenset({"pmid", "gene", "position", "ptm_type"})
+
+# Article text fields that repeat across PTMs (same paper found for several
+# sites of a gene, same journal); one string object per distinct value is kept
+_SHARED_ARTICLE_FIELDS = ("title", "abstract", "journal", "pub_date")
+
+# Context keyword extraction
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
+    "been", "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "should", "could", "may", "might", "must", "can", "cell",
+    "cells", "tissue", "tissues", "type", "types", "what", "which", "how",
+})
+# Alphanumeric runs of 4+ characters in lower-cased text that are neither a
+# stopword nor all digits; the filtering happens inside the regex scan
+_KEYWORD_PATTERN = re.compile(
+    r"(?<![a-z0-9])(?!(?:%s|[0-9]+)(?![a-z0-9]))[a-z0-9]{4,}(?![a-z0-9])"
+    % "|".join(sorted((w for w in _STOPWORDS if len(w) > 3), key=len, reverse=True))
+)
+
+
 class RAGEnrichmentPipeline:
     """Enriches PTM vector data with literature search and pattern-based analysis."""
     def __init__(
@@ -52,23 +110,53 @@ class RAGEnrichmentPipeline:
         rag_llm_model: Optional[str] = None,
         llm_provider: str = "ollama",
         llm_model: Optional[str] = None,
+        max_concurrency: int = RAG_CONCURRENCY,
+        llm_concurrency: int = RAG_LLM_CONCURRENCY,
     ):
         self.mcp = mcp_client
+        self.max_concurrency = max(1, max_concurrency)
+        self.llm_concurrency = max(1, llm_concurrency)
+        # Per-run gene/protein lookups prefetched through the MCP batch endpoints
+        self._kegg_cache: Dict[str, dict] = {}
+        self._string_cache: Dict[str, dict] = {}
+        self._uniprot_cache: Dict[str, dict] = {}
+        self._biogrid_cache: Dict[str, dict] = {}
+        # Per-run local HPA/GTEx results, read in one pass over the data files
+        self._hpa_local: Dict[str, Optional[dict]] = {}
+        self._gtex_local: Dict[str, Optional[dict]] = {}
+        # Per-run canonical copies of repeated article strings
+        self._article_strings: Dict[str, str] = {}
+        # HPA/GTEx results per gene; concurrent PTMs on one gene share a single load
+        self._hpa_cache: Dict[str, Future] = {}
+        self._gtex_cache: Dict[str, Future] = {}
+        # Per-run lookup/analysis results per (gene, position, ptm_type, protein_id),
+        # so repeated sites (e.g. one row per condition) are looked up once
+        self._site_lookups: Dict[Tuple[str, str, str, str], Future] = {}
+        self._single_flight_lock = threading.Lock()
         self.reg_extractor = RegulationExtractor()
         self._progress = progress_callback or (lambda p, m: None)
         # LLM-based analysis modules (restored from original)
         self.enable_llm = enable_llm_analysis
         self.enable_fulltext = enable_fulltext
         self.enable_ptm_validation = enable_ptm_validation
+        self._llm_cache = None
         if enable_llm_analysis:
             # Use rag_llm_model if specified, otherwise fall back to llm_model
             effective_model = rag_llm_model or llm_model
-            llm = LLMClient(provider=llm_provider, model=effective_model) if effective_model else LLMClient(provider=llm_provider)
+            # One client for every analyzer, so llm_concurrency caps requests across all PTMs
+            llm_kwargs = {"model": effective_model} if effective_model else {}
+            llm = LLMClient(provider=llm_provider, max_concurrent=self.llm_concurrency, **llm_kwargs)
             if not llm.is_available():
                 logger.warning("No LLM provider available — disabling LLM analysis")
                 self.enable_llm = False
             else:
                 logger.info(f"LLM initialized: provider={llm.provider}, model={llm.model}")
+                self._llm_id = f"{llm.provider}/{llm.model}"
+                if RAG_LLM_CACHE_DIR:
+                    try:
+                        self._llm_cache = open_cache(os.path.expanduser(RAG_LLM_CACHE_DIR))
+                    except Exception as e:
+                        logger.warning(f"LLM result cache unavailable at {RAG_LLM_CACHE_DIR}: {e}")
                 self.abstract_analyzer = AbstractAnalyzer(llm_client=llm)
                 self.kinase_predictor = LLMKinasePredictor(llm_client=llm)
                 self.functional_impact = LLMFunctionalImpact(llm_client=llm)
@@ -103,6 +191,42 @@ class RAGEnrichmentPipeline:
         Returns:
             Enriched PTM list with added rag_enrichment field.
         """
+        return list(self.iter_enriched(ptm_data, experimental_context))
+
+    def write_enriched_jsonl(
+        self,
+        path: Union[str, Path],
+        ptm_data: List[dict],
+        experimental_context: Optional[dict] = None,
+    ) -> int:
+        """
+        Enrich ptm_data and write one JSON line per PTM, in input order.
+        Enrichment happens in place on the input dicts, so each PTM's
+        rag_enrichment is removed again once written; memory stays bounded
+        by iter_enriched's window. Returns the number of lines written.
+        """
+        written = 0
+        with open(path, "wb") as f:
+            for result in self.iter_enriched(ptm_data, experimental_context):
+                f.write(orjson.dumps(
+                    result, default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+                ))
+                result.pop("rag_enrichment", None)
+                written += 1
+        return written
+
+    def iter_enriched(
+        self,
+        ptm_data: List[dict],
+        experimental_context: Optional[dict] = None,
+    ) -> Iterator[dict]:
+        """
+        Like enrich_ptm_data, but yield each enriched PTM in input order as soon
+        as it and all PTMs before it are done. At most 2 * max_concurrency PTMs
+        are in flight or buffered at a time, so callers that write results out
+        as they arrive never hold the whole enriched dataset.
+        """
         total = len(ptm_data)
         logger.info(f"RAG enrichment: processing {total} PTM entries")
 
@@ -138,178 +262,353 @@ class RAGEnrichmentPipeline:
         context_keywords = self._extract_context_keywords(experimental_context)
         logger.info(f"Context keywords: {context_keywords}")
 
-        enriched = []
         stats = {"success": 0, "failed": 0, "total_articles": 0, "total_pathways": 0}
-        for i, ptm in enumerate(ptm_data):
-            gene = ptm.get("gene") or ptm.get("Gene.Name", "?")
-            pos = ptm.get("position") or ptm.get("PTM_Position", "?")
-            self._progress(i / total, f"Enriching {gene} {pos}")
-
-            try:
-                result = self._enrich_single_ptm(ptm, context_keywords, experimental_context)
-                enriched.append(result)
-                stats["success"] += 1
-                enr = result.get("rag_enrichment", {})
-                stats["total_articles"] += enr.get("search_summary", {}).get("total_articles", 0)
-                stats["total_pathways"] += len(enr.get("pathways", []))
-            except Exception as e:
-                logger.error(f"Enrichment FAILED for {gene}/{pos}: {e}", exc_info=True)
-                ptm_log2fc = ptm.get("ptm_relative_log2fc") or ptm.get("PTM_Relative_Log2FC", 0)
-                protein_log2fc = ptm.get("protein_log2fc") or ptm.get("Protein_Log2FC", 0)
-                ptm["rag_enrichment"] = self._empty_enrichment(ptm_log2fc, protein_log2fc)
-                enriched.append(ptm)
-                stats["failed"] += 1
+        self._progress(0.0, f"Enriching {total} PTMs")
+        # Resolve the dual column names (e.g. gene / Gene.Name) once per PTM
+        identities = [self._ptm_identity(ptm) for ptm in ptm_data]
+        species = self._context_species(experimental_context)
+        self._prefetch_gene_lookups(identities, species)
+        classifications = self._classify_ptm_8cat_batch([self._log2fc_pair(ptm) for ptm in ptm_data])
+        window = 2 * self.max_concurrency
+        pending: Dict[Future, int] = {}
+        ready: Dict[int, dict] = {}
+        next_submit = next_yield = done = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, total))) as executor:
+                while next_yield < total:
+                    while next_submit < total and len(pending) + len(ready) < window:
+                        future = executor.submit(
+                            self._enrich_or_empty, ptm_data[next_submit], context_keywords,
+                            experimental_context, classifications[next_submit], identities[next_submit],
+                            species,
+                        )
+                        pending[future] = next_submit
+                        next_submit += 1
+
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        result, ok = future.result()
+                        ready[pending.pop(future)] = result
+                        done += 1
+                        if ok:
+                            stats["success"] += 1
+                            enr = result.get("rag_enrichment", {})
+                            stats["total_articles"] += enr.get("search_summary", {}).get("total_articles", 0)
+                            stats["total_pathways"] += len(enr.get("pathways", []))
+                        else:
+                            stats["failed"] += 1
+                        gene = result.get("gene") or result.get("Gene.Name", "?")
+                        pos = result.get("position") or result.get("PTM_Position", "?")
+                        self._progress(done / total, f"Enriched {gene} {pos} ({done}/{total})")
+
+                    while next_yield in ready:
+                        yield ready.pop(next_yield)
+                        next_yield += 1
+        finally:
+            self._kegg_cache, self._string_cache, self._uniprot_cache = {}, {}, {}
+            self._biogrid_cache = {}
+            self._site_lookups = {}
+            self._hpa_local, self._gtex_local = {}, {}
+            self._article_strings = {}
 
         logger.info(
             f"Enrichment complete: {stats['success']} OK, {stats['failed']} failed, "
             f"total articles={stats['total_articles']}, total pathways={stats['total_pathways']}"
         )
-        self._progress(1.0, f"Enrichment complete: {len(enriched)} PTMs")
-        return enriched
+        self._progress(1.0, f"Enrichment complete: {total} PTMs")
+
+    def _prefetch_gene_lookups(self, identities: List[Tuple[str, str, str, str]], species: str) -> None:
+        """
+        Query KEGG, STRING-DB, BioGRID and UniProt once per unique gene /
+        protein via the MCP batch endpoints, and HPA/GTEx from the local data
+        files in a single pass each. PTMs missing from the results fall back
+        to per-PTM queries in _enrich_single_ptm.
+        """
+        genes = sorted({gene for gene, _, _, _ in identities})
+        protein_ids = sorted({pid for _, _, _, pid in identities if pid})
+        logger.info(f"Prefetching lookups for {len(genes)} genes, {len(protein_ids)} proteins")
+        try:
+            self._kegg_cache = self.mcp.fetch_kegg_parallel(genes)
+        except Exception as e:
+            logger.warning(f"KEGG prefetch failed: {e}")
+        try:
+            self._string_cache = self.mcp.fetch_stringdb_parallel(genes, species=species)
+        except Exception as e:
+            logger.warning(f"STRING-DB prefetch failed: {e}")
+        try:
+            self._biogrid_cache = self.mcp.fetch_biogrid_parallel(genes)
+        except Exception as e:
+            logger.warning(f"BioGRID prefetch failed: {e}")
+        if protein_ids:
+            try:
+                self._uniprot_cache = self.mcp.fetch_uniprot_parallel(protein_ids)
+            except Exception as e:
+                logger.warning(f"UniProt prefetch failed: {e}")
+
+        # Genes already loaded by an earlier run are served from _hpa_cache/_gtex_cache
+        if HPALocalLoader.is_available():
+            try:
+                self._hpa_local = HPALocalLoader.query_many(g for g in genes if g not in self._hpa_cache)
+            except Exception as e:
+                logger.warning(f"HPA local prefetch failed: {e}")
+        if GTExLocalLoader.is_available():
+            try:
+                self._gtex_local = GTExLocalLoader.query_many(g for g in genes if g not in self._gtex_cache)
+            except Exception as e:
+                logger.warning(f"GTEx local prefetch failed: {e}")
+
+    def _share_article_strings(self, articles: List[dict]) -> None:
+        """
+        Point equal article strings at one shared object. Every enriched PTM
+        keeps its articles until the report is written, and the same papers
+        recur across sites of a gene, so this bounds memory by distinct text.
+        """
+        shared = self._article_strings
+        for article in articles:
+            for key in _SHARED_ARTICLE_FIELDS:
+                value = article.get(key)
+                if isinstance(value, str) and value:
+                    article[key] = shared.setdefault(value, value)
+
+    @staticmethod
+    def _context_species(context: Optional[dict]) -> str:
+        """STRING-DB species for the experiment: context "organism", else "species"."""
+        if not context:
+            return ""
+        return context.get("organism") or context.get("species", "")
+
+    def _enrich_or_empty(
+        self, ptm: dict, context_keywords: List[str], context: Optional[dict],
+        classification: Optional[dict] = None, identity: Optional[Tuple[str, str, str, str]] = None,
+        species: Optional[str] = None,
+    ) -> Tuple[dict, bool]:
+        """Enrich one PTM; on failure attach an empty enrichment. Returns (ptm, succeeded)."""
+        try:
+            return self._enrich_single_ptm(ptm, context_keywords, context, classification, identity, species), True
+        except Exception as e:
+            gene = ptm.get("gene") or ptm.get("Gene.Name", "?")
+            pos = ptm.get("position") or ptm.get("PTM_Position", "?")
+            logger.error(f"Enrichment FAILED for {gene}/{pos}: {e}", exc_info=True)
+            ptm_log2fc = ptm.get("ptm_relative_log2fc") or ptm.get("PTM_Relative_Log2FC", 0)
+            protein_log2fc = ptm.get("protein_log2fc") or ptm.get("Protein_Log2FC", 0)
+            ptm["rag_enrichment"] = self._empty_enrichment(ptm_log2fc, protein_log2fc)
+            return ptm, False
 
     def _enrich_single_ptm(
-        self, ptm: dict, context_keywords: List[str], context: Optional[dict]
+        self, ptm: dict, context_keywords: List[str], context: Optional[dict],
+        classification: Optional[dict] = None, identity: Optional[Tuple[str, str, str, str]] = None,
+        species: Optional[str] = None,
     ) -> dict:
-        gene = ptm.get("gene") or ptm.get("Gene.Name", "Unknown")
-        position = ptm.get("position") or ptm.get("PTM_Position", "Unknown")
-        ptm_type = ptm.get("ptm_type") or ptm.get("PTM_Type", "Phosphorylation")
-        species = (context or {}).get("organism") or (context or {}).get("species", "")
+        gene, position, ptm_type, protein_id = identity or self._ptm_identity(ptm)
+        if species is None:
+            species = self._context_species(context)
 
         # 1. PubMed search via MCP
-        search_result = {}
-        articles = []
-        try:
-            search_result = self.mcp.search_pubmed(
-                gene=gene, position=position, ptm_type=ptm_type,
-                context_keywords=context_keywords, max_results=15,
-            )
-            articles = search_result.get("articles", [])
-            logger.info(f"PubMed search for {gene} {position}: {len(articles)} articles found")
-        except Exception as e:
-            logger.warning(f"PubMed search failed for {gene} {position}: {e}")
+        def fetch_pubmed():
+            search_result, articles = {}, []
+            try:
+                search_result = self.mcp.search_pubmed(
+                    gene=gene, position=position, ptm_type=ptm_type,
+                    context_keywords=context_keywords, max_results=15,
+                )
+                articles = search_result.get("articles", [])
+                self._share_article_strings(articles)
+                logger.info(f"PubMed search for {gene} {position}: {len(articles)} articles found")
+            except Exception as e:
+                logger.warning(f"PubMed search failed for {gene} {position}: {e}")
+            return search_result, articles
 
         # 2. Pattern-based regulation extraction
-        regulation = {"upstream_regulators": [], "downstream_targets": [], "kinase_substrate": [], "regulation_evidence": [], "diseases": []}
-        try:
-            regulation = self.reg_extractor.extract_from_articles(articles, gene, position)
-        except Exception as e:
-            logger.warning(f"Regulation extraction failed for {gene}: {e}")
+        def extract_regulation(articles):
+            try:
+                return self.reg_extractor.extract_from_articles(articles, gene, position)
+            except Exception as e:
+                logger.warning(f"Regulation extraction failed for {gene}: {e}")
+                return {"upstream_regulators": [], "downstream_targets": [], "kinase_substrate": [], "regulation_evidence": [], "diseases": []}
 
         # 3. KEGG pathway info via MCP
-        kegg_info = {}
-        kegg_pathways = []
-        try:
-            kegg_info = self.mcp.query_kegg(gene)
-            kegg_pathways = kegg_info.get("pathways", [])
-            logger.debug(f"KEGG for {gene}: {len(kegg_pathways)} pathways")
-        except Exception as e:
-            logger.warning(f"KEGG query failed for {gene}: {e}")
+        def fetch_kegg():
+            try:
+                kegg_info = self._kegg_cache.get(gene) or self.mcp.query_kegg(gene)
+                kegg_pathways = kegg_info.get("pathways", [])
+                logger.debug(f"KEGG for {gene}: {len(kegg_pathways)} pathways")
+                return kegg_pathways
+            except Exception as e:
+                logger.warning(f"KEGG query failed for {gene}: {e}")
+                return []
 
         # 4. STRING-DB interactions via MCP
-        string_info = {}
-        interactions = []
-        try:
-            string_info = self.mcp.query_stringdb(gene, species=species)
-            interactions = string_info.get("interactions", [])
-            logger.debug(f"STRING-DB for {gene}: {len(interactions)} interactions")
-        except Exception as e:
-            logger.warning(f"STRING-DB query failed for {gene}: {e}")
+        def fetch_string():
+            try:
+                string_info = self._string_cache.get(gene) or self.mcp.query_stringdb(gene, species=species)
+                interactions = string_info.get("interactions", [])
+                logger.debug(f"STRING-DB for {gene}: {len(interactions)} interactions")
+                return interactions
+            except Exception as e:
+                logger.warning(f"STRING-DB query failed for {gene}: {e}")
+                return []
 
         # 5. UniProt info via MCP
-        protein_id = ptm.get("protein_id") or ptm.get("Protein.Group", "")
-        uniprot_info = {}
-        try:
-            if protein_id:
-                uniprot_info = self.mcp.query_uniprot(protein_id)
-                logger.debug(f"UniProt for {protein_id}: {'found' if uniprot_info else 'empty'}")
-        except Exception as e:
-            logger.warning(f"UniProt query failed for {protein_id}: {e}")
+        def fetch_uniprot():
+            uniprot_info = {}
+            try:
+                if protein_id:
+                    uniprot_info = self._uniprot_cache.get(protein_id) or self.mcp.query_uniprot(protein_id)
+                    logger.debug(f"UniProt for {protein_id}: {'found' if uniprot_info else 'empty'}")
+            except Exception as e:
+                logger.warning(f"UniProt query failed for {protein_id}: {e}")
+            return uniprot_info
 
         # 6. HPA (Human Protein Atlas) — LOCAL-FIRST with API fallback
-        hpa_data = {}
-        try:
-            hpa_data = self._query_hpa_local_first(gene)
-        except Exception as e:
-            logger.warning(f"HPA query failed for {gene}: {e}")
+        def fetch_hpa():
+            try:
+                return self._query_hpa_local_first(gene)
+            except Exception as e:
+                logger.warning(f"HPA query failed for {gene}: {e}")
+                return {}
 
         # 7. GTEx tissue expression — LOCAL-FIRST with API fallback
-        gtex_data = {}
-        try:
-            gtex_data = self._query_gtex_local_first(gene)
-        except Exception as e:
-            logger.warning(f"GTEx query failed for {gene}: {e}")
+        def fetch_gtex():
+            try:
+                return self._query_gtex_local_first(gene)
+            except Exception as e:
+                logger.warning(f"GTEx query failed for {gene}: {e}")
+                return {}
 
         # 8. BioGRID interactions via MCP
-        biogrid_data = {}
-        try:
-            biogrid_data = self.mcp.query_biogrid(gene)
-        except Exception as e:
-            logger.warning(f"BioGRID query failed for {gene}: {e}")
+        def fetch_biogrid():
+            try:
+                return self._biogrid_cache.get(gene) or self.mcp.query_biogrid(gene)
+            except Exception as e:
+                logger.warning(f"BioGRID query failed for {gene}: {e}")
+                return {}
 
         # 9. LLM-based abstract analysis (RESTORED)
-        abstract_analysis = {}
-        if self.enable_llm and articles:
+        def analyze_abstracts(articles):
+            if not (self.enable_llm and articles):
+                return {}
             try:
-                abstract_analysis = self.abstract_analyzer.analyze(
-                    articles=articles, gene=gene, position=position, ptm_type=ptm_type,
-                )
+                return self._analyze_abstracts(gene, position, ptm_type, articles, context)
             except Exception as e:
                 logger.warning(f"Abstract analysis failed for {gene}: {e}")
+                return {}
 
         # 10. LLM-based kinase prediction (RESTORED)
-        kinase_prediction = {}
-        if self.enable_llm:
+        def predict_kinases(articles):
+            if not (self.enable_llm and articles):
+                return {}
             try:
-                kinase_prediction = self.kinase_predictor.predict(
-                    gene=gene, site=position, ptm_type=ptm_type,
-                    context=context, articles=articles,
+                return self._cached_llm(
+                    "kinase", {"gene": gene, "site": position, "type": ptm_type, "pmids": self._pmids(articles),
+                               "context": context},
+                    lambda: self.kinase_predictor.predict(
+                        gene=gene, position=position, ptm_type=ptm_type,
+                        pubmed_articles=articles, experimental_context=context,
+                    ),
                 )
             except Exception as e:
                 logger.warning(f"Kinase prediction failed for {gene}: {e}")
+                return {}
 
         # 11. LLM-based functional impact analysis (RESTORED)
-        functional_impact = {}
-        if self.enable_llm:
+        def analyze_functional_impact(articles, kegg_pathways):
+            if not (self.enable_llm and (articles or kegg_pathways)):
+                return {}
             try:
                 pathway_names = [p.get("name", p) if isinstance(p, dict) else p for p in kegg_pathways]
-                functional_impact = self.functional_impact.analyze(
-                    gene=gene, site=position, ptm_type=ptm_type,
-                    articles=articles, pathways=pathway_names,
+                return self._cached_llm(
+                    "functional", {"gene": gene, "site": position, "type": ptm_type, "pmids": self._pmids(articles),
+                                   "pathways": pathway_names, "context": context},
+                    lambda: self.functional_impact.analyze(
+                        gene=gene, position=position, ptm_type=ptm_type,
+                        pubmed_articles=articles, kegg_pathways=pathway_names,
+                        experimental_context=context,
+                    ),
                 )
             except Exception as e:
                 logger.warning(f"Functional impact analysis failed for {gene}: {e}")
+                return {}
 
         # 12. Full-text analysis via PMC (RESTORED)
-        fulltext_results = {}
-        if self.enable_fulltext:
+        def analyze_fulltext(articles):
+            if not self.enable_fulltext:
+                return {}
             try:
-                fulltext_results = self._run_fulltext_analysis(
+                return self._run_fulltext_analysis(
                     gene=gene, position=position, ptm_type=ptm_type,
                     articles=articles,
                 )
             except Exception as e:
                 logger.warning(f"Full-text analysis failed for {gene}: {e}")
+                return {}
 
         # 13. PTM validation / novelty check (RESTORED)
-        validation_result = {}
-        if self.enable_ptm_validation:
+        def validate_ptm():
+            if not self.enable_ptm_validation:
+                return {}
             try:
-                validation_result = self.ptm_validator.validate(
+                return self.ptm_validator.validate(
                     gene=gene, site=position, ptm_type=ptm_type,
                 )
             except Exception as e:
                 logger.warning(f"PTM validation failed for {gene}: {e}")
+                return {}
+
+        def run_lookups(_key):
+            # Steps 1-13 are independent apart from their inputs: database lookups
+            # start at once, article-based analyses as soon as PubMed (and, for
+            # functional impact, KEGG) has answered.
+            with ThreadPoolExecutor(max_workers=_PER_PTM_WORKERS) as pool:
+                f_pubmed = pool.submit(fetch_pubmed)
+                f_kegg = pool.submit(fetch_kegg)
+                f_string = pool.submit(fetch_string)
+                f_uniprot = pool.submit(fetch_uniprot)
+                f_hpa = pool.submit(fetch_hpa)
+                f_gtex = pool.submit(fetch_gtex)
+                f_biogrid = pool.submit(fetch_biogrid)
+                f_validation = pool.submit(validate_ptm)
+
+                search_result, articles = f_pubmed.result()
+                f_regulation = pool.submit(extract_regulation, articles)
+                f_abstract = pool.submit(analyze_abstracts, articles)
+                f_kinase = pool.submit(predict_kinases, articles)
+                f_fulltext = pool.submit(analyze_fulltext, articles)
+                kegg_pathways = f_kegg.result()
+                f_functional = pool.submit(analyze_functional_impact, articles, kegg_pathways)
+
+                regulation = f_regulation.result()
+                interactions = f_string.result()
+                uniprot_info = f_uniprot.result()
+                hpa_data = f_hpa.result()
+                gtex_data = f_gtex.result()
+                biogrid_data = f_biogrid.result()
+                abstract_analysis = f_abstract.result()
+                kinase_prediction = f_kinase.result()
+                functional_impact = f_functional.result()
+                fulltext_results = f_fulltext.result()
+                validation_result = f_validation.result()
+            return (
+                search_result, articles, regulation, kegg_pathways, interactions, uniprot_info,
+                hpa_data, gtex_data, biogrid_data, abstract_analysis, kinase_prediction,
+                functional_impact, fulltext_results, validation_result,
+            )
+
+        # Context keywords and species are fixed for the run, so the site identity
+        # determines every lookup; duplicates reuse (or wait for) the first result
+        (
+            search_result, articles, regulation, kegg_pathways, interactions, uniprot_info,
+            hpa_data, gtex_data, biogrid_data, abstract_analysis, kinase_prediction,
+            functional_impact, fulltext_results, validation_result,
+        ) = self._single_flight(self._site_lookups, (gene, position, ptm_type, protein_id), run_lookups)
 
         # 14. Merge regulation (KEGG + PubMed patterns)
         upstream = regulation["upstream_regulators"]
         downstream = regulation["downstream_targets"]
 
         # 15. Classify PTM significance (8-category cell-signaling system)
-        ptm_log2fc_raw = ptm.get("PTM_Relative_Log2FC", ptm.get("ptm_relative_log2fc"))
-        protein_log2fc_raw = ptm.get("Protein_Log2FC", ptm.get("protein_log2fc"))
-        ptm_log2fc = ptm_log2fc_raw if ptm_log2fc_raw is not None else 0
-        protein_log2fc = protein_log2fc_raw if protein_log2fc_raw is not None else 0
-        classification = self._classify_ptm_8cat(ptm_log2fc, protein_log2fc)
+        ptm_log2fc, protein_log2fc = self._log2fc_pair(ptm)
+        if classification is None:
+            classification = self._classify_ptm_8cat(ptm_log2fc, protein_log2fc)
         logger.debug(
             f"Classification for {gene} {position}: ptm_fc={ptm_log2fc}, prot_fc={protein_log2fc} "
             f"→ {classification.get('level')} ({classification.get('significance')})"
@@ -340,8 +639,7 @@ class RAGEnrichmentPipeline:
                     "journal": a.get("journal", ""),
                     "pub_date": a.get("pub_date", ""),
                     "relevance_score": a.get("relevance_score", 0),
-                    "abstract_excerpt": (a.get("abstract") or "")[:300],
-                    "abstract": a.get("abstract", ""),
+                    # Abstracts live only in "articles"; readers look them up by position/PMID
                     "authors": a.get("authors", []),
                     "doi": a.get("doi", ""),
                 }
@@ -404,11 +702,143 @@ class RAGEnrichmentPipeline:
         )
         return ptm
 
+    # ------------------------------------------------------------------
+    # LLM result cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _pmids(articles: List[dict]) -> List[str]:
+        return sorted(str(a.get("pmid", "")) for a in articles)
+
+    @staticmethod
+    def _llm_output(result: Any) -> dict:
+        """
+        Analyzer dataclass as a plain dict, or {} when the LLM produced nothing
+        (analyzers return a default instance on errors and unparsable replies).
+        """
+        output = dataclasses.asdict(result)
+        if any(value for key, value in output.items() if key not in _LLM_IDENTITY_FIELDS):
+            return output
+        return {}
+
+    def _llm_cache_key(self, kind: str, inputs: dict) -> Optional[str]:
+        if self._llm_cache is None:
+            return None
+        digest = hashlib.sha256(orjson.dumps(
+            [self._llm_id, inputs], default=str, option=orjson.OPT_SORT_KEYS,
+        )).hexdigest()
+        return f"{kind}:{digest}"
+
+    def _llm_cache_get(self, key: Optional[str]) -> Optional[dict]:
+        if key is None:
+            return None
+        try:
+            return self._llm_cache.get(key)
+        except Exception as e:
+            logger.debug(f"LLM cache read failed for {key}: {e}")
+            return None
+
+    def _llm_cache_set(self, key: Optional[str], output: dict) -> None:
+        # Empty results are not stored so failed analyses are retried
+        if key is None or not output:
+            return
+        try:
+            self._llm_cache.set(key, output, expire=RAG_LLM_CACHE_TTL)
+        except Exception as e:
+            logger.debug(f"LLM cache write failed for {key}: {e}")
+
+    def _cached_llm(self, kind: str, inputs: dict, analyze: Callable[[], Any]) -> dict:
+        """
+        Run an LLM analysis, reusing the stored result when the same model
+        already analyzed identical inputs. Returns the result as a dict.
+        """
+        key = self._llm_cache_key(kind, inputs)
+        cached = self._llm_cache_get(key)
+        if cached is not None:
+            return cached
+        output = self._llm_output(analyze())
+        self._llm_cache_set(key, output)
+        return output
+
+    def _analyze_abstracts(
+        self, gene: str, position: str, ptm_type: str, articles: List[dict], context: Optional[dict],
+    ) -> dict:
+        """
+        LLM analysis of the top-ranked abstracts, one request per article.
+        Results are cached per PMID; the remaining abstracts go out as one batch.
+        """
+        selected = [a for a in articles if a.get("abstract")][:_LLM_ABSTRACTS_PER_PTM]
+        outputs: List[Optional[dict]] = []
+        keys: List[Optional[str]] = []
+        pending: List[dict] = []
+        for article in selected:
+            pmid = str(article.get("pmid", ""))
+            key = self._llm_cache_key(
+                "abstract", {"gene": gene, "site": position, "type": ptm_type, "pmid": pmid, "context": context},
+            )
+            cached = self._llm_cache_get(key)
+            outputs.append(cached)
+            keys.append(key)
+            if cached is None:
+                pending.append({
+                    "pmid": pmid, "abstract": article["abstract"], "gene": gene, "position": position,
+                    "experimental_context": context,
+                })
+
+        if pending:
+            results = iter(self.abstract_analyzer.analyze_batch(pending, max_concurrency=self.llm_concurrency))
+            for i, output in enumerate(outputs):
+                if output is None:
+                    outputs[i] = self._llm_output(next(results))
+                    self._llm_cache_set(keys[i], outputs[i])
+
+        analyses = [output for output in outputs if output]
+        return {"analyses": analyses} if analyses else {}
+
     # ------------------------------------------------------------------
     # LOCAL-FIRST Data Access: HPA
     # ------------------------------------------------------------------
 
+    def _single_flight(
+        self, cache: Dict[Hashable, Future], key: Hashable, load: Callable[[Any], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return load(key) once per key; concurrent callers wait for the first load.
+        Results rejected by ``cacheable`` are handed to those callers but not kept.
+        """
+        with self._single_flight_lock:
+            future = cache.get(key)
+            owner = future is None
+            if owner:
+                future = cache[key] = Future()
+        if owner:
+            try:
+                result = load(key)
+            except BaseException as e:
+                # Don't cache failures; later PTMs retry the load
+                with self._single_flight_lock:
+                    cache.pop(key, None)
+                future.set_exception(e)
+            else:
+                if cacheable is not None and not cacheable(result):
+                    with self._single_flight_lock:
+                        cache.pop(key, None)
+                future.set_result(result)
+        return future.result()
+
+    @staticmethod
+    def _without_error(result: Optional[dict]) -> bool:
+        """False for the error dicts returned when an MCP lookup fails."""
+        return not (result or {}).get("error")
+
     def _query_hpa_local_first(self, gene: str) -> dict:
+        """HPA data for a gene, loaded once per pipeline instance."""
+        return self._single_flight(
+            self._hpa_cache, gene, self._load_hpa_local_first, cacheable=self._without_error,
+        )
+
+    def _load_hpa_local_first(self, gene: str) -> dict:
         """
         Query HPA data using local-first strategy:
         1. Try local TSV files (rna_tissue_hpa.tsv, subcellular_locations.tsv)
@@ -416,7 +846,7 @@ class RAGEnrichmentPipeline:
         """
         # Try local first
         if HPALocalLoader.is_available():
-            local_result = HPALocalLoader.query(gene)
+            local_result = self._hpa_local[gene] if gene in self._hpa_local else HPALocalLoader.query(gene)
             if local_result:
                 has_locations = bool(local_result.get("locations"))
                 has_tissue = bool(local_result.get("tissue_expression"))
@@ -445,6 +875,12 @@ class RAGEnrichmentPipeline:
     # ------------------------------------------------------------------
 
     def _query_gtex_local_first(self, gene: str) -> dict:
+        """GTEx data for a gene, loaded once per pipeline instance."""
+        return self._single_flight(
+            self._gtex_cache, gene, self._load_gtex_local_first, cacheable=self._without_error,
+        )
+
+    def _load_gtex_local_first(self, gene: str) -> dict:
         """
         Query GTEx data using local-first strategy:
         1. Try local GCT file (3.5GB expression matrix)
@@ -452,7 +888,7 @@ class RAGEnrichmentPipeline:
         """
         # Try local first
         if GTExLocalLoader.is_available():
-            local_result = GTExLocalLoader.query_expression(gene)
+            local_result = self._gtex_local[gene] if gene in self._gtex_local else GTExLocalLoader.query_expression(gene)
             if local_result and local_result.get("expressions"):
                 logger.info(f"GTEx local for {gene}: {len(local_result['expressions'])} tissues")
                 return local_result
@@ -484,56 +920,20 @@ class RAGEnrichmentPipeline:
         Fetches full-text from PMC when available, then applies pattern matching.
         """
         all_results = []
-
-        for article in articles[:5]:  # Limit to top 5 articles
-            pmid = article.get("pmid", "")
-            abstract = article.get("abstract", "")
-            pmc_id = article.get("pmc_id") or article.get("pmcid", "")
-
-            # Try to get full-text from PMC via MCP
-            fulltext = None
-            if pmc_id and hasattr(self.mcp, "fetch_pmc_fulltext"):
-                try:
-                    pmc_result = self.mcp.fetch_pmc_fulltext(pmc_id)
-                    fulltext = pmc_result.get("text") or pmc_result.get("fulltext")
-                except Exception as e:
-                    logger.debug(f"PMC full-text fetch failed for {pmc_id}: {e}")
-
-            if abstract or fulltext:
-                try:
-                    analysis = self.fulltext_analyzer.analyze(
-                        pmid=pmid,
-                        gene=gene,
-                        position=position,
-                        abstract=abstract,
-                        fulltext=fulltext,
-                    )
-                    all_results.append({
-                        "pmid": pmid,
-                        "has_fulltext": bool(fulltext),
-                        "total_matches": analysis.total_matches,
-                        "high_confidence_matches": analysis.high_confidence_matches,
-                        "key_findings": analysis.key_findings,
-                        "mechanisms": analysis.mechanisms,
-                        "antibody_info": [
-                            {
-                                "target": ab.target,
-                                "company": ab.company,
-                                "catalog": ab.catalog,
-                                "western_blot_validated": ab.western_blot_validated,
-                                "confidence": ab.confidence,
-                            }
-                            for ab in analysis.antibody_info
-                        ],
-                        "quantitative_data": analysis.quantitative_data,
-                        "pattern_summary": {
-                            cat: len(matches)
-                            for cat, matches in analysis.pattern_matches.items()
-                            if matches
-                        },
-                    })
-                except Exception as e:
-                    logger.warning(f"Full-text analysis failed for PMID {pmid}: {e}")
+        top_articles = articles[:5]  # Limit to top 5 articles
+        can_fetch = hasattr(self.mcp, "fetch_pmc_fulltext")
+
+        # Issue all PMC fetches up front; analyze in article order as they arrive
+        with ThreadPoolExecutor(max_workers=max(1, len(top_articles))) as pool:
+            fetches = []
+            for article in top_articles:
+                pmc_id = article.get("pmc_id") or article.get("pmcid", "")
+                fetches.append(pool.submit(self._fetch_pmc_text, pmc_id) if pmc_id and can_fetch else None)
+
+            for article, fetch in zip(top_articles, fetches):
+                self._analyze_article_text(
+                    article, fetch.result() if fetch else None, gene, position, all_results,
+                )
 
         # Aggregate results
         total_matches = sum(r.get("total_matches", 0) for r in all_results)
@@ -551,6 +951,57 @@ class RAGEnrichmentPipeline:
             "per_article": all_results,
         }
 
+    def _fetch_pmc_text(self, pmc_id: str) -> Optional[str]:
+        """Full text for a PMC article via MCP, or None if unavailable."""
+        try:
+            pmc_result = self.mcp.fetch_pmc_fulltext(pmc_id)
+            return pmc_result.get("text") or pmc_result.get("fulltext")
+        except Exception as e:
+            logger.debug(f"PMC full-text fetch failed for {pmc_id}: {e}")
+            return None
+
+    def _analyze_article_text(
+        self, article: dict, fulltext: Optional[str], gene: str, position: str, all_results: List[dict],
+    ) -> None:
+        """Pattern-analyze one article's abstract/full text and append its summary."""
+        pmid = article.get("pmid", "")
+        abstract = article.get("abstract", "")
+        if abstract or fulltext:
+            try:
+                analysis = self.fulltext_analyzer.analyze(
+                    pmid=pmid,
+                    gene=gene,
+                    position=position,
+                    abstract=abstract,
+                    fulltext=fulltext,
+                )
+                all_results.append({
+                    "pmid": pmid,
+                    "has_fulltext": bool(fulltext),
+                    "total_matches": analysis.total_matches,
+                    "high_confidence_matches": analysis.high_confidence_matches,
+                    "key_findings": analysis.key_findings,
+                    "mechanisms": analysis.mechanisms,
+                    "antibody_info": [
+                        {
+                            "target": ab.target,
+                            "company": ab.company,
+                            "catalog": ab.catalog,
+                            "western_blot_validated": ab.western_blot_validated,
+                            "confidence": ab.confidence,
+                        }
+                        for ab in analysis.antibody_info
+                    ],
+                    "quantitative_data": analysis.quantitative_data,
+                    "pattern_summary": {
+                        cat: len(matches)
+                        for cat, matches in analysis.pattern_matches.items()
+                        if matches
+                    },
+                })
+            except Exception as e:
+                logger.warning(f"Full-text analysis failed for PMID {pmid}: {e}")
+
     @staticmethod
     def _empty_enrichment(ptm_log2fc=0, protein_log2fc=0) -> dict:
         """Return empty enrichment with proper classification based on Log2FC values."""
@@ -590,43 +1041,62 @@ class RAGEnrichmentPipeline:
     # 8-Category Cell-Signaling Classification (v7.7.4)
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _ptm_identity(ptm: dict) -> Tuple[str, str, str, str]:
+        """(gene, position, ptm_type, protein_id) of a PTM entry, accepting either column naming."""
+        return (
+            ptm.get("gene") or ptm.get("Gene.Name", "Unknown"),
+            ptm.get("position") or ptm.get("PTM_Position", "Unknown"),
+            ptm.get("ptm_type") or ptm.get("PTM_Type", "Phosphorylation"),
+            ptm.get("protein_id") or ptm.get("Protein.Group", ""),
+        )
+
+    @staticmethod
+    def _log2fc_pair(ptm: dict) -> Tuple:
+        """Raw (PTM, protein) Log2FC values of a PTM entry, with missing values as 0."""
+        ptm_log2fc_raw = ptm.get("PTM_Relative_Log2FC", ptm.get("ptm_relative_log2fc"))
+        protein_log2fc_raw = ptm.get("Protein_Log2FC", ptm.get("protein_log2fc"))
+        ptm_log2fc = ptm_log2fc_raw if ptm_log2fc_raw is not None else 0
+        protein_log2fc = protein_log2fc_raw if protein_log2fc_raw is not None else 0
+        return ptm_log2fc, protein_log2fc
+
     @staticmethod
     def _classify_ptm_8cat(ptm_log2fc, protein_log2fc) -> dict:
         """Classify PTM based on Log2FC values using 8-category cell-signaling system."""
-        try:
-            ptm_fc = float(ptm_log2fc) if ptm_log2fc is not None else 0.0
-            prot_fc = float(protein_log2fc) if protein_log2fc is not None else 0.0
-        except (ValueError, TypeError) as e:
-            logger.warning(
-                f"Classification float conversion failed: ptm_log2fc={ptm_log2fc!r} "
-                f"(type={type(ptm_log2fc).__name__}), protein_log2fc={protein_log2fc!r} "
-                f"(type={type(protein_log2fc).__name__}), error={e}"
-            )
-            return {
-                "level": "Baseline / low-change state",
-                "short_label": "Baseline",
-                "significance": "Low",
-                "protein_context": None,
-            }
-
-        # Handle NaN values
-        if math.isnan(ptm_fc):
-            logger.warning(f"Classification: ptm_log2fc is NaN (original={ptm_log2fc!r})")
-            ptm_fc = 0.0
-        if math.isnan(prot_fc):
-            logger.warning(f"Classification: protein_log2fc is NaN (original={protein_log2fc!r})")
-            prot_fc = 0.0
-
-        # Determine protein context
-        if prot_fc > PROTEIN_CHANGE:
-            protein_context = "Up-regulated"
-        elif prot_fc < -PROTEIN_CHANGE:
-            protein_context = "Down-regulated"
-        else:
-            protein_context = "Unchanged"
+        return RAGEnrichmentPipeline._classify_ptm_8cat_batch([(ptm_log2fc, protein_log2fc)])[0]
 
-        ptm_abs = abs(ptm_fc)
-        protein_stable = -PROTEIN_CHANGE <= prot_fc <= PROTEIN_CHANGE
+    @staticmethod
+    def _classify_ptm_8cat_batch(log2fc_pairs: List[Tuple]) -> List[dict]:
+        """Classify many (ptm_log2fc, protein_log2fc) pairs in one vectorized pass."""
+        n = len(log2fc_pairs)
+        ptm_fc = np.zeros(n)
+        prot_fc = np.zeros(n)
+        valid = np.ones(n, dtype=bool)
+        for i, (ptm_log2fc, protein_log2fc) in enumerate(log2fc_pairs):
+            try:
+                p = float(ptm_log2fc) if ptm_log2fc is not None else 0.0
+                q = float(protein_log2fc) if protein_log2fc is not None else 0.0
+            except (ValueError, TypeError) as e:
+                logger.warning(
+                    f"Classification float conversion failed: ptm_log2fc={ptm_log2fc!r} "
+                    f"(type={type(ptm_log2fc).__name__}), protein_log2fc={protein_log2fc!r} "
+                    f"(type={type(protein_log2fc).__name__}), error={e}"
+                )
+                valid[i] = False
+                continue
+
+            # Handle NaN values
+            if math.isnan(p):
+                logger.warning(f"Classification: ptm_log2fc is NaN (original={ptm_log2fc!r})")
+                p = 0.0
+            if math.isnan(q):
+                logger.warning(f"Classification: protein_log2fc is NaN (original={protein_log2fc!r})")
+                q = 0.0
+            ptm_fc[i] = p
+            prot_fc[i] = q
+
+        ptm_abs = np.abs(ptm_fc)
+        protein_stable = (prot_fc >= -PROTEIN_CHANGE) & (prot_fc <= PROTEIN_CHANGE)
         protein_up = prot_fc > PROTEIN_CHANGE
         protein_down = prot_fc < -PROTEIN_CHANGE
         ptm_up = ptm_fc > PTM_LOW
@@ -634,45 +1104,37 @@ class RAGEnrichmentPipeline:
         ptm_high = ptm_abs > PTM_HIGH
         ptm_minimal = ptm_abs <= PTM_LOW
 
-        if ptm_high and ptm_fc > 0 and protein_stable:
-            level = "PTM-driven hyperactivation"
-            short_label = "PTM-driven ↑↑"
-            significance = "High"
-        elif ptm_high and ptm_fc < 0 and protein_stable:
-            level = "PTM-driven inactivation"
-            short_label = "PTM-driven ↓↓"
-            significance = "High"
-        elif ptm_high and ptm_fc > 0 and protein_down:
-            level = "Compensatory PTM hyperactivation"
-            short_label = "Compensatory ↑↑"
-            significance = "High"
-        elif ptm_up and protein_up:
-            level = "Coupled activation"
-            short_label = "Coupled ↑"
-            significance = "Moderate"
-        elif ptm_down and protein_down:
-            level = "Coupled shutdown"
-            short_label = "Coupled ↓"
-            significance = "Moderate"
-        elif ptm_down and protein_up:
-            level = "Desensitization-like pattern"
-            short_label = "Desensitization"
-            significance = "Moderate"
-        elif ptm_minimal and (protein_up or protein_down):
-            level = "Expression-driven change"
-            short_label = "Expression-driven"
-            significance = "Low"
-        else:
-            level = "Baseline / low-change state"
-            short_label = "Baseline"
-            significance = "Low"
-
-        return {
-            "level": level,
-            "short_label": short_label,
-            "significance": significance,
-            "protein_context": protein_context,
-        }
+        # Conditions in _PTM_CATEGORIES order; first match wins
+        category = np.select(
+            [
+                ptm_high & (ptm_fc > 0) & protein_stable,
+                ptm_high & (ptm_fc < 0) & protein_stable,
+                ptm_high & (ptm_fc > 0) & protein_down,
+                ptm_up & protein_up,
+                ptm_down & protein_down,
+                ptm_down & protein_up,
+                ptm_minimal & (protein_up | protein_down),
+            ],
+            np.arange(len(_PTM_CATEGORIES) - 1),
+            default=len(_PTM_CATEGORIES) - 1,
+        )
+        # Unconvertible inputs fall back to baseline with no protein context
+        category[~valid] = len(_PTM_CATEGORIES) - 1
+        protein_context = np.select(
+            [protein_up, protein_down], ["Up-regulated", "Down-regulated"], default="Unchanged",
+        ).astype(object)
+        protein_context[~valid] = None
+
+        results = []
+        for cat, context in zip(category.tolist(), protein_context.tolist()):
+            level, short_label, significance = _PTM_CATEGORIES[cat]
+            results.append({
+                "level": level,
+                "short_label": short_label,
+                "significance": significance,
+                "protein_context": context,
+            })
+        return results
 
     # ------------------------------------------------------------------
     # Trajectory (Time-Course) Data Extraction
@@ -692,31 +1154,36 @@ class RAGEnrichmentPipeline:
         timepoints_raw = ptm.get("timepoints") or ptm.get("time_course", [])
         if isinstance(timepoints_raw, list) and len(timepoints_raw) >= 2:
             timepoints = []
+            fcs = []  # ptmLog2FC per timepoint, collected while building
             for tp in timepoints_raw:
+                ptm_fc = float(tp.get("ptm_log2fc") or tp.get("ptmLog2FC", 0))
+                fcs.append(ptm_fc)
                 timepoints.append({
                     "timeLabel": tp.get("time_label") or tp.get("timeLabel", ""),
-                    "ptmLog2FC": float(tp.get("ptm_log2fc") or tp.get("ptmLog2FC", 0)),
+                    "ptmLog2FC": ptm_fc,
                     "proteinLog2FC": float(tp.get("protein_log2fc") or tp.get("proteinLog2FC", 0)),
                     "classification": tp.get("classification", ""),
                 })
 
             # Determine trend
             if len(timepoints) >= 2:
-                first_fc = timepoints[0]["ptmLog2FC"]
-                last_fc = timepoints[-1]["ptmLog2FC"]
-                peak_fc = max(tp["ptmLog2FC"] for tp in timepoints)
-                trough_fc = min(tp["ptmLog2FC"] for tp in timepoints)
+                first_fc = fcs[0]
+                last_fc = fcs[-1]
 
                 if last_fc > first_fc + 0.5:
                     trend = "increasing"
                 elif last_fc < first_fc - 0.5:
                     trend = "decreasing"
-                elif peak_fc > first_fc + 1.0 and last_fc < peak_fc - 0.5:
-                    trend = "transient_peak"
-                elif trough_fc < first_fc - 1.0 and last_fc > trough_fc + 0.5:
-                    trend = "transient_dip"
                 else:
-                    trend = "stable"
+                    # Peak/trough only matter when first and last are close
+                    peak_fc = max(fcs)
+                    trough_fc = min(fcs)
+                    if peak_fc > first_fc + 1.0 and last_fc < peak_fc - 0.5:
+                        trend = "transient_peak"
+                    elif trough_fc < first_fc - 1.0 and last_fc > trough_fc + 0.5:
+                        trend = "transient_dip"
+                    else:
+                        trend = "stable"
 
                 trajectory = {"timepoints": timepoints, "trend": trend}
 
@@ -769,12 +1236,4 @@ class RAGEnrichmentPipeline:
 
 def _extract_meaningful_words(text: str) -> List[str]:
     """Extract keywords from long text (biological_question, special_conditions)."""
-    stopwords = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
-        "been", "being", "have", "has", "had", "do", "does", "did", "will",
-        "would", "should", "could", "may", "might", "must", "can", "cell",
-        "cells", "tissue", "tissues", "type", "types", "what", "which", "how",
-    }
-    words = re.findall(r"[A-Za-z0-9]+", text.lower())
-    return [w for w in words if len(w) > 3 and w not in stopwords and not w.isdigit()]
+    return _KEYWORD_PATTERN.findall(text.lower())
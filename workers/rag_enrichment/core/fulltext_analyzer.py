@@ -199,6 +199,7 @@ CATALOG_PATTERN = re.compile(r"(?:#|Cat\.?\s*(?:No\.?)?\s*)(\d{3,6}\w?)")
 FOLD_CHANGE_PATTERN = re.compile(r"(\d+\.?\d*)\s*[-–]?\s*fold\s+(?:increase|decrease|change|higher|lower|more|less)", re.IGNORECASE)
 P_VALUE_PATTERN = re.compile(r"[pP]\s*[<>=≤≥]\s*(0?\.\d+(?:e[+-]?\d+)?)", re.IGNORECASE)
 SAMPLE_SIZE_PATTERN = re.compile(r"[nN]\s*=\s*(\d+)")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
 
 
 # ---------------------------------------------------------------------------
@@ -222,8 +223,13 @@ class FullTextAnalyzer:
         self._patterns: Dict[str, List[Tuple[str, int]]] = {}
         self._relationship_patterns: List[dict] = []
         self._patterns_source: str = "builtin"
+        # Compiled once here: with 350+ config patterns the re module's
+        # internal cache (512 entries) would otherwise recompile them per sentence
+        self._compiled_patterns: Dict[str, List[Tuple[str, re.Pattern, int]]] = {}
+        self._compiled_relationship_patterns: List[Tuple[str, re.Pattern, int, str]] = []
 
         self._load_patterns()
+        self._compile_patterns()
 
     def _load_patterns(self):
         """Load patterns from config files with built-in fallback."""
@@ -254,6 +260,33 @@ class FullTextAnalyzer:
                 f"FullTextAnalyzer: config files not available, using {sum(len(v) for v in BUILTIN_PATTERNS.values())} built-in patterns"
             )
 
+    def _compile_patterns(self):
+        """Compile loaded patterns; invalid ones are logged and skipped."""
+        for category, patterns in self._patterns.items():
+            compiled = []
+            for pattern_str, base_confidence in patterns:
+                try:
+                    compiled.append((pattern_str, re.compile(pattern_str, re.IGNORECASE), base_confidence))
+                except re.error as e:
+                    logger.debug(f"Invalid regex pattern '{pattern_str}': {e}")
+            self._compiled_patterns[category] = compiled
+
+        for rel_pattern in self._relationship_patterns:
+            pattern_str = rel_pattern.get("pattern") or rel_pattern.get("regex", "")
+            if not pattern_str:
+                continue
+
+            confidence = rel_pattern.get("confidence", 60)
+            rel_type = rel_pattern.get("type", "relationship")
+            category = f"relationship_{rel_type}" if not rel_type.startswith("relationship") else rel_type
+
+            try:
+                compiled = re.compile(pattern_str, re.IGNORECASE)
+            except re.error as e:
+                logger.debug(f"Invalid relationship pattern '{pattern_str}': {e}")
+                continue
+            self._compiled_relationship_patterns.append((pattern_str, compiled, confidence, category))
+
     def analyze(
         self,
         pmid: str,
@@ -324,7 +357,7 @@ class FullTextAnalyzer:
         if not text:
             return
 
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         gene_lower = gene.lower()
         pos_lower = position.lower()
 
@@ -334,32 +367,29 @@ class FullTextAnalyzer:
             if gene_lower not in sent_lower and pos_lower not in sent_lower:
                 continue
 
-            for category, patterns in self._patterns.items():
-                for pattern_str, base_confidence in patterns:
-                    try:
-                        for m in re.finditer(pattern_str, sentence, re.IGNORECASE):
-                            # Boost confidence if position is mentioned
-                            confidence = base_confidence
-                            if pos_lower in sent_lower:
-                                confidence = min(confidence + 15, 100)
-
-                            match_obj = PatternMatch(
-                                pattern=pattern_str,
-                                category=category,
-                                matched_text=m.group(0),
-                                context=sentence[:300],
-                                sentence=sentence,
-                                pmid=result.pmid,
-                                source=source,
-                                confidence=confidence,
-                                position=m.start(),
-                            )
-
-                            if category not in result.pattern_matches:
-                                result.pattern_matches[category] = []
-                            result.pattern_matches[category].append(match_obj)
-                    except re.error as e:
-                        logger.debug(f"Invalid regex pattern '{pattern_str}': {e}")
+            for category, patterns in self._compiled_patterns.items():
+                for pattern_str, pattern, base_confidence in patterns:
+                    for m in pattern.finditer(sentence):
+                        # Boost confidence if position is mentioned
+                        confidence = base_confidence
+                        if pos_lower in sent_lower:
+                            confidence = min(confidence + 15, 100)
+
+                        match_obj = PatternMatch(
+                            pattern=pattern_str,
+                            category=category,
+                            matched_text=m.group(0),
+                            context=sentence[:300],
+                            sentence=sentence,
+                            pmid=result.pmid,
+                            source=source,
+                            confidence=confidence,
+                            position=m.start(),
+                        )
+
+                        if category not in result.pattern_matches:
+                            result.pattern_matches[category] = []
+                        result.pattern_matches[category].append(match_obj)
 
     def _match_relationship_patterns(
         self,
@@ -372,7 +402,7 @@ class FullTextAnalyzer:
         if not text or not self._relationship_patterns:
             return
 
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         gene_lower = gene.lower()
 
         for sentence in sentences:
@@ -380,34 +410,23 @@ class FullTextAnalyzer:
             if gene_lower not in sent_lower:
                 continue
 
-            for rel_pattern in self._relationship_patterns:
-                pattern_str = rel_pattern.get("pattern") or rel_pattern.get("regex", "")
-                if not pattern_str:
-                    continue
-
-                confidence = rel_pattern.get("confidence", 60)
-                rel_type = rel_pattern.get("type", "relationship")
-                category = f"relationship_{rel_type}" if not rel_type.startswith("relationship") else rel_type
-
-                try:
-                    for m in re.finditer(pattern_str, sentence, re.IGNORECASE):
-                        match_obj = PatternMatch(
-                            pattern=pattern_str,
-                            category=category,
-                            matched_text=m.group(0),
-                            context=sentence[:300],
-                            sentence=sentence,
-                            pmid=result.pmid,
-                            source="relationship_pattern",
-                            confidence=confidence,
-                            position=m.start(),
-                        )
-
-                        if category not in result.pattern_matches:
-                            result.pattern_matches[category] = []
-                        result.pattern_matches[category].append(match_obj)
-                except re.error as e:
-                    logger.debug(f"Invalid relationship pattern '{pattern_str}': {e}")
+            for pattern_str, pattern, confidence, category in self._compiled_relationship_patterns:
+                for m in pattern.finditer(sentence):
+                    match_obj = PatternMatch(
+                        pattern=pattern_str,
+                        category=category,
+                        matched_text=m.group(0),
+                        context=sentence[:300],
+                        sentence=sentence,
+                        pmid=result.pmid,
+                        source="relationship_pattern",
+                        confidence=confidence,
+                        position=m.start(),
+                    )
+
+                    if category not in result.pattern_matches:
+                        result.pattern_matches[category] = []
+                    result.pattern_matches[category].append(match_obj)
 
     def _extract_quantitative(self, result: FullTextAnalysis, text: str):
         """Extract fold changes, p-values, sample sizes."""
@@ -445,7 +464,7 @@ class FullTextAnalyzer:
 
         gene_lower = gene.lower()
         pos_lower = position.lower()
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
 
         for sentence in sentences:
             sent_lower = sentence.lower()
@@ -48,6 +48,51 @@ class FunctionalImpactResult:
     key_findings: List[str] = field(default_factory=list)
 
 
+# System prompt: role, signaling focus and the impact response schema
+_IMPACT_SYSTEM_PROMPT = """You are an expert in PTM functional biology and cell signaling. Output valid JSON only.
+
+IMPORTANT: Focus on CELL SIGNALING biological meaning. Do not just describe the PTM itself.
+Explain what this PTM change means for the signaling network, downstream effects, and biological outcomes.
+
+Return a JSON object:
+{
+  "activityImpact": {
+    "affected": true/false,
+    "direction": "activation|inhibition|modulation",
+    "mechanism": "...",
+    "magnitude": "strong|moderate|mild",
+    "evidence": "..."
+  },
+  "interactionChanges": [
+    {"partner": "...", "effect": "enhanced|reduced|abolished|created", "mechanism": "...", "functionalOutcome": "..."}
+  ],
+  "localizationChanges": {
+    "changed": true/false, "from": "...", "to": "...", "mechanism": "...", "functionalImpact": "..."
+  },
+  "stabilityImpact": {
+    "affected": true/false, "direction": "stabilized|destabilized", "mechanism": "...", "halfLifeChange": "..."
+  },
+  "signalingInterpretation": "2-3 sentence interpretation of what this PTM change means for cell signaling",
+  "pathwayEffects": [
+    {"pathway": "...", "effect": "activation|inhibition|modulation", "mechanism": "...", "biologicalOutcome": "..."}
+  ],
+  "biologicalProcesses": [
+    {"process": "...", "impact": "...", "mechanism": "..."}
+  ],
+  "contextSpecificEffects": [
+    {"context": "...", "effect": "...", "significance": "..."}
+  ],
+  "therapeuticImplications": [
+    {"target": "...", "approach": "...", "rationale": "..."}
+  ],
+  "overallConfidence": "high|medium|low",
+  "evidenceSummary": "brief summary of evidence quality",
+  "keyFindings": ["3-5 most important findings about functional impact"]
+}
+
+Output JSON only, no markdown code blocks."""
+
+
 def _build_impact_prompt(
     gene: str,
     position: str,
@@ -118,46 +163,7 @@ OBSERVATION:
 
 {evidence_text}
 
-IMPORTANT: Focus on CELL SIGNALING biological meaning. Do not just describe the PTM itself.
-Explain what this PTM change means for the signaling network, downstream effects, and biological outcomes.
-
-Return a JSON object:
-{{
-  "activityImpact": {{
-    "affected": true/false,
-    "direction": "activation|inhibition|modulation",
-    "mechanism": "...",
-    "magnitude": "strong|moderate|mild",
-    "evidence": "..."
-  }},
-  "interactionChanges": [
-    {{"partner": "...", "effect": "enhanced|reduced|abolished|created", "mechanism": "...", "functionalOutcome": "..."}}
-  ],
-  "localizationChanges": {{
-    "changed": true/false, "from": "...", "to": "...", "mechanism": "...", "functionalImpact": "..."
-  }},
-  "stabilityImpact": {{
-    "affected": true/false, "direction": "stabilized|destabilized", "mechanism": "...", "halfLifeChange": "..."
-  }},
-  "signalingInterpretation": "2-3 sentence interpretation of what this PTM change means for cell signaling",
-  "pathwayEffects": [
-    {{"pathway": "...", "effect": "activation|inhibition|modulation", "mechanism": "...", "biologicalOutcome": "..."}}
-  ],
-  "biologicalProcesses": [
-    {{"process": "...", "impact": "...", "mechanism": "..."}}
-  ],
-  "contextSpecificEffects": [
-    {{"context": "...", "effect": "...", "significance": "..."}}
-  ],
-  "therapeuticImplications": [
-    {{"target": "...", "approach": "...", "rationale": "..."}}
-  ],
-  "overallConfidence": "high|medium|low",
-  "evidenceSummary": "brief summary of evidence quality",
-  "keyFindings": ["3-5 most important findings about functional impact"]
-}}
-
-Output JSON only, no markdown code blocks."""
+Return a JSON object in the format given in the system prompt."""
 
 
 class LLMFunctionalImpact:
@@ -198,7 +204,7 @@ class LLMFunctionalImpact:
         try:
             response = self.llm.generate(
                 prompt=prompt,
-                system_prompt="You are an expert in PTM functional biology and cell signaling. Output valid JSON only.",
+                system_prompt=_IMPACT_SYSTEM_PROMPT,
                 temperature=0.4,
                 max_tokens=3000,
             )
@@ -45,6 +45,32 @@ class KinasePredictionResult:
     alternative_regulators: List[str] = field(default_factory=list)
 
 
+# System prompt: role plus the predictedKinases response schema
+_KINASE_SYSTEM_PROMPT = """You are an expert in kinase-substrate relationships and PTM biology. Output valid JSON only.
+
+Return a JSON object:
+{
+  "predictedKinases": [
+    {
+      "kinase": "name",
+      "confidence": "high|medium|low",
+      "evidenceType": "direct|indirect|predicted|computational",
+      "mechanism": "brief mechanism description",
+      "evidenceSources": ["PMID:xxx", "KEA3", ...],
+      "consensusMotif": "if applicable",
+      "knownSubstrates": ["other known substrates"],
+      "biologicalContext": "when/where this regulation occurs",
+      "score": 0.0-1.0
+    }
+  ],
+  "signalingContext": "overall signaling context description",
+  "predictionRationale": "reasoning for the predictions",
+  "alternativeRegulators": ["other possible regulators"]
+}
+
+Output JSON only, no markdown code blocks."""
+
+
 def _build_kinase_prompt(
     gene: str,
     position: str,
@@ -113,27 +139,7 @@ TASK: Predict the most likely {regulator_type}(s) responsible for the {ptm_type}
 Based on the evidence above, predict the top {regulator_type}(s) for {gene} {position}.
 Consider: known {regulator_type} examples include {regulator_examples}.
 
-Return a JSON object:
-{{
-  "predictedKinases": [
-    {{
-      "kinase": "name",
-      "confidence": "high|medium|low",
-      "evidenceType": "direct|indirect|predicted|computational",
-      "mechanism": "brief mechanism description",
-      "evidenceSources": ["PMID:xxx", "KEA3", ...],
-      "consensusMotif": "if applicable",
-      "knownSubstrates": ["other known substrates"],
-      "biologicalContext": "when/where this regulation occurs",
-      "score": 0.0-1.0
-    }}
-  ],
-  "signalingContext": "overall signaling context description",
-  "predictionRationale": "reasoning for the predictions",
-  "alternativeRegulators": ["other possible regulators"]
-}}
-
-Output JSON only, no markdown code blocks."""
+Return a JSON object in the format given in the system prompt."""
 
 
 class LLMKinasePredictor:
@@ -175,7 +181,7 @@ class LLMKinasePredictor:
         try:
             response = self.llm.generate(
                 prompt=prompt,
-                system_prompt="You are an expert in kinase-substrate relationships and PTM biology. Output valid JSON only.",
+                system_prompt=_KINASE_SYSTEM_PROMPT,
                 temperature=0.3,
                 max_tokens=2000,
             )
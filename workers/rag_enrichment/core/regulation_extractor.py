@@ -41,6 +41,14 @@ REGULATION_PATTERNS = {
     ],
 }
 
+# Compiled once: (category, pattern) in REGULATION_PATTERNS order
+_COMPILED_REGULATION_PATTERNS = [
+    (category, re.compile(pattern_tuple[0], re.IGNORECASE))
+    for category, patterns in REGULATION_PATTERNS.items()
+    for pattern_tuple in patterns
+]
+SENTENCE_SPLIT_PATTERN = re.compile(r"[.!?]\s+")
+
 DISEASE_KEYWORDS = {
     "cancer": ["cancer", "carcinoma", "tumor", "tumour", "neoplasm", "malignant", "oncogenic", "leukemia", "lymphoma", "melanoma", "sarcoma", "glioma", "glioblastoma"],
     "cardiovascular": ["cardiac", "heart", "cardiovascular", "atherosclerosis", "hypertension", "cardiomyopathy", "ischemia", "arrhythmia"],
@@ -120,33 +128,30 @@ class RegulationExtractor:
 
     def _extract_regulation(self, text: str, gene: str) -> List[dict]:
         results = []
-        sentences = re.split(r"[.!?]\s+", text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         gene_lower = gene.lower()
 
         for sentence in sentences:
             if gene_lower not in sentence.lower():
                 continue
 
-            for category, patterns in REGULATION_PATTERNS.items():
-                for pattern_tuple in patterns:
-                    pattern = pattern_tuple[0]
-                    for m in re.finditer(pattern, sentence, re.IGNORECASE):
-                        groups = m.groups()
-                        if len(groups) >= 2:
-                            role1, role2 = pattern_tuple[1], pattern_tuple[2]
-                            results.append({
-                                "type": category,
-                                "regulator": groups[0],
-                                "target": groups[1],
-                                "sentence": sentence.strip()[:300],
-                            })
-                        elif len(groups) == 1:
-                            results.append({
-                                "type": category,
-                                "regulator": groups[0],
-                                "target": gene,
-                                "sentence": sentence.strip()[:300],
-                            })
+            for category, pattern in _COMPILED_REGULATION_PATTERNS:
+                for m in pattern.finditer(sentence):
+                    groups = m.groups()
+                    if len(groups) >= 2:
+                        results.append({
+                            "type": category,
+                            "regulator": groups[0],
+                            "target": groups[1],
+                            "sentence": sentence.strip()[:300],
+                        })
+                    elif len(groups) == 1:
+                        results.append({
+                            "type": category,
+                            "regulator": groups[0],
+                            "target": gene,
+                            "sentence": sentence.strip()[:300],
+                        })
         return results
 
     def _extract_diseases(self, text: str) -> List[str]:
@@ -27,6 +27,8 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from common.enrichment_data import abstract_analyses, recent_findings
+
 logger = logging.getLogger(__name__)
 
 
@@ -668,12 +670,11 @@ class ComprehensiveReportGenerator:
     # ------------------------------------------------------------------
 
     def _generate_antibody_validation(self, gene: str, enr: dict) -> str:
-        # Extract from fulltext_analysis or abstract_analysis
+        # Antibody details come from full-text analysis; abstract analyses don't extract them
         fulltext = enr.get("fulltext_analysis", {})
-        abstract = enr.get("abstract_analysis", {})
 
-        antibody_info = fulltext.get("antibody_info", []) or abstract.get("antibody_info", [])
-        wb_detected = fulltext.get("western_blot_detected", False) or abstract.get("western_blot_detected", False)
+        antibody_info = fulltext.get("antibody_info", [])
+        wb_detected = fulltext.get("western_blot_detected", False)
 
         if not antibody_info and not wb_detected:
             return ""
@@ -802,7 +803,7 @@ class ComprehensiveReportGenerator:
     # ------------------------------------------------------------------
 
     def _generate_literature_evidence(self, enr: dict) -> str:
-        findings = enr.get("recent_findings", [])
+        findings = recent_findings(enr)
         if not findings:
             # Still show classification-based interpretation even without literature
             classification = enr.get("classification", {})
@@ -870,7 +871,7 @@ class ComprehensiveReportGenerator:
         journal = article.get("journal", "")
         pub_date = article.get("pub_date", "")
         score = article.get("relevance_score", 0)
-        excerpt = _clean_text(article.get("abstract_excerpt") or article.get("abstract", ""))
+        excerpt = _clean_text(article.get("abstract_excerpt") or (article.get("abstract") or "")[:300])
 
         self.citation_counter += 1
         self.citations.append({
@@ -904,23 +905,24 @@ class ComprehensiveReportGenerator:
         lines.append(f"The {mod_noun} at {gene} {position} is classified as **{class_level}**.\n")
         lines.append(f"{interp}\n")
 
-        # Abstract analysis (LLM) results
-        abstract_analysis = enr.get("abstract_analysis", {})
-        if abstract_analysis:
-            mechanism = abstract_analysis.get("mechanism_summary", "")
-            if mechanism:
-                lines.append(f"**Mechanism Summary** (from literature analysis):\n{mechanism}\n")
-
-            context_relevance = abstract_analysis.get("context_relevance", "")
-            if context_relevance:
-                lines.append(f"**Context Relevance**: {context_relevance}\n")
+        # Abstract analysis (LLM) results, most relevant articles first
+        key_findings = [
+            (a.get("pmid", ""), _safe_str(finding))
+            for a in abstract_analyses(enr)
+            for finding in (a.get("key_findings") or [])
+        ]
+        if key_findings:
+            lines.append("**Key Findings** (from literature analysis):\n")
+            for pmid, finding in key_findings[:5]:
+                lines.append(f"- {finding} (PMID: {pmid})" if pmid else f"- {finding}")
+            lines.append("")
 
         # Functional impact (LLM) summary
         fi = enr.get("functional_impact", {})
         if fi:
-            impact_summary = fi.get("impact_summary", "")
-            if impact_summary:
-                lines.append(f"**Functional Impact**: {impact_summary}\n")
+            interpretation = fi.get("signaling_interpretation", "")
+            if interpretation:
+                lines.append(f"**Functional Impact**: {interpretation}\n")
 
         # Disease associations
         diseases = enr.get("diseases", [])
@@ -1094,7 +1096,7 @@ class ComprehensiveReportGenerator:
     # ------------------------------------------------------------------
 
     def _generate_recent_findings(self, gene: str, enr: dict) -> str:
-        findings = enr.get("recent_findings", [])
+        findings = recent_findings(enr)
         if not findings:
             return ""
 
@@ -1133,8 +1135,12 @@ class ComprehensiveReportGenerator:
 
     def _generate_clinical_relevance(self, gene: str, enr: dict) -> str:
         diseases = enr.get("diseases", [])
-        fi = enr.get("functional_impact", {})
-        clinical_notes = fi.get("clinical_relevance", "")
+        clinical_notes = [
+            f"{d.get('disease', '?')}: {d.get('role', '')} (PMID: {a.get('pmid', '?')})"
+            for a in abstract_analyses(enr)
+            for d in (a.get("disease_relevance") or [])
+            if isinstance(d, dict) and d.get("disease")
+        ]
 
         if not diseases and not clinical_notes:
             return ""
@@ -1148,7 +1154,10 @@ class ComprehensiveReportGenerator:
             lines.append("")
 
         if clinical_notes:
-            lines.append(f"**Clinical Notes**: {clinical_notes}\n")
+            lines.append("**Disease Relevance in Literature**:\n")
+            for note in clinical_notes[:5]:
+                lines.append(f"- {note}")
+            lines.append("")
 
         return "\n".join(lines)
 
@@ -1186,9 +1195,13 @@ class ComprehensiveReportGenerator:
 
     def _generate_drug_repositioning(self, gene: str, enr: dict) -> str:
         fi = enr.get("functional_impact", {})
-        drugs = fi.get("drug_targets", [])
-        abstract = enr.get("abstract_analysis", {})
-        drug_mentions = abstract.get("drug_mentions", [])
+        drugs = fi.get("therapeutic_implications") or []
+        drug_mentions = [
+            f"{d['therapeuticImplication']} (PMID: {a.get('pmid', '?')})"
+            for a in abstract_analyses(enr)
+            for d in (a.get("disease_relevance") or [])
+            if isinstance(d, dict) and d.get("therapeuticImplication")
+        ]
 
         if not drugs and not drug_mentions:
             return ""
@@ -1199,18 +1212,18 @@ class ComprehensiveReportGenerator:
             lines.append(f"Potential drug targets related to **{gene}**:\n")
             for drug in drugs[:5]:
                 if isinstance(drug, dict):
-                    name = drug.get("name", "?")
-                    mechanism = drug.get("mechanism", "")
-                    status = drug.get("status", "")
-                    lines.append(f"- **{name}**: {mechanism}")
-                    if status:
-                        lines.append(f"  - Status: {status}")
+                    target = drug.get("target", "?")
+                    approach = drug.get("approach", "")
+                    rationale = drug.get("rationale", "")
+                    lines.append(f"- **{target}**: {approach}")
+                    if rationale:
+                        lines.append(f"  - Rationale: {rationale}")
                 else:
                     lines.append(f"- {drug}")
             lines.append("")
 
         if drug_mentions:
-            lines.append("**Drug Mentions in Literature**:\n")
+            lines.append("**Therapeutic Implications in Literature**:\n")
             for dm in drug_mentions[:5]:
                 lines.append(f"- {dm}")
             lines.append("")
@@ -1228,9 +1241,9 @@ class ComprehensiveReportGenerator:
 
         lines = ["### Kinase / Regulator Prediction\n"]
 
-        predicted = kp.get("predicted_kinases", kp.get("predicted_regulators", []))
-        confidence = kp.get("confidence", "")
-        reasoning = kp.get("reasoning", "")
+        predicted = kp.get("predicted_kinases", [])
+        signaling_context = kp.get("signaling_context", "")
+        reasoning = kp.get("prediction_rationale", "")
 
         terms = get_regulator_terms(ptm_type)
 
@@ -1238,18 +1251,22 @@ class ComprehensiveReportGenerator:
             lines.append(f"**Predicted {terms['activator_plural'].title()}** for {gene} {position}:\n")
             for k in predicted[:5]:
                 if isinstance(k, dict):
-                    name = k.get("name", "?")
+                    name = k.get("kinase") or "?"
+                    confidence = k.get("confidence", "")
                     score = k.get("score", "")
-                    evidence = k.get("evidence", "")
-                    lines.append(f"- **{name}** (score: {score})")
-                    if evidence:
-                        lines.append(f"  - Evidence: {evidence}")
+                    mechanism = k.get("mechanism", "")
+                    sources = k.get("evidence_sources") or []
+                    lines.append(f"- **{name}** (confidence: {confidence}, score: {score})")
+                    if mechanism:
+                        lines.append(f"  - Mechanism: {mechanism}")
+                    if sources:
+                        lines.append(f"  - Evidence: {_safe_join(', ', sources)}")
                 else:
                     lines.append(f"- **{k}**")
             lines.append("")
 
-        if confidence:
-            lines.append(f"**Prediction Confidence**: {confidence}\n")
+        if signaling_context:
+            lines.append(f"**Signaling Context**: {signaling_context}\n")
 
         if reasoning:
             lines.append(f"**Reasoning**: {reasoning}\n")
@@ -1267,17 +1284,34 @@ class ComprehensiveReportGenerator:
 
         lines = ["### Functional Impact Analysis\n"]
 
-        impact_summary = fi.get("impact_summary", "")
-        structural_effect = fi.get("structural_effect", "")
-        signaling_effect = fi.get("signaling_effect", "")
-        confidence = fi.get("confidence", "")
-
-        if impact_summary:
-            lines.append(f"**Impact Summary**: {impact_summary}\n")
-        if structural_effect:
-            lines.append(f"**Structural Effect**: {structural_effect}\n")
-        if signaling_effect:
-            lines.append(f"**Signaling Effect**: {signaling_effect}\n")
+        interpretation = fi.get("signaling_interpretation", "")
+        activity = fi.get("activity_impact") or {}
+        localization = fi.get("localization_changes") or {}
+        stability = fi.get("stability_impact") or {}
+        pathway_effects = fi.get("pathway_effects") or []
+        confidence = fi.get("overall_confidence", "")
+
+        if interpretation:
+            lines.append(f"**Signaling Interpretation**: {interpretation}\n")
+        if activity.get("affected"):
+            magnitude = f" ({activity['magnitude']})" if activity.get("magnitude") else ""
+            lines.append(f"**Activity**: {activity.get('direction', '?')}{magnitude} — {activity.get('mechanism', '')}\n")
+        if localization.get("changed"):
+            lines.append(
+                f"**Localization**: {localization.get('from', '?')} → {localization.get('to', '?')}"
+                f" — {localization.get('mechanism', '')}\n"
+            )
+        if stability.get("affected"):
+            lines.append(f"**Stability**: {stability.get('direction', '?')} — {stability.get('mechanism', '')}\n")
+        if pathway_effects:
+            lines.append("**Pathway Effects**:\n")
+            for pe in pathway_effects[:5]:
+                if isinstance(pe, dict):
+                    outcome = f" — {pe['biologicalOutcome']}" if pe.get("biologicalOutcome") else ""
+                    lines.append(f"- {pe.get('pathway', '?')}: {pe.get('effect', '?')}{outcome}")
+                else:
+                    lines.append(f"- {pe}")
+            lines.append("")
         if confidence:
             lines.append(f"**Analysis Confidence**: {confidence}\n")
 
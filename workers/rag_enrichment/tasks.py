@@ -8,7 +8,6 @@ Takes preprocessing TSV output and enriches each PTM site with:
   4. Comprehensive MD report generation
 """
 
-import json
 import logging
 import os
 import time
@@ -19,6 +18,7 @@ import pandas as pd
 
 from celery_app import app
 from common.db_update import get_order_status, update_order_status
+from common.json_io import write_json
 from common.mcp_client import MCPClient
 from common.progress import publish_progress
 
@@ -146,8 +146,8 @@ def run_rag_enrichment(self, order_id: int, config: dict):
 
         # Save enriched data as JSON
         enriched_json_path = order_output / f"enriched_ptm_data{file_suffix}.json"
-        with open(enriched_json_path, "w", encoding="utf-8") as f:
-            json.dump(enriched_ptms, f, indent=2, default=str)
+        # NaN/Infinity (from the vector TSV) are written as null
+        write_json(enriched_ptms, enriched_json_path)
         logger.info(f"[Order {order_id}] Saved enriched data: {enriched_json_path.name}")
 
         publish_progress(order_id, "rag_enrichment", "enrichment", "completed", 70, "Literature enrichment complete")
@@ -3,7 +3,6 @@ Context Loader Node — loads enriched PTM data, MD reports, and TSV files.
 Parses input data and prepares it for downstream graph nodes.
 """
 
-import json
 import logging
 import re
 from pathlib import Path
@@ -11,6 +10,8 @@ from typing import List
 
 import pandas as pd
 
+from common.json_io import read_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,8 +28,7 @@ def run_context_loader(state: dict) -> dict:
     if not enriched_data:
         enriched_path = state.get("enriched_json_path")
         if enriched_path and Path(enriched_path).exists():
-            with open(enriched_path, "r") as f:
-                enriched_data = json.load(f)
+            enriched_data = read_json(enriched_path)
             logger.info(f"Loaded {len(enriched_data)} enriched PTMs from {enriched_path}")
 
     # Parse PTMs into structured format
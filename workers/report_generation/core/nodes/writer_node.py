@@ -7,8 +7,9 @@ Each section uses LLM with published literature context for integration.
 """
 
 import logging
-from typing import Dict, List
+from typing import Dict
 
+from common.enrichment_data import recent_findings
 from common.llm_client import LLMClient
 from report_generation.core.rag_retriever import RAGRetriever
 
@@ -341,7 +342,7 @@ def _collect_all_references(ptms: list) -> list:
     refs = []
     for ptm in ptms:
         enr = ptm.get("rag_enrichment", {})
-        for finding in enr.get("recent_findings", []):
+        for finding in recent_findings(enr):
             pmid = finding.get("pmid", "")
             if pmid and pmid not in seen_pmids:
                 seen_pmids.add(pmid)
@@ -350,7 +351,7 @@ def _collect_all_references(ptms: list) -> list:
                     "title": finding.get("title", ""),
                     "journal": finding.get("journal", ""),
                     "pub_date": finding.get("pub_date", ""),
-                    "abstract_excerpt": finding.get("abstract_excerpt", "")[:400],
+                    "abstract_excerpt": (finding.get("abstract_excerpt") or finding.get("abstract") or "")[:300],
                     "relevance_score": finding.get("relevance_score", 0),
                     "gene": ptm.get("gene", ""),
                 })
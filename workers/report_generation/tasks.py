@@ -11,7 +11,6 @@ Uses LangGraph StateGraph to orchestrate:
   7. Final report editing and compilation
 """
 
-import json
 import logging
 import os
 import time
@@ -20,6 +19,7 @@ from pathlib import Path
 
 from celery_app import app
 from common.db_update import update_order_status
+from common.json_io import read_json
 from common.progress import publish_progress
 
 logger = logging.getLogger("ptm-workers.report-generation")
@@ -108,8 +108,7 @@ def run_report_generation(self, order_id: int, config: dict):
                 raise FileNotFoundError(f"No enriched PTM JSON found in {rag_dir}")
 
         # Load enriched data
-        with open(enriched_path, "r") as f:
-            enriched_data = json.load(f)
+        enriched_data = read_json(enriched_path)
         logger.info(f"[Order {order_id}] Loaded {len(enriched_data)} enriched PTMs from {enriched_path}")
 
         # Build initial state